@@ -0,0 +1 @@
+"""Benchmarks of page-object hot paths."""
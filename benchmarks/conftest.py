@@ -0,0 +1,229 @@
+"""Benchmark fixtures: local stand-in app, page objects bound to it and the timing harness.
+
+Run with ``pytest benchmarks``. Every benchmark reports median/p95 latency and the
+number of WebDriver commands per round, and is compared against ``baseline.json`` once
+a baseline has been stored with ``--bench-save-baseline``.
+Benchmarks that request ``fake_driver`` run on ``FakeWebDriver``, and those that request
+no driver at all measure pure Python code; neither needs a browser.
+"""
+
+import json
+import statistics
+import threading
+import time
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import pytest
+
+from pages.menu_page import MenuPage
+from utilities.fake_webdriver import FakeWebDriver
+from utilities.fake_webdriver.fake_app import APP_HTML, FakeCoffeeCart
+from utilities.webdriver_metrics import get_command_counter
+
+APP_DIR = Path(__file__).parent / "app"
+BASELINE_FILE = Path(__file__).parent / "baseline.json"
+
+_results: Dict[str, "BenchResult"] = {}
+
+
+def pytest_addoption(parser):
+    """Add benchmark command line options."""
+    group = parser.getgroup("benchmarks")
+    group.addoption("--bench-rounds", type=int, default=20, help="rounds per benchmark (default: 20)")
+    group.addoption(
+        "--bench-tolerance",
+        type=float,
+        default=0.25,
+        help="allowed relative slowdown of the median against the baseline (default: 0.25)",
+    )
+    group.addoption(
+        "--bench-save-baseline", action="store_true", default=False, help="store this run as the benchmark baseline"
+    )
+    group.addoption(
+        "--bench-fake-latency-ms",
+        type=float,
+        default=0.0,
+        help="simulated duration of every FakeWebDriver command in milliseconds (default: 0)",
+    )
+
+
+class BenchResult:
+    """Timings and WebDriver command counts of one benchmark."""
+
+    def __init__(self, name: str) -> None:
+        """Initialize an empty result."""
+        self.name = name
+        self.timings: List[float] = []
+        self.commands: List[int] = []
+
+    @property
+    def median_ms(self) -> float:
+        """Return the median latency in milliseconds."""
+        return statistics.median(self.timings)
+
+    @property
+    def p95_ms(self) -> float:
+        """Return the 95th percentile latency in milliseconds."""
+        ordered = sorted(self.timings)
+        return ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))]
+
+    @property
+    def max_commands(self) -> int:
+        """Return the largest number of WebDriver commands issued by one round."""
+        return max(self.commands)
+
+    def as_dict(self) -> dict:
+        """Return the summary stored in the baseline file."""
+        return {
+            "median_ms": round(self.median_ms, 3),
+            "p95_ms": round(self.p95_ms, 3),
+            "commands": self.max_commands,
+        }
+
+
+class Bench:
+    """Run a page-object operation repeatedly and measure it."""
+
+    def __init__(self, name: str, driver, rounds: int) -> None:
+        """Initialize the harness.
+
+        Args:
+            name: Benchmark name, the test node name.
+            driver: WebDriver the measured operation uses, or None for pure Python benchmarks.
+            rounds: Number of measured rounds.
+        """
+        self.result = BenchResult(name)
+        self.counter = get_command_counter(driver) if driver is not None else None
+        self.rounds = rounds
+
+    def __call__(self, func: Callable, setup: Optional[Callable] = None) -> BenchResult:
+        """Measure ``func`` for the configured number of rounds.
+
+        Args:
+            func: Operation to measure. Called with the value returned by ``setup``, if any.
+            setup: Unmeasured preparation run before every round.
+
+        Returns:
+            BenchResult: Collected measurements.
+        """
+        for _ in range(self.rounds):
+            args = () if setup is None else (setup(),)
+            commands_before = self.counter.total if self.counter else 0
+            start = time.perf_counter()
+            func(*args)
+            self.result.timings.append((time.perf_counter() - start) * 1000)
+            self.result.commands.append(self.counter.total - commands_before if self.counter else 0)
+        return self.result
+
+
+class _AppRequestHandler(SimpleHTTPRequestHandler):
+    """Serve the stand-in app, falling back to index.html for client-side routes."""
+
+    def __init__(self, *args, **kwargs):
+        """Serve files from the app directory."""
+        super().__init__(*args, directory=str(APP_DIR), **kwargs)
+
+    def send_head(self):
+        """Rewrite unknown paths to the single page."""
+        if not (APP_DIR / self.path.split("?")[0].lstrip("/")).is_file():
+            self.path = "/index.html"
+        return super().send_head()
+
+    def log_message(self, format, *args):
+        """Keep the benchmark output quiet."""
+
+
+def _load_baseline() -> dict:
+    """Return stored benchmark results keyed by benchmark name."""
+    if BASELINE_FILE.exists():
+        return json.loads(BASELINE_FILE.read_text(encoding="utf-8"))
+    return {}
+
+
+@pytest.fixture(scope="session")
+def app_url():
+    """Serve the stand-in coffee-cart app on a free local port and return its URL."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _AppRequestHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/"
+    server.shutdown()
+
+
+@pytest.fixture()
+def bench_menu_page(driver, app_url):
+    """Return the MenuPage object of a freshly loaded stand-in app."""
+    driver.get(app_url)
+    return MenuPage.opened(driver)
+
+
+@pytest.fixture()
+def fake_driver(request):
+    """Return a FakeWebDriver serving the stand-in app with its cart modelled in Python."""
+    driver = FakeWebDriver(APP_HTML, "http://coffee-cart.local/", request.config.getoption("--bench-fake-latency-ms"))
+    FakeCoffeeCart(driver)
+    return driver
+
+
+@pytest.fixture()
+def fake_menu_page(fake_driver):
+    """Return the MenuPage object bound to the fake driver."""
+    return MenuPage(fake_driver)
+
+
+@pytest.fixture()
+def bench(request):
+    """Return the benchmark harness and compare its result against the baseline.
+
+    The harness counts commands of ``fake_driver`` when the benchmark uses it, of the
+    browser ``driver`` when it uses that, and none for pure Python benchmarks.
+    """
+    name = next((name for name in ("fake_driver", "driver") if name in request.fixturenames), None)
+    driver = request.getfixturevalue(name) if name else None
+    harness = Bench(request.node.name, driver, request.config.getoption("--bench-rounds"))
+    yield harness
+
+    result = harness.result
+    if not result.timings:
+        return
+    _results[result.name] = result
+    baseline = _load_baseline().get(result.name)
+    if baseline is None or request.config.getoption("--bench-save-baseline"):
+        return
+
+    tolerance = request.config.getoption("--bench-tolerance")
+    if result.max_commands > baseline["commands"]:
+        pytest.fail(f"{result.name}: {result.max_commands} WebDriver commands, baseline {baseline['commands']}")
+    if result.median_ms > baseline["median_ms"] * (1 + tolerance):
+        pytest.fail(f"{result.name}: median {result.median_ms:.1f} ms, baseline {baseline['median_ms']:.1f} ms")
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Print the benchmark table."""
+    if not _results:
+        return
+    baseline = _load_baseline()
+    terminalreporter.section("benchmarks")
+    terminalreporter.write_line(f"{'name':<40} {'median ms':>10} {'p95 ms':>10} {'commands':>9} {'baseline ms':>12}")
+    for name, result in _results.items():
+        stored = baseline.get(name, {}).get("median_ms")
+        stored_text = f"{stored:.3f}" if stored is not None else "-"
+        terminalreporter.write_line(
+            f"{name:<40} {result.median_ms:>10.3f} {result.p95_ms:>10.3f} {result.max_commands:>9} {stored_text:>12}"
+        )
+    missing = [name for name in _results if name not in baseline]
+    if missing and not terminalreporter.config.getoption("--bench-save-baseline"):
+        terminalreporter.write_line(
+            f"{len(missing)} benchmarks have no baseline and were not compared; "
+            "store one on this machine with --bench-save-baseline"
+        )
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Store the results as the new baseline when requested."""
+    if _results and session.config.getoption("--bench-save-baseline"):
+        baseline = _load_baseline()
+        baseline.update({name: result.as_dict() for name, result in _results.items()})
+        BASELINE_FILE.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n", encoding="utf-8")
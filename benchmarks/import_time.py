@@ -0,0 +1,121 @@
+"""Measure the import time of the page objects and the test collection time.
+
+``import_times`` runs ``python -X importtime`` in a fresh interpreter and returns
+the self and cumulative time of every imported module, so a page that starts
+pulling in a heavy dependency shows up by name. From the command line it prints
+the import time per top-level package and, with ``--collect``, the time of
+``pytest --collect-only``::
+
+    python -m benchmarks.import_time pages.menu_page --top 15 --collect --json import_time.json
+"""
+
+import argparse
+import json
+import re
+import statistics
+import subprocess
+import sys
+import time
+from collections import Counter
+from typing import Dict, NamedTuple, Optional, Sequence
+
+from config.resources import ROOT_DIR
+
+__all__ = ["ImportTime", "collect_time", "import_times", "main", "package_times"]
+
+_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)")
+
+
+class ImportTime(NamedTuple):
+    """Time spent importing one module, in microseconds."""
+
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def import_times(module: str) -> Dict[str, ImportTime]:
+    """Import a module in a fresh interpreter and return the import time of every module it loaded.
+
+    Args:
+        module: Dotted module path, e.g. ``pages.menu_page``.
+
+    Returns:
+        dict: Import times by module name, in import order; modules already loaded at startup are left out.
+    """
+    baseline = _run_importtime("pass")
+    times = _run_importtime(f"import {module}")
+    return {name: entry for name, entry in times.items() if name not in baseline}
+
+
+def _run_importtime(code: str) -> Dict[str, ImportTime]:
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], cwd=ROOT_DIR, capture_output=True, text=True, check=True
+    )
+    times = {}
+    for match in _LINE.finditer(completed.stderr):
+        self_us, cumulative_us, indent, name = match.groups()
+        times[name] = ImportTime(int(self_us), int(cumulative_us), len(indent) // 2)
+    return times
+
+
+def package_times(times: Dict[str, ImportTime]) -> Dict[str, int]:
+    """Return the cumulative import time per top-level package in microseconds, slowest first.
+
+    A module imported by another module of its own package counts as part of that one.
+    """
+    totals: Counter = Counter()
+    enclosing = []
+    # The output lists a module after its imports; reversed, every module follows the ones importing it.
+    for name, entry in reversed(list(times.items())):
+        while enclosing and enclosing[-1][0] >= entry.depth:
+            enclosing.pop()
+        package = name.split(".")[0]
+        if all(outer != package for _, outer in enclosing):
+            totals[package] += entry.cumulative_us
+        enclosing.append((entry.depth, package))
+    return dict(totals.most_common())
+
+
+def collect_time(*args: str) -> float:
+    """Return the wall time in seconds of ``pytest --collect-only`` in a fresh interpreter.
+
+    Args:
+        args: Extra pytest arguments, e.g. a test directory.
+    """
+    # No addopts: the configured --clean-alluredir would wipe the results of the calling run.
+    command = [sys.executable, "-m", "pytest", "--collect-only", "-q", "-o", "addopts=", *args]
+    start = time.perf_counter()
+    subprocess.run(command, cwd=ROOT_DIR, capture_output=True, check=True)
+    return time.perf_counter() - start
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Print the slowest imports of the given modules and, optionally, the collection time."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("modules", nargs="*", default=["pages.menu_page"], help="modules to import")
+    parser.add_argument("--top", type=int, default=10, help="number of slowest packages to print (default: 10)")
+    parser.add_argument("--collect", action="store_true", help="also time pytest --collect-only")
+    parser.add_argument("--rounds", type=int, default=5, help="collection rounds, the median is reported")
+    parser.add_argument("--json", metavar="PATH", help="also write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    report = {}
+    for module in args.modules:
+        times = import_times(module)
+        packages = dict(list(package_times(times).items())[: args.top])
+        report[module] = {"total_us": times[module].cumulative_us, "modules": len(times), "packages_us": packages}
+        print(f"{module}: {times[module].cumulative_us / 1000:.1f} ms, {len(times)} modules")
+        for package, cumulative_us in packages.items():
+            print(f"  {cumulative_us / 1000:>8.1f} ms  {package}")
+    if args.collect:
+        report["collect_only_s"] = round(statistics.median(collect_time() for _ in range(args.rounds)), 3)
+        print(f"pytest --collect-only: {report['collect_only_s']:.3f} s")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,36 @@
+"""Benchmarks of page-object imports and class lookups, no browser needed."""
+
+from benchmarks.import_time import collect_time, import_times
+from pages.registry import resolve
+
+CALLS = 1000
+
+
+def _local_import():
+    from pages.menu_page import MenuPage
+
+    return MenuPage
+
+
+def test_resolve_page_class(bench):
+    """Benchmark looking up a page class in the registry."""
+    bench(lambda: [resolve("MenuPage") for _ in range(CALLS)])
+
+
+def test_function_local_import(bench):
+    """Benchmark a function-local import of a page class, for comparison with the registry."""
+    bench(lambda: [_local_import() for _ in range(CALLS)])
+
+
+def test_import_menu_page(bench):
+    """Benchmark importing the menu page in a fresh interpreter; it must not pull in NumPy or Pillow."""
+    bench(lambda: import_times("pages.menu_page"))
+
+    imported = import_times("pages.menu_page")
+    assert "numpy" not in imported and "PIL" not in imported
+
+
+def test_collect_only(bench):
+    """Benchmark ``pytest --collect-only`` of the test suite in a fresh interpreter."""
+    bench.rounds = min(bench.rounds, 5)
+    bench(collect_time)
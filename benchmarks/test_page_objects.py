@@ -0,0 +1,65 @@
+"""Benchmarks of page-object hot paths against the local stand-in app."""
+
+from pages.cart_page import CartPage
+from pages.components.pay_component.pay_preview_component import PayPreviewComponent
+from pages.menu_page import MenuPage
+from test_data.users import valid_user
+
+CART = {"Espresso": 2, "Mocha": 1, "Americano": 1}
+
+
+def fill_cart(driver, app_url) -> MenuPage:
+    """Reload the app, add the benchmark cart and return the menu page."""
+    driver.get(app_url)
+    menu_page = MenuPage(driver)
+    menu_page.add_to_cart(CART)
+    return menu_page
+
+
+def test_menu_cups(bench, bench_menu_page):
+    """Benchmark building the cup components of the menu."""
+    bench(bench_menu_page.cups)
+
+
+def test_get_cup_by_name(bench, bench_menu_page):
+    """Benchmark looking up a cup by its name."""
+    bench(lambda: bench_menu_page.get_cup_by_name("Cafe Breve"))
+
+
+def test_cart_items(bench, bench_menu_page):
+    """Benchmark building the cart item components."""
+    bench_menu_page.add_to_cart(CART)
+    cart_page = bench_menu_page.go_to_cart_page()
+    bench(cart_page.items)
+
+
+def test_clear_cart(bench, bench_menu_page, driver, app_url):
+    """Benchmark removing every item from a filled cart."""
+
+    def setup() -> CartPage:
+        return fill_cart(driver, app_url).go_to_cart_page()
+
+    bench(CartPage.clear_cart, setup=setup)
+
+
+def test_add_cup_modal_dialog_styles(bench, bench_menu_page):
+    """Benchmark reading the computed styles of the add-cup dialog."""
+    add_cup_modal = bench_menu_page.get_cup_by_name("Espresso").open_add_cup_modal()
+    bench(add_cup_modal.get_dialog_styles)
+
+
+def test_pay_preview_items(bench, bench_menu_page, driver):
+    """Benchmark reading the items of the pay button preview."""
+    bench_menu_page.add_to_cart(CART)
+    bench_menu_page.pay().hover_on()
+    pay_preview = PayPreviewComponent(driver)
+    bench(pay_preview.get_items)
+
+
+def test_purchase_flow(bench, bench_menu_page, driver, app_url):
+    """Benchmark checking out a filled cart."""
+
+    def purchase(menu_page) -> None:
+        menu_page.click_pay_button().fill_credentials(valid_user).click_submit_successfully()
+
+    bench(purchase, setup=lambda: fill_cart(driver, app_url))
@@ -0,0 +1,55 @@
+"""Benchmarks of page-object Python overhead on FakeWebDriver, no browser needed."""
+
+from benchmarks.test_page_objects import CART
+from pages.cart_page import CartPage
+from pages.menu_page import MenuPage
+
+
+def test_fake_menu_page_construction(bench, fake_driver):
+    """Benchmark constructing MenuPage, including logger and locator setup."""
+    bench(lambda: MenuPage(fake_driver))
+
+
+def test_fake_menu_cups(bench, fake_menu_page):
+    """Benchmark building the cup components of the menu."""
+    bench(fake_menu_page.cups)
+
+
+def test_fake_get_cup_by_name(bench, fake_menu_page):
+    """Benchmark looking up a cup by its name."""
+    bench(lambda: fake_menu_page.get_cup_by_name("Cafe Breve"))
+
+
+def test_fake_cup_ingredients(bench, fake_menu_page):
+    """Benchmark parsing the ingredient heights of a cup."""
+    cup = fake_menu_page.get_cup_by_name("Mocha")
+    bench(lambda: [ingredient.get_height_percent(ingredient.parent) for ingredient in cup.get_ingredients()])
+
+
+def test_fake_cart_item_prices(bench, fake_menu_page):
+    """Benchmark parsing the prices of the cart items."""
+    fake_menu_page.add_to_cart(CART)
+    cart_page: CartPage = fake_menu_page.go_to_cart_page()
+    bench(lambda: [item.price for item in cart_page.items()])
+
+
+def test_fake_translate_names_with_handles(bench, fake_menu_page):
+    """Benchmark the translation flow: double-click and read every cup name through cup handles."""
+
+    def translate():
+        for cup in fake_menu_page.cup_handles():
+            cup.double_click_on_cup_name()
+            cup.get_name()
+
+    bench(translate)
+
+
+def test_fake_translate_all(bench, fake_menu_page):
+    """Benchmark translating every cup name in one in-page pass."""
+    bench(fake_menu_page.translate_all)
+
+
+def test_fake_chain_to_cart(bench, fake_driver):
+    """Benchmark clicking a cup, opening the cart and going back to the menu in one chain."""
+    menu_page = MenuPage.of(fake_driver)
+    bench(lambda: menu_page.click_on_cup_by_name("Espresso").go_to_cart_page().go_to_menu_page())
@@ -0,0 +1,22 @@
+"""Micro-benchmarks of the price, quantity and style parsers, no browser needed."""
+
+from utilities.parsing import parse_height_percent_all, parse_money_all, parse_unit_price_all
+
+PRICES = [f"${price}.00" for price in range(4, 24)] + ["Total: $1,234.50"]
+UNIT_PRICES = [f"${price}.00 x {quantity}" for price in range(4, 24) for quantity in (1, 2, 3)]
+STYLES = [f"height: {percent}%;" for percent in range(0, 101, 5)]
+
+
+def test_parse_prices(bench):
+    """Benchmark parsing the menu prices and a total."""
+    bench(lambda: parse_money_all(PRICES))
+
+
+def test_parse_unit_prices(bench):
+    """Benchmark parsing the unit price and quantity of cart rows."""
+    bench(lambda: parse_unit_price_all(UNIT_PRICES))
+
+
+def test_parse_ingredient_heights(bench):
+    """Benchmark parsing ingredient height styles."""
+    bench(lambda: parse_height_percent_all(STYLES))
@@ -1,11 +1,34 @@
 """Configuration for resource management."""
 import os
+from pathlib import Path
 
 from dotenv import load_dotenv
 
 load_dotenv()
 
+ROOT_DIR: Path = Path(__file__).resolve().parent.parent
 BASE_URL: str = os.getenv("BASE_URL")
 IMPLICIT_WAIT: int = int(os.getenv("IMPLICIT_WAIT", 0))
 DRIVER_VERSION: str = os.getenv("DRIVER_VERSION")
+DRIVER_MODE: str = os.getenv("DRIVER_MODE", "live")
+RECORDINGS_DIR: str = os.getenv("RECORDINGS_DIR", "test_data/recordings")
 
+ALLURE_STEP_MODE: str = os.getenv("ALLURE_STEP_MODE", "full")
+ALLURE_STEP_SAMPLE_RATE: int = int(os.getenv("ALLURE_STEP_SAMPLE_RATE", 10))
+FAILURE_ARTIFACTS_MAX_MB: int = int(os.getenv("FAILURE_ARTIFACTS_MAX_MB", 50))
+LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
+LOG_JSON_FILE: str = os.getenv("LOG_JSON_FILE", "")
+PERF_BUDGETS_FILE: str = os.getenv("PERF_BUDGETS_FILE", "test_data/perf_budgets.json")
+PERF_BUDGET_MODE: str = os.getenv("PERF_BUDGET_MODE", "fail")
+PERF_BUDGET_TIME_MODE: str = os.getenv("PERF_BUDGET_TIME_MODE", "warn")
+WAIT_TIMEOUT_MODE: str = os.getenv("WAIT_TIMEOUT_MODE", "adaptive")
+WEB_VITALS_FILE: str = os.getenv("WEB_VITALS_FILE", "")
+NETWORK_INTERCEPTION: str = os.getenv("NETWORK_INTERCEPTION", "on")
+NETWORK_BLOCK: str = os.getenv(
+    "NETWORK_BLOCK",
+    "*://fonts.googleapis.com/*,*://fonts.gstatic.com/*,*://www.googletagmanager.com/*,"
+    "*://www.google-analytics.com/*,*?ad=1*",
+)
+ASSET_CACHE_MAX_MB: int = int(os.getenv("ASSET_CACHE_MAX_MB", 200))
+VISUAL_BASELINES_DIR: str = os.getenv("VISUAL_BASELINES_DIR", "test_data/visual_baselines")
+VISUAL_WINDOW_SIZE: str = os.getenv("VISUAL_WINDOW_SIZE", "1280x900")
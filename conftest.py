@@ -1,21 +1,37 @@
-"""Pytest configuration file with Allure reporting and screenshot on failure."""
+"""Pytest configuration file with Allure reporting and failure artifacts."""
 
-import allure
 import pytest
-from allure_commons.types import AttachmentType
 
 from fixtures import *
+from utilities.failure_artifacts import failure_artifacts
+from utilities.reporting import step_recorder
+
+pytest_plugins = [
+    "plugins.perf_budget",
+    "plugins.driver_recording",
+    "plugins.test_impact",
+    "plugins.scheduler",
+    "plugins.wait_telemetry",
+    "plugins.web_vitals",
+    "plugins.network",
+    "plugins.visual",
+]
 
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     """
-    Attaches a screenshot to the Allure report on test failure.
+    Attaches failure artifacts to the Allure report on test failure.
+
+    Low-level steps buffered by ``utilities.reporting`` during the phase are
+    written to the report once, before the failure screenshot is taken.
 
     This is a pytest hook that wraps the test reporting process. It specifically
-    captures a screenshot if a test fails during the 'call' phase (when the test
-    function is executed). The screenshot is then attached to the test's Allure
-    report for debugging purposes.
+    captures a screenshot, a DOM snapshot and the browser console log if a test
+    fails during the 'call' phase (when the test function is executed). Only the
+    browser calls run here; writing the attachments to the test's Allure
+    report happens in a background thread, see
+    ``utilities.failure_artifacts``.
 
     The function attempts to locate the WebDriver instance by first checking for
     a 'driver' fixture in the test's function arguments and then by checking
@@ -31,6 +47,7 @@ def pytest_runtest_makereport(item, call):
     """
     outcome = yield
     rep = outcome.get_result()
+    step_recorder.flush()
 
     if rep.when == "call" and rep.failed:
         # Assuming 'driver' is available in the test item's fixture scope
@@ -44,10 +61,11 @@ def pytest_runtest_makereport(item, call):
             else:
                 return  # No driver found
 
-            allure.attach(
-                driver.get_screenshot_as_png(),
-                name=f"screenshot_on_failure_{item.name}",
-                attachment_type=AttachmentType.PNG,
-            )
+            failure_artifacts.capture(item, driver)
         except Exception as e:
-            print(f"Failed to take screenshot: {e}")
+            print(f"Failed to capture failure artifacts: {e}")
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Wait for failure artifacts queued during the run to be written."""
+    failure_artifacts.close()
@@ -10,19 +10,33 @@ from webdriver_manager.chrome import ChromeDriverManager
 from config.resources import BASE_URL, DRIVER_VERSION, IMPLICIT_WAIT
 from pages.cart_page import CartPage
 from pages.menu_page import MenuPage
+from utilities.driver_recording import ReplayWebDriver, driver_recorder
+from utilities.webdriver_metrics import CommandCounter
 
 __all__ = ["driver", "driver_menu_page", "driver_cart_page"]
 
 
 @pytest.fixture(scope="session")
 def driver():
-    """Fixture to initialize and quit the WebDriver instance."""
+    """Fixture to initialize and quit the WebDriver instance.
+
+    In ``replay`` driver mode no browser is started; commands are answered from the
+    per-test recordings, see ``utilities.driver_recording``.
+    """
+    if driver_recorder.mode == "replay":
+        driver = ReplayWebDriver(driver_recorder)
+        CommandCounter(driver)
+        yield driver
+        return
     with allure.step(f"Initialize WebDriver instance with ChromeDriver version {DRIVER_VERSION}"):
         service = Service(ChromeDriverManager(driver_version=DRIVER_VERSION).install())
         chrome_options = webdriver.ChromeOptions()
+        chrome_options.set_capability("goog:loggingPrefs", {"browser": "ALL"})
         driver = webdriver.Chrome(service=service, options=chrome_options)
         driver.implicitly_wait(IMPLICIT_WAIT)
         driver.maximize_window()
+        CommandCounter(driver)
+        driver_recorder.install(driver)
     yield driver
     with allure.step("Quit WebDriver instance"):
         driver.close()
@@ -35,7 +49,7 @@ def driver_menu_page(driver):
         pass
     driver.get(BASE_URL)
     time.sleep(0.1)  # wait for page to load
-    return MenuPage(driver)
+    return MenuPage.opened(driver)
 
 
 @pytest.fixture()
@@ -45,4 +59,4 @@ def driver_cart_page(driver):
         pass
     driver.get(BASE_URL)
     time.sleep(0.1)
-    return CartPage(driver)
+    return CartPage.opened(driver)
@@ -1,29 +1,73 @@
 """Base classes for page objects and components using Selenium WebDriver."""
 
-import re
-from typing import Dict, List, Optional, Tuple
+from collections import Counter
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar
 
-import allure
 from selenium.common import NoSuchElementException, TimeoutException
 from selenium.webdriver import ActionChains, Keys
 from selenium.webdriver.common.by import By, ByType
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
 
 from config.resources import IMPLICIT_WAIT
-from utilities.logger import Logger
-
-__all__ = ["BasePage", "BaseComponent", "LocatorType", "DictLocatorType"]
+from pages.registry import resolve
+from pages.scripts import AWAIT_ABSENCE, INSTALL_IDLE_TRACKER, SNAPSHOT_DOM, WAIT_FOR_IDLE
+from utilities.dom_diff import DomNode
+from utilities.logger import ClassLogger
+from utilities.parsing import parse_height_percent
+from utilities.reporting import step
+from utilities.wait_telemetry import wait_telemetry
+from utilities.web_vitals import web_vitals
+
+if TYPE_CHECKING:
+    from pages.cart_page import CartPage
+    from pages.components.header_component import HeaderComponent
+    from pages.githab_page import GitHubPage
+    from pages.menu_page import MenuPage
+
+__all__ = ["BasePage", "BaseComponent", "LocatorType", "DictLocatorType", "PageObjectCounter", "page_objects"]
 
 LocatorType = Tuple[ByType, str]
 DictLocatorType = Dict[str, LocatorType]
 
+ABSENCE_QUIET_MS = 250
+IDLE_QUIET_MS = 100
+SNAPSHOT_ATTRIBUTES = ("id", "class", "aria-label", "data-test", "href", "style", "disabled")
+SNAPSHOT_STYLES = ("display", "visibility", "color", "background-color")
+# W3C locator strategies the in-page scripts evaluate, see pages.scripts
+IN_PAGE_STRATEGIES = frozenset({"css selector", "xpath", "tag name", "link text", "partial link text"})
+
+P = TypeVar("P", bound="BasePage")
+
+
+class PageObjectCounter:
+    """Count page objects constructed and reused, by page class."""
+
+    def __init__(self) -> None:
+        """Initialize the counts."""
+        self.constructed: Counter = Counter()
+        self.reused: Counter = Counter()
+
+    @property
+    def avoided(self) -> int:
+        """Return the number of constructions avoided by reusing a page object."""
+        return sum(self.reused.values())
+
+    def reset(self) -> None:
+        """Reset all counts to zero."""
+        self.constructed.clear()
+        self.reused.clear()
+
+
+page_objects = PageObjectCounter()
+
 
 class Base:
     """Utility class for CSS style-related operations."""
 
+    logger = ClassLogger()
+
     def __init__(self, driver: WebDriver):
         """Initialize Base with a WebDriver instance.
 
@@ -31,7 +75,6 @@ class Base:
             driver: Selenium WebDriver instance.
         """
         self.driver = driver
-        self.logger = Logger.get_logger(self.__class__.__name__)
 
     def _get_computed_style(self, element: WebElement, property_name: str) -> str:
         """Get computed CSS style value for an element.
@@ -43,7 +86,7 @@ class Base:
         Returns:
             str: Computed style value
         """
-        self.logger.debug(f"Getting computed style: {property_name}")
+        self.logger.debug("Getting computed style: %s", property_name)
         script = "return window.getComputedStyle(arguments[0])[arguments[1]];"
         return self.driver.execute_script(script, element, property_name)
 
@@ -65,15 +108,12 @@ class Base:
         styles = {}
         for prop in properties:
             styles[prop] = self._get_computed_style(element, prop)
-        self.logger.debug(f"Styles retrieved: {styles}")
+        self.logger.debug("Styles retrieved: %s", styles)
         return styles
 
     def _parse_height(self, style: str) -> float:
-        """Extract the height percentage from a style string using regex."""
-        match = re.search(r"height:\s*(\d+(?:\.\d+)?)%", style)
-        if match:
-            return float(match.group(1))
-        return 0.0
+        """Extract the height percentage from a style string."""
+        return parse_height_percent(style)
 
     def get_height_percent(self, element: WebElement) -> float:
         """Return the height percentage of an element from its style."""
@@ -85,6 +125,128 @@ class Base:
         class_attr = element.get_attribute("class") or ""
         return class_attr.split()
 
+    def wait_until(
+        self, name: str, condition: Callable, timeout: float, may_miss: bool = False, target: Any = None
+    ) -> Any:
+        """Wait for a condition, recording the time of the named wait.
+
+        Args:
+            name: Wait name the timing telemetry is kept under, see ``utilities.wait_telemetry``.
+            condition: Expected condition, as for ``WebDriverWait.until``.
+            timeout: Fixed timeout in seconds.
+            may_miss: Pass True when the caller turns a timeout into a result; it is then not
+                reported as a flaky wait.
+            target: Driver or element passed to the condition, defaults to the driver.
+
+        Returns:
+            Any: The truthy value returned by the condition.
+
+        Raises:
+            TimeoutException: If the condition is not met in time.
+        """
+        return wait_telemetry.wait(self.driver if target is None else target, name, condition, timeout, may_miss)
+
+    def is_absent(
+        self, locator: LocatorType, timeout: float = 5, quiet_ms: int = ABSENCE_QUIET_MS, displayed: bool = True
+    ) -> bool:
+        """Return True if nothing matches the locator now and nothing appears while the page settles.
+
+        Evaluated in the page with a ``MutationObserver``: the check passes once the document
+        has gone ``quiet_ms`` without a mutation and still has no match, and fails as soon as
+        a match appears, so it takes about ``quiet_ms`` on an idle page instead of a full timeout.
+
+        Args:
+            locator: Tuple of (By, selector), searched in the whole document.
+            timeout: Upper bound in seconds for a page that keeps mutating.
+            quiet_ms: Time without DOM mutations after which the page counts as settled.
+            displayed: Ignore matching elements that are not displayed.
+
+        Returns:
+            bool: True if the element is absent.
+
+        Raises:
+            ValueError: If the locator strategy cannot be evaluated in the page.
+        """
+        using, value = self._in_page_locator(locator)
+        result = self.driver.execute_async_script(AWAIT_ABSENCE, using, value, displayed, quiet_ms, int(timeout * 1000))
+        self.logger.debug("Absence check %s: %s", locator, result)
+        return not result["present"]
+
+    def snapshot_dom(
+        self,
+        root_locator: LocatorType = (By.CSS_SELECTOR, "#app"),
+        attributes: Tuple[str, ...] = SNAPSHOT_ATTRIBUTES,
+        styles: Tuple[str, ...] = SNAPSHOT_STYLES,
+    ) -> DomNode:
+        """Return a pruned snapshot of a DOM subtree, taken with one script call.
+
+        Compare two snapshots with ``DomNode.diff`` to find out what an action changed,
+        see ``utilities.dom_diff``.
+
+        Args:
+            root_locator: Tuple of (By, selector) of the subtree root, searched in the whole document.
+            attributes: Attributes kept per element.
+            styles: Computed style properties kept per element.
+
+        Returns:
+            DomNode: Snapshot of the root element.
+
+        Raises:
+            NoSuchElementException: If nothing matches the root locator.
+            ValueError: If the locator strategy cannot be evaluated in the page.
+        """
+        using, value = self._in_page_locator(root_locator)
+        data = self.driver.execute_script(SNAPSHOT_DOM, using, value, list(attributes), list(styles))
+        if data is None:
+            raise NoSuchElementException(f"No DOM snapshot root: {root_locator}")
+        return DomNode.from_json(data)
+
+    def track_idle(self) -> None:
+        """Install the in-page idle tracker ahead of an action awaited with :meth:`wait_for_idle`.
+
+        Requests and animation frames started before the tracker exists are not counted,
+        so call this before the action, not after it.
+        """
+        self.driver.execute_script(INSTALL_IDLE_TRACKER)
+
+    def _in_page_locator(self, locator: LocatorType) -> Tuple[str, str]:
+        """Return the W3C strategy and value of a locator for the in-page scripts.
+
+        Raises:
+            ValueError: If the strategy is not one of ``IN_PAGE_STRATEGIES``.
+        """
+        using, value = self.driver.locator_converter.convert(*locator)
+        if using not in IN_PAGE_STRATEGIES:
+            raise ValueError(f"Locator strategy {locator[0]!r} cannot be evaluated in the page: {locator}")
+        return using, value
+
+    def wait_for_idle(self, timeout: float = 5, quiet_ms: int = IDLE_QUIET_MS) -> bool:
+        """Wait in the page until the app has finished reacting to the last action.
+
+        The app counts as idle when no fetch or XMLHttpRequest call and no animation frame
+        is pending, the document has gone ``quiet_ms`` without a mutation, and a Vue
+        ``nextTick`` and a macrotask have run. Call :meth:`track_idle` before the action;
+        otherwise the tracker is installed here and misses what the action already started.
+        Reaching the upper bound is logged as a warning.
+
+        Args:
+            timeout: Upper bound in seconds.
+            quiet_ms: Time without DOM mutations after which the page counts as settled.
+
+        Returns:
+            bool: True if the app became idle, False if the upper bound was reached.
+        """
+        result = self.driver.execute_async_script(WAIT_FOR_IDLE, quiet_ms, int(timeout * 1000))
+        self.logger.debug("Idle wait: %s", result)
+        if not result["idle"]:
+            self.logger.warning(
+                "App not idle after %s ms: %s requests and %s animation frames pending",
+                result["waitedMs"],
+                result["requests"],
+                result["frames"],
+            )
+        return result["idle"]
+
     def fill_input(self, element: WebElement, text: str) -> None:
         """Fill input field with reliable clearing."""
         element.click()
@@ -105,41 +267,65 @@ class BasePage(Base):
         Args:
             driver: Selenium WebDriver instance.
         """
-        from pages.components.header_component import HeaderComponent
-
         super().__init__(driver)
-        header_we = self.driver.find_element(By.CSS_SELECTOR, "#app > ul")
-        self._header: HeaderComponent = HeaderComponent(driver, header_we)
+        page_objects.constructed[type(self).__name__] += 1
 
-    def get_header(self) -> "HeaderComponent":  # noqa=F821
-        """Return the Header component."""
-        from pages.components.header_component import HeaderComponent
+    @classmethod
+    def of(cls: Type[P], driver: WebDriver) -> P:
+        """Return the page object of this class for a browser session, constructing it only once.
 
-        header_we = self.driver.find_element(By.CSS_SELECTOR, "#app > ul")
-        return HeaderComponent(self.driver, header_we)
+        Page objects hold nothing but the driver and bind to the DOM when an action
+        runs, so methods returning a page for chaining reuse one instance per session.
 
-    def go_to_menu_page(self) -> "MenuPage":  # noqa=F821
-        """Navigate to the Menu page and return its page object."""
-        self.get_header().click_menu()
-        from pages.menu_page import MenuPage
+        Args:
+            driver: Selenium WebDriver instance.
+        """
+        pages = getattr(driver, "bound_pages", None)
+        if pages is None:
+            pages = driver.bound_pages = {}
+        page = pages.get(cls)
+        if page is None:
+            page = pages[cls] = cls(driver)
+        else:
+            page_objects.reused[cls.__name__] += 1
+        return page
 
-        return MenuPage(self.driver)
+    @classmethod
+    def opened(cls: Type[P], driver: WebDriver) -> P:
+        """Return the page object of this class after a navigation to it, see :meth:`of`.
 
-    def go_to_cart_page(self) -> "CartPage":  # noqa=F821
-        """Navigate to the Cart page and return its page object."""
-        self.get_header().click_cart()
-        from pages.cart_page import CartPage
+        Records the Web Vitals of the page as ``<Page> opened``, so call it only after a
+        real navigation (``driver.get`` or a link click), not when an action stays on the page.
 
-        return CartPage(self.driver)
+        Args:
+            driver: Selenium WebDriver instance.
+        """
+        page = cls.of(driver)
+        web_vitals.record(driver, f"{cls.__name__} opened")
+        return page
 
-    def go_to_github_page(self) -> "GitHubPage":  # noqa=F821
-        """Navigate to the GitHub page and return its page object."""
-        self._header.click_github()
-        from pages.githab_page import GitHubPage
+    @property
+    def _header(self) -> "HeaderComponent":
+        """Return the header shared by all page objects of the browser session."""
+        return resolve("HeaderComponent").shared(self.driver)
 
-        return GitHubPage(self.driver)
+    def get_header(self) -> "HeaderComponent":
+        """Return the Header component, shared by all page objects of the browser session."""
+        return self._header
 
-    @allure.step("Finding single element by locator: {locator}")
+    def go_to_menu_page(self) -> "MenuPage":
+        """Navigate to the Menu page and return its page object."""
+        return self.get_header().click_menu()
+
+    def go_to_cart_page(self) -> "CartPage":
+        """Navigate to the Cart page and return its page object."""
+        return self.get_header().click_cart()
+
+    def go_to_github_page(self) -> "GitHubPage":
+        """Navigate to the GitHub page and return its page object."""
+        return self._header.click_github()
+
+    @step("Finding single element by locator: {locator}")
     def find_element(self, locator: LocatorType) -> WebElement:
         """
         Find a single element using the given locator.
@@ -152,7 +338,7 @@ class BasePage(Base):
         """
         return self.driver.find_element(*locator)
 
-    @allure.step("Finding multiple elements by locator: {locator}")
+    @step("Finding multiple elements by locator: {locator}")
     def find_elements(self, locator: LocatorType) -> List[WebElement]:
         """
         Find multiple elements using the given locator.
@@ -165,21 +351,35 @@ class BasePage(Base):
         """
         return self.driver.find_elements(*locator)
 
-    def wait_for_element_and_click(self, locator: Tuple[str, str], timeout: int = 10) -> WebElement:
-        """Wait for the element to become clickable, clicks it, and returns the element."""
-        element = WebDriverWait(self.driver, timeout).until(EC.element_to_be_clickable(locator))
+    def wait_for_element_and_click(
+        self, locator: Tuple[str, str], timeout: int = 10, wait_for_idle: bool = False
+    ) -> WebElement:
+        """Wait for the element to become clickable, clicks it, and returns the element.
+
+        With ``wait_for_idle`` the call returns only once the app has settled after the click.
+        """
+        element = self.wait_until(f"clickable:{locator[1]}", EC.element_to_be_clickable(locator), timeout)
+        if wait_for_idle:
+            self.track_idle()
         element.click()
+        if wait_for_idle:
+            self.wait_for_idle()
         return element
 
     def wait_for_presence_and_get_element(self, locator: Tuple[str, str], timeout: int = 5) -> WebElement:
         """Wait for the element to appear in the DOM."""
-        return WebDriverWait(self.driver, timeout).until(EC.presence_of_element_located(locator))
+        return self.wait_until(f"present:{locator[1]}", EC.presence_of_element_located(locator), timeout)
 
     def safe_wait_find_visibility(self, locator: LocatorType, timeout: int = 2) -> Optional[WebElement]:
         """Return web element if visible or None."""
         try:
             self.driver.implicitly_wait(0)
-            return WebDriverWait(self.driver, timeout).until(EC.visibility_of_element_located(locator))
+            return self.wait_until(
+                f"{type(self).__name__}.visible:{locator[1]}",
+                EC.visibility_of_element_located(locator),
+                timeout,
+                may_miss=True,
+            )
         except (NoSuchElementException, TimeoutException):
             return None
         finally:
@@ -189,7 +389,12 @@ class BasePage(Base):
         """Return web element if present or None."""
         try:
             self.driver.implicitly_wait(0)
-            return WebDriverWait(self.driver, timeout).until(EC.presence_of_element_located(locator))
+            return self.wait_until(
+                f"{type(self).__name__}.present:{locator[1]}",
+                EC.presence_of_element_located(locator),
+                timeout,
+                may_miss=True,
+            )
         except (NoSuchElementException, TimeoutException):
             return None
         finally:
@@ -249,7 +454,7 @@ class BaseComponent(Base):
     def hover_on_element(self, element: WebElement) -> None:
         """Hover over a given element using ActionChains."""
         if element:
-            self.logger.debug(f"Hovering over element: {element}")
+            self.logger.debug("Hovering over element: %s", element)
             actions = ActionChains(self.driver)
             actions.move_to_element(element).perform()
         else:
@@ -257,6 +462,6 @@ class BaseComponent(Base):
 
     def hover_on(self) -> None:
         """Hover over self using ActionChains."""
-        self.logger.debug(f"Hovering over element: {self}")
+        self.logger.debug("Hovering over element: %s", self)
         actions = ActionChains(self.driver)
         actions.move_to_element(self.parent).perform()
@@ -14,6 +14,9 @@ from config.resources import IMPLICIT_WAIT
 from pages.base import BasePage, DictLocatorType
 from pages.components.cart_item_component import CartItemComponent
 from pages.components.pay_component.pay_component import PayComponent
+from utilities.perf_budget import perf_budget
+from utilities.reporting import step
+from utilities.web_vitals import collect_web_vitals
 
 
 class CartPage(BasePage):
@@ -36,27 +39,43 @@ class CartPage(BasePage):
         super().__init__(driver)
         self.driver = driver
 
-    @allure.step("Get root container for cart page")
+    @step("Get root container for cart page")
     def _root(self) -> WebElement:
         """Return the root container for the cart page content."""
         return self.find_element(self.locators["cart_root"])
 
     @allure.step("Get cart item list")
     def items(self) -> List[CartItemComponent]:
-        """Return list of cart item components if found any or empty list."""
-        item = self.safe_wait_find_visibility(self.locators["items"])
-        if item:
-            elements = self.find_elements(self.locators["items"])
-            return [CartItemComponent(self.driver, el) for el in elements]
-        return []
+        """Return list of cart item components if found any or empty list.
+
+        Waits until either the items or the empty cart message show up, so an empty cart
+        is recognized right away instead of after the full timeout.
+        """
+
+        def items_or_empty_cart(driver: WebDriver):
+            elements = driver.find_elements(*self.locators["items"])
+            if elements:
+                return (elements,) if elements[0].is_displayed() else False
+            return ([],) if driver.find_elements(*self.locators["empty_cart"]) else False
+
+        try:
+            self.driver.implicitly_wait(0)
+            (elements,) = self.wait_until("CartPage.items", items_or_empty_cart, 2)
+        except TimeoutException:
+            return []
+        finally:
+            self.driver.implicitly_wait(IMPLICIT_WAIT)
+        return [CartItemComponent(self.driver, el) for el in elements]
 
     @allure.step("Get total amount on Cart page")
+    @perf_budget()
     def pay(self) -> PayComponent:
         """Return the pay component for the cart page."""
         root = self._root()
         pay_element = root.find_element(*self.locators["pay_container"])
         return PayComponent(self.driver, pay_element)
 
+    @collect_web_vitals()
     @allure.step("Delete all cart items")
     def clear_cart(self) -> "CartPage":
         """Delete all cart elements if there are any."""
@@ -72,10 +91,13 @@ class CartPage(BasePage):
     @allure.step("Check if empty cart message is visible on Cart page")
     def is_empty_cart_displayed(self) -> bool:
         """Return True if empty cart web element is displayed."""
-        if self.get_empty_cart_we():
-            if self.get_empty_cart_we().is_displayed():
-                return True
-        return False
+        empty_cart = self.get_empty_cart_we()
+        return bool(empty_cart and empty_cart.is_displayed())
+
+    @allure.step("Check that empty cart message stays hidden on Cart page")
+    def is_empty_cart_absent(self) -> bool:
+        """Return True if the empty cart message is not displayed and does not show up once the page settles."""
+        return self.is_absent(self.locators["empty_cart"])
 
     def get_number_of_items(self) -> int:
         """Return the current number of unique item components in the cart."""
@@ -9,6 +9,7 @@ from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 
 from pages.base import BaseComponent, DictLocatorType
+from pages.registry import resolve
 
 if TYPE_CHECKING:
     from pages.menu_page import MenuPage
@@ -59,7 +60,7 @@ class AddCupModal(BaseComponent):
         has_open_attr = self.parent.get_attribute("open")
         is_open = is_displayed and has_open_attr
 
-        self.logger.debug(f"Modal open status: {is_open}")
+        self.logger.debug("Modal open status: %s", is_open)
         allure.attach(str(is_open), "Modal Open Status", allure.attachment_type.TEXT)
         return is_open
 
@@ -71,7 +72,7 @@ class AddCupModal(BaseComponent):
             str: Message text, or empty string if not found.
         """
         message = self.parent.find_element(By.XPATH, self.locators["MESSAGE"][1]).text
-        self.logger.debug(f"Found message text: '{message}'")
+        self.logger.debug("Found message text: '%s'", message)
         return message
 
     @allure.step("Get product name from modal")
@@ -82,7 +83,7 @@ class AddCupModal(BaseComponent):
             str: Product name, or empty string if not found.
         """
         product_name = self.parent.find_element(By.XPATH, self.locators["PRODUCT_NAME"][1]).text
-        self.logger.debug(f"Found product name: '{product_name}'")
+        self.logger.debug("Found product name: '%s'", product_name)
         return product_name
 
     def _get_button_element(self, button_type: ButtonType) -> WebElement:
@@ -94,7 +95,7 @@ class AddCupModal(BaseComponent):
         Returns:
             WebElement: The button element.
         """
-        self.logger.debug(f"Getting {button_type.name} button")
+        self.logger.debug("Getting %s button", button_type.name)
         return self.parent.find_element(By.XPATH, self.locators[button_type.value][1])
 
     @allure.step("Click 'Yes' button to confirm")
@@ -104,13 +105,11 @@ class AddCupModal(BaseComponent):
         Returns:
             MenuPage: The menu page after confirming.
         """
-        from pages.menu_page import MenuPage
-
         self.logger.debug("Attempting to confirm modal")
 
         self._get_button_element(ButtonType.YES).click()
         self.logger.debug("Modal confirmed")
-        return MenuPage(driver=self.driver)
+        return resolve("MenuPage").of(self.driver)
 
     @allure.step("Click 'No' button to cancel")
     def cancel(self) -> "MenuPage":
@@ -119,14 +118,12 @@ class AddCupModal(BaseComponent):
         Returns:
             MenuPage: The menu page after canceling.
         """
-        from pages.menu_page import MenuPage
-
         self.logger.debug("Attempting to cancel modal")
 
         self._get_button_element(ButtonType.NO).click()
         self.logger.debug("Modal canceled")
 
-        return MenuPage(driver=self.driver)
+        return resolve("MenuPage").of(self.driver)
 
     @allure.step("Get dialog styles")
     def get_dialog_styles(self) -> dict:
@@ -145,7 +142,7 @@ class AddCupModal(BaseComponent):
             "padding": "padding",
         }
         styles = self.get_styles(self.parent, properties)
-        self.logger.debug(f"Dialog styles: {styles}")
+        self.logger.debug("Dialog styles: %s", styles)
         return styles
 
     @allure.step("Get Yes button styles")
@@ -164,7 +161,7 @@ class AddCupModal(BaseComponent):
         }
         yes_button = self._get_button_element(ButtonType.YES)
         styles = self.get_styles(yes_button, properties)
-        self.logger.debug(f"Yes button styles: {styles}")
+        self.logger.debug("Yes button styles: %s", styles)
         return styles
 
     @allure.step("Get No button styles")
@@ -183,5 +180,5 @@ class AddCupModal(BaseComponent):
         }
         no_button = self._get_button_element(ButtonType.NO)
         styles = self.get_styles(no_button, properties)
-        self.logger.debug(f"No button styles: {styles}")
+        self.logger.debug("No button styles: %s", styles)
         return styles
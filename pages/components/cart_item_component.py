@@ -6,6 +6,7 @@ from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 
 from pages.base import BaseComponent, DictLocatorType
+from utilities.parsing import parse_money, parse_quantity, parse_unit_price, to_float
 
 
 class CartItemComponent(BaseComponent):  # Успадкування від BaseComponent
@@ -34,12 +35,12 @@ class CartItemComponent(BaseComponent):  # Успадкування від BaseC
     @property
     def quantity(self) -> int:
         """Return the current quantity of the item from DOM."""
-        return int(self.find_element(self.locators["quantity"]).text.split("x")[1].strip())
+        return parse_quantity(self.find_element(self.locators["quantity"]).text)
 
     @property
     def price(self) -> float:
         """Return the current price of the item from DOM."""
-        return float(self.find_element(self.locators["quantity"]).text.split("x")[0].strip().replace("$", ""))
+        return to_float(parse_unit_price(self.find_element(self.locators["quantity"]).text).price)
 
     def get_name(self) -> str:
         """Return the name of the product."""
@@ -48,7 +49,7 @@ class CartItemComponent(BaseComponent):  # Успадкування від BaseC
     def get_total_price(self) -> float:
         """Return the total price of the item."""
         price_text = self.find_element(self.locators["item_total_locator"]).text
-        return float(price_text[1:])
+        return to_float(parse_money(price_text))
 
     def increase_quantity(self) -> "CartItemComponent":
         """Click the '+' button to increase the item quantity."""
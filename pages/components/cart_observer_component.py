@@ -0,0 +1,82 @@
+"""Component model for live observation of the header cart count and the total button."""
+
+from typing import List, NamedTuple, Optional
+
+import allure
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+from pages.base import BaseComponent, DictLocatorType
+from pages.scripts import DRAIN_CART_OBSERVER, INSTALL_CART_OBSERVER
+
+
+class CartState(NamedTuple):
+    """Header cart count and total text (e.g. "$22.00") at one point in time."""
+
+    count: int
+    total: str
+    at_ms: int = 0
+
+
+class CartObserverComponent(BaseComponent):
+    """Browser-side observer pushing every change of the cart count and total into a ring buffer.
+
+    Changes are collected in the page by a ``MutationObserver`` while the test acts, and
+    read back in one call with :meth:`drain`, so a burst of clicks can be checked as a
+    sequence of values without a wait per click.
+    """
+
+    locators: DictLocatorType = {
+        "nav_cart_count": (By.CSS_SELECTOR, "a[aria-label='Cart page']"),
+        "checkout_button": (By.CSS_SELECTOR, "div.pay-container button[data-test='checkout']"),
+    }
+
+    def __init__(self, driver: WebDriver, parent: Optional[WebElement] = None, capacity: int = 256) -> None:
+        """Install the observer in the page, restarting the recording if one is installed already.
+
+        Args:
+            driver: Selenium WebDriver instance.
+            parent: Not needed, the install script looks the header up by selector.
+            capacity: Number of changes kept in the page before the oldest are dropped.
+        """
+        super().__init__(driver, parent)
+        self.capacity = capacity
+        self.dropped = 0
+        self.initial = CartState(**self._install())
+
+    def _install(self) -> dict:
+        state = self.driver.execute_script(
+            INSTALL_CART_OBSERVER,
+            self.locators["nav_cart_count"][1],
+            self.locators["checkout_button"][1],
+            self.capacity,
+        )
+        return {"count": state["count"], "total": state["total"], "at_ms": state["atMs"]}
+
+    @allure.step("Drain cart count and total changes")
+    def drain(self, quiet_ms: int = 100, timeout: float = 5) -> List[CartState]:
+        """Return the changes recorded since the last drain, oldest first, and clear them.
+
+        Args:
+            quiet_ms: Wait until the values have not changed for this long, so pending re-renders are included.
+            timeout: Upper bound in seconds for the quiet wait.
+
+        Returns:
+            list: Recorded states; ``dropped`` counts the changes lost to a full buffer.
+        """
+        result = self.driver.execute_async_script(DRAIN_CART_OBSERVER, quiet_ms, int(timeout * 1000))
+        if result is None:
+            self.logger.debug("Cart observer missing after navigation, reinstalling")
+            self._install()
+            return []
+        self.dropped = result["dropped"]
+        return [CartState(change["count"], change["total"], change["atMs"]) for change in result["changes"]]
+
+    def counts(self, quiet_ms: int = 100) -> List[int]:
+        """Drain the changes and return the sequence of header cart counts."""
+        return [state.count for state in self.drain(quiet_ms)]
+
+    def totals(self, quiet_ms: int = 100) -> List[str]:
+        """Drain the changes and return the sequence of totals."""
+        return [state.total for state in self.drain(quiet_ms)]
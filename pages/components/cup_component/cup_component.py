@@ -1,5 +1,6 @@
 """Module for CupComponent UI component."""
 
+from functools import cached_property
 from typing import List, Optional
 
 import allure
@@ -11,10 +12,15 @@ from selenium.webdriver.remote.webelement import WebElement
 from pages.base import BaseComponent, DictLocatorType
 from pages.components.add_cup_modal import AddCupModal
 from pages.components.cup_component.ingredient_component import IngredientComponent
+from utilities.parsing import parse_money, to_float
 
 
 class CupComponent(BaseComponent):
-    """Component representing a single cup item on the menu."""
+    """Component representing a single cup item on the menu.
+
+    Body, name, price and ingredients are looked up on first access and kept, so
+    building the components of the whole menu costs no lookups inside the cups.
+    """
 
     locators: DictLocatorType = {
         "name": (By.XPATH, ".//h4"),
@@ -32,10 +38,26 @@ class CupComponent(BaseComponent):
             parent: Parent WebElement representing the cup.
         """
         super().__init__(driver, parent)
-        self.body: WebElement = self.find_element(self.locators["body"])
-        self.name: str = self.find_element(self.locators["name"]).text.split("\n")[0].strip()
-        self.price: str = self.find_element(self.locators["price"]).text.strip()
-        self.ingredients: List[IngredientComponent] = self.get_ingredients()
+
+    @cached_property
+    def body(self) -> WebElement:
+        """Return the cup's body element."""
+        return self.find_element(self.locators["body"])
+
+    @cached_property
+    def name(self) -> str:
+        """Return the cup's name as read on first access."""
+        return self.find_element(self.locators["name"]).text.split("\n")[0].strip()
+
+    @cached_property
+    def price(self) -> str:
+        """Return the cup's price text as read on first access, e.g. ``$10.00``."""
+        return self.find_element(self.locators["price"]).text.strip()
+
+    @cached_property
+    def ingredients(self) -> List[IngredientComponent]:
+        """Return the ingredient components as found on first access."""
+        return self.get_ingredients()
 
     @allure.step("click on cup")
     def click(self):
@@ -68,8 +90,7 @@ class CupComponent(BaseComponent):
 
     def get_price(self) -> float:
         """Return the price of the cup as a float."""
-        price_text = self.price.replace("$", "").strip()
-        return float(price_text)
+        return to_float(parse_money(self.price))
 
     def open_add_cup_modal(self) -> "AddCupModal":
         """Right-click on the cup to open Add Cup Modal.
@@ -79,7 +100,7 @@ class CupComponent(BaseComponent):
         """
         actions = ActionChains(self.driver)
         actions.context_click(self.body).perform()
-        self.logger.debug(f"Right-clicked on cup: {self.name}")
+        self.logger.debug("Right-clicked on cup: %s", self.name)
 
         return AddCupModal(self.driver)
 
@@ -0,0 +1,82 @@
+"""Module for CupHandle, a lightweight index-addressed reference to a menu cup."""
+
+from typing import Callable, Optional, TypeVar
+
+import allure
+from selenium.common import StaleElementReferenceException
+from selenium.webdriver import ActionChains
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+from pages.base import BaseComponent, DictLocatorType, LocatorType
+from pages.components.cup_component.cup_component import CupComponent
+
+T = TypeVar("T")
+
+
+class CupHandle(BaseComponent):
+    """Handle of the n-th cup on the menu that stays usable across re-renders.
+
+    Creating handles for the whole menu costs a single lookup. Unlike ``CupComponent``
+    it keeps no elements: every call works on the current DOM, and if a re-render
+    replaced the cup element, the handle finds it again by its position.
+    """
+
+    locators: DictLocatorType = {
+        "name": (By.XPATH, ".//h4"),
+        "body": (By.CLASS_NAME, "cup-body"),
+    }
+
+    def __init__(
+        self, driver: WebDriver, index: int, cups_locator: LocatorType, parent: Optional[WebElement] = None
+    ) -> None:
+        """
+        Initialize the handle.
+
+        Args:
+            driver: Selenium WebDriver instance.
+            index: Zero-based position of the cup on the menu.
+            cups_locator: Locator matching all cups of the menu, in order.
+            parent: Cup element if already known; looked up on first use otherwise.
+        """
+        super().__init__(driver, parent)
+        self.index = index
+        self.cups_locator = cups_locator
+
+    def _resolve(self) -> WebElement:
+        """Look the cup element up again by its position."""
+        cups = self.driver.find_elements(*self.cups_locator)
+        if self.index >= len(cups):
+            raise IndexError(f"Menu has {len(cups)} cups, no cup #{self.index + 1}")
+        self.parent = cups[self.index]
+        return self.parent
+
+    def _with_cup(self, action: Callable[[WebElement], T]) -> T:
+        """Run an action on the cup element, looking it up again once if it went stale."""
+        if self.parent is None:
+            self._resolve()
+        try:
+            return action(self.parent)
+        except StaleElementReferenceException:
+            self.logger.debug("Cup #%d went stale, looking it up again", self.index + 1)
+            return action(self._resolve())
+
+    def get_name(self) -> str:
+        """Return the name currently shown for the cup."""
+        return self._with_cup(lambda cup: cup.find_element(*self.locators["name"]).text.split("\n")[0].strip())
+
+    @allure.step("Click on cup")
+    def click(self) -> None:
+        """Click on the cup's body."""
+        self._with_cup(lambda cup: cup.find_element(*self.locators["body"]).click())
+
+    @allure.step("Double click on cup name")
+    def double_click_on_cup_name(self) -> None:
+        """Double click on the cup name to toggle its Chinese translation."""
+        name = self._with_cup(lambda cup: cup.find_element(*self.locators["name"]))
+        ActionChains(self.driver).double_click(name).perform()
+
+    def component(self) -> CupComponent:
+        """Return the full cup component, with price and ingredients."""
+        return self._with_cup(lambda cup: CupComponent(self.driver, cup))
@@ -4,6 +4,7 @@ from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 
 from pages.base import BaseComponent
+from utilities.parsing import parse_height_percent
 
 
 class IngredientComponent(BaseComponent):
@@ -27,12 +28,7 @@ class IngredientComponent(BaseComponent):
 
     def _parse_height(self, style: str) -> float:
         """Extract numeric height percentage from style string."""
-        import re
-
-        match = re.search(r"height\s*:\s*([\d.]+)%", style)
-        if match:
-            return float(match.group(1))
-        return 0.0
+        return parse_height_percent(style)
 
     def _get_height_percent(self) -> float:
         """Return the height percentage parsed from the style attribute."""
@@ -1,38 +1,95 @@
 """Module for HeaderComponent UI component."""
 
+from typing import Callable, List, Optional, TypeVar
+
+from selenium.common import StaleElementReferenceException
+from selenium.webdriver import ActionChains
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver, WebElement
 
-from pages.base import BaseComponent
-from pages.cart_page import CartPage
-from pages.githab_page import GitHubPage
-from pages.menu_page import MenuPage
+from pages.base import BaseComponent, LocatorType
+from pages.registry import resolve
+
+T = TypeVar("T")
 
 
 class HeaderComponent(BaseComponent):
     """Class to represent the header UI component and its logic."""
 
+    root_locator = (By.CSS_SELECTOR, "#app > ul")
     locators = {
         "menu_link": (By.CSS_SELECTOR, 'a[aria-label="Menu page"]'),
         "cart_link": (By.CSS_SELECTOR, 'a[aria-label="Cart page"]'),
         "github_link": (By.CSS_SELECTOR, 'a[aria-label="GitHub page"]'),
     }
 
-    def __init__(self, driver: WebDriver, parent: WebElement) -> None:
-        """Initialize the HeaderComponent with the web driver."""
+    def __init__(self, driver: WebDriver, parent: Optional[WebElement] = None) -> None:
+        """Initialize the HeaderComponent with the web driver; without a parent it is found on first use."""
         super().__init__(driver, parent)
 
+    @classmethod
+    def shared(cls, driver: WebDriver) -> "HeaderComponent":
+        """Return the header of a browser session, shared by all its page objects.
+
+        Handing it out costs no browser round trip: every access to the header element
+        goes through ``_with_root``, which finds it on first use and again only when the
+        app replaced it.
+        """
+        header = getattr(driver, "shared_header", None)
+        if header is None:
+            header = driver.shared_header = cls(driver)
+        return header
+
+    def _bind(self) -> WebElement:
+        """Look the header element up and bind it as the parent."""
+        self.parent = self.driver.find_element(*self.root_locator)
+        return self.parent
+
+    def _with_root(self, action: Callable[[WebElement], T]) -> T:
+        """Run an action on the header element, binding it when missing and again once if it went stale."""
+        if self.parent is None:
+            self._bind()
+        try:
+            return action(self.parent)
+        except StaleElementReferenceException:
+            self.logger.debug("Header went stale, looking it up again")
+            return action(self._bind())
+
+    def find_element(self, locator: LocatorType) -> WebElement:
+        """Find an element within the header."""
+        return self._with_root(lambda root: root.find_element(*locator))
+
+    def find_elements(self, locator: LocatorType) -> List[WebElement]:
+        """Find elements within the header."""
+        return self._with_root(lambda root: root.find_elements(*locator))
+
+    def _get_height_style(self) -> str:
+        """Return the raw style attribute of the header."""
+        return self._with_root(lambda root: root.get_attribute("style") or "")
+
+    def _get_height_percent(self) -> float:
+        """Return height percentage of the header."""
+        return self._with_root(self.get_height_percent)
+
+    def _get_classes(self) -> List[str]:
+        """Return CSS classes applied to the header."""
+        return self._with_root(self.get_classes)
+
+    def hover_on(self) -> None:
+        """Hover over the header using ActionChains."""
+        self._with_root(lambda root: ActionChains(self.driver).move_to_element(root).perform())
+
     def click_menu(self):
         """Click the 'Menu' link."""
-        self.find_element(*self.locators["menu_link"]).click()
-        return MenuPage(self.driver)
+        self.find_element(self.locators["menu_link"]).click()
+        return resolve("MenuPage").opened(self.driver)
 
     def click_cart(self):
         """Click the 'Cart' link."""
         self.find_element(self.locators["cart_link"]).click()
-        return CartPage(self.driver)
+        return resolve("CartPage").opened(self.driver)
 
     def click_github(self):
         """Click the 'GitHub' link."""
-        self.find_element(*self.locators["github_link"]).click()
-        return GitHubPage(self.driver)
+        self.find_element(self.locators["github_link"]).click()
+        return resolve("GitHubPage").opened(self.driver)
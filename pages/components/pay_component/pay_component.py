@@ -7,6 +7,7 @@ from selenium.webdriver.remote.webelement import WebElement
 
 from pages.base import BaseComponent, DictLocatorType
 from pages.components.pay_component.pay_preview_item_component import PayPreviewItemComponent
+from utilities.parsing import parse_money, to_float
 
 
 class PayComponent(BaseComponent):
@@ -42,11 +43,7 @@ class PayComponent(BaseComponent):
 
         The method uses the Pay/Total button text.
         """
-        total_button_text: str = self.get_total_price_text()  # Use the new method
-        prefix = "Total: $"
-        if total_button_text.startswith(prefix):
-            total_button_text = total_button_text.replace(prefix, "", 1)
-        return float(total_button_text)
+        return to_float(parse_money(self.get_total_price_text()))
 
     @allure.step("Click Pay/Total button on Menu page")
     def click_pay(self) -> None:
@@ -49,7 +49,7 @@ class PayPreviewComponent(BaseComponent):
 
         visible_preview = self.find_element(self.locators["VISIBLE_ROOT_PREVIEW"])
         result = visible_preview is not None
-        self.logger.debug(f"Preview visibility check result: {result}")
+        self.logger.debug("Preview visibility check result: %s", result)
         return result
 
     @allure.step("Get all preview items")
@@ -70,7 +70,7 @@ class PayPreviewComponent(BaseComponent):
             except StaleElementReferenceException:
                 self.logger.debug("Skipping stale item element in preview")
 
-        self.logger.debug(f"Found {len(items_list)} items in preview")
+        self.logger.debug("Found %s items in preview", len(items_list))
         return items_list
 
     @allure.step("Get preview item count")
@@ -84,7 +84,7 @@ class PayPreviewComponent(BaseComponent):
 
         items = self.get_items()
         count = len(items)
-        self.logger.debug(f"Item count: {count}")
+        self.logger.debug("Item count: %s", count)
         return count
 
     @allure.step("Get preview styles")
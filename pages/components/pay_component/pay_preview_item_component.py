@@ -39,12 +39,12 @@ class PayPreviewItemComponent(BaseComponent):
     def get_name(self) -> str:
         """Get the name of the item."""
         name = self.find_element(self.locators["name"]).text
-        self.logger.debug(f"Item name: {name}")
+        self.logger.debug("Item name: %s", name)
         return name
 
     @allure.step("Get item quantity")
     def get_quantity(self) -> str:
         """Get the quantity description of the item."""
         quantity = self.find_element(self.locators["quantity"]).text
-        self.logger.debug(f"Item quantity: {quantity}")
+        self.logger.debug("Item quantity: %s", quantity)
         return quantity
@@ -1,12 +1,17 @@
 """Module for PaymentDetailsModal UI component."""
+from typing import TYPE_CHECKING
+
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 
 from pages.base import BaseComponent, DictLocatorType
-from pages.menu_page import MenuPage
+from pages.registry import resolve
 from test_data.users import User
 
+if TYPE_CHECKING:
+    from pages.menu_page import MenuPage
+
 
 class PaymentDetailsModal(BaseComponent):
     """PaymentDetailsModal class for payment details modal logic."""
@@ -37,7 +42,7 @@ class PaymentDetailsModal(BaseComponent):
     def click_submit_successfully(self) -> "MenuPage":
         """Click submit and return MenuPage."""
         self.find_element(self.locators["submit_button"]).click()
-        return MenuPage(self.driver)
+        return resolve("MenuPage").of(self.driver)
 
     def click_submit_unsuccessfully(self) -> "PaymentDetailsModal":
         """Click submit and return self."""
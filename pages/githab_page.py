@@ -1,8 +1,13 @@
 """Module for GithabPage UI component."""
+from typing import TYPE_CHECKING
+
 from selenium.webdriver.common.by import By
 
 from pages.base import BasePage
-from pages.menu_page import MenuPage
+from pages.registry import resolve
+
+if TYPE_CHECKING:
+    from pages.menu_page import MenuPage
 
 
 class GitHubPage(BasePage):
@@ -31,12 +36,12 @@ class GitHubPage(BasePage):
     def click_on_simulate_ads_link(self) -> "MenuPage":
         """Switch to Menu page with ad=1."""
         self.find_element(self.locators["simulate_ads_link"]).click()
-        return MenuPage(self.driver)
+        return resolve("MenuPage").opened(self.driver)
 
     def click_on_simulate_errors_link(self) -> "MenuPage":
         """Switch to Menu page with ad=1."""
         self.find_element(self.locators["simulate_error_link"]).click()
-        return MenuPage(self.driver)
+        return resolve("MenuPage").opened(self.driver)
 
     def click_on_recorder_panel_link(self) -> None:
         """Open documentation about add-to-cart flow."""
@@ -1,5 +1,5 @@
 """Menu page for coffee items."""
-from typing import List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 import allure
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
@@ -8,15 +8,25 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.wait import WebDriverWait
 
 from config.resources import IMPLICIT_WAIT
 from pages.base import BasePage, DictLocatorType
 from pages.cart_page import CartPage
+from pages.components.cart_observer_component import CartObserverComponent
 from pages.components.cup_component.cup_component import CupComponent
+from pages.components.cup_component.cup_handle import CupHandle
 from pages.components.pay_component.pay_component import PayComponent
 from pages.components.pay_component.pay_preview_component import PayPreviewComponent
 from pages.components.promo_component import PromoComponent
+from pages.registry import resolve
+from pages.scripts import ADD_TO_CART, CART_SNAPSHOT, CUP_RECTS, TRANSLATE_ALL
+from utilities.perf_budget import perf_budget
+from utilities.web_vitals import collect_web_vitals
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from pages.components.payment_details_modal import PaymentDetailsModal
 
 
 class MenuPage(BasePage):
@@ -24,6 +34,7 @@ class MenuPage(BasePage):
 
     locators: DictLocatorType = {
         "cups": (By.XPATH, "//li/h4/.."),
+        "cups_list": (By.XPATH, "//li/h4/../.."),
         "promo": (By.CLASS_NAME, "promo"),
         "total_cart_button": (By.CSS_SELECTOR, "#app > ul > li:nth-child(2)"),
         "total_price_display": (By.CSS_SELECTOR, "#app > div:nth-child(3) > div.pay-container > button"),
@@ -47,6 +58,7 @@ class MenuPage(BasePage):
         super().__init__(driver)
 
     @allure.step("Get all cup components on the menu page")
+    @perf_budget()
     def cups(self) -> List[CupComponent]:
         """
         Get all cup components on the menu page.
@@ -57,6 +69,59 @@ class MenuPage(BasePage):
         cups = self.find_elements(self.locators["cups"])
         return [CupComponent(self.driver, cup) for cup in cups]
 
+    def cup_handles(self) -> List[CupHandle]:
+        """
+        Get index-addressed handles of all cups with a single lookup.
+
+        Handles read the DOM on demand and survive re-renders such as the in-place name
+        translation, so a loop over the menu does not rebuild every cup on each step.
+
+        Returns:
+            list: CupHandle per cup, in menu order.
+        """
+        cups = self.find_elements(self.locators["cups"])
+        return [CupHandle(self.driver, index, self.locators["cups"], cup) for index, cup in enumerate(cups)]
+
+    def cup_handle(self, index: int) -> CupHandle:
+        """
+        Get the handle of the cup at a zero-based position; the cup is looked up on first use.
+
+        Args:
+            index: Position of the cup on the menu.
+        """
+        return CupHandle(self.driver, index, self.locators["cups"])
+
+    @allure.step("Translate all cup names")
+    def translate_all(self, timeout: float = 5) -> Dict[str, str]:
+        """
+        Double-click every cup name in one in-page pass and collect the results.
+
+        Calling it again switches the names back.
+
+        Args:
+            timeout: Upper bound in seconds for the names to change.
+
+        Returns:
+            dict: Mapping of the name shown before to the name shown after, in menu order.
+        """
+        return self.driver.execute_async_script(TRANSLATE_ALL, int(timeout * 1000))
+
+    @allure.step("Capture all cups in one screenshot")
+    def capture_cups(self) -> Dict[str, "np.ndarray"]:
+        """
+        Take one screenshot of the cup list and cut it into one image per cup.
+
+        Returns:
+            dict: Mapping of cup name to its RGB image, in menu order.
+        """
+        # NumPy and Pillow are only needed here, importing them with the page slows down every collection.
+        from utilities.visual_regression import crop, load_png
+
+        cups_list = self.find_element(self.locators["cups_list"])
+        layout = self.driver.execute_script(CUP_RECTS, cups_list)
+        images = crop(load_png(cups_list.screenshot_as_png), layout["cups"], layout["scale"])
+        return {cup["name"]: image for cup, image in zip(layout["cups"], images)}
+
     @allure.step("Get cup by name: {cup_name}")
     def get_cup_by_name(self, cup_name: str) -> Optional[CupComponent]:
         """
@@ -72,28 +137,40 @@ class MenuPage(BasePage):
             if cup.name == cup_name:
                 return cup
 
+    @collect_web_vitals()
     @allure.step("Click on cup by name: {cup_name}")
-    def click_on_cup_by_name(self, cup_name: str) -> "MenuPage":
+    def click_on_cup_by_name(self, cup_name: str, wait_for_idle: bool = False) -> "MenuPage":
         """
         Click on cup with specific name.
 
         Args:
             cup_name: name of cup to click on.
+            wait_for_idle: return once the app has re-rendered after the click.
         """
         cup = self.get_cup_by_name(cup_name)
+        if wait_for_idle:
+            self.track_idle()
         cup.click()
+        if wait_for_idle:
+            self.wait_for_idle()
         return self
 
+    @collect_web_vitals()
     @allure.step("Click on cup by order: {order}")
-    def click_on_cup_by_order(self, order: int) -> "MenuPage":
+    def click_on_cup_by_order(self, order: int, wait_for_idle: bool = False) -> "MenuPage":
         """
         Click on cup with specific number on the page.
 
         Args:
             order: cup to click on.
+            wait_for_idle: return once the app has re-rendered after the click.
         """
         cups = self.cups()
+        if wait_for_idle:
+            self.track_idle()
         cups[order - 1].click()
+        if wait_for_idle:
+            self.wait_for_idle()
         return self
 
     @allure.step("Get the promo banner component")
@@ -104,18 +181,31 @@ class MenuPage(BasePage):
         Returns:
             PromoComponent: The promo banner.
         """
-        promo = WebDriverWait(self.driver, 10).until(EC.presence_of_element_located(self.locators["promo"]))
+        promo = self.wait_until("MenuPage.promo", EC.presence_of_element_located(self.locators["promo"]), 10)
         return PromoComponent(self.driver, promo)
 
     @allure.step("Check if promo banner is visible")
     def is_promo_displayed(self, timeout: int = 5) -> bool:
-        """Check if the promo element is visible."""
+        """Check if the promo element is visible.
+
+        Waits up to the full ``timeout``; use ``is_promo_absent`` to check that the promo stays hidden.
+        """
         try:
-            WebDriverWait(self.driver, timeout).until(EC.visibility_of_element_located(self.locators["promo"]))
+            self.wait_until(
+                "MenuPage.is_promo_displayed",
+                EC.visibility_of_element_located(self.locators["promo"]),
+                timeout,
+                may_miss=True,
+            )
             return True
         except TimeoutException:
             return False
 
+    @allure.step("Check that promo banner stays hidden")
+    def is_promo_absent(self, timeout: int = 5) -> bool:
+        """Check that the promo is not visible and does not show up once the page settles."""
+        return self.is_absent(self.locators["promo"], timeout)
+
     @allure.step("Get total amount on Menu page")
     def pay(self) -> PayComponent:
         """
@@ -127,19 +217,18 @@ class MenuPage(BasePage):
         pay = self.find_element(self.locators["pay_container"])
         return PayComponent(self.driver, pay)
 
+    @collect_web_vitals()
     @allure.step("Get payment details by pay-button click on Menu page")
-    def click_pay_button(self) -> "PaymentDetailsModal":  # noqa=F821
+    def click_pay_button(self) -> "PaymentDetailsModal":
         """
         Click on pay button.
 
         Returns:
             Instance of PaymentDetailsModal.
         """
-        from pages.components.payment_details_modal import PaymentDetailsModal
-
         self.find_element(self.locators["pay_button"]).click()
         pay_modal_we = self.find_element(self.locators["pay_modal"])
-        return PaymentDetailsModal(self.driver, pay_modal_we)
+        return resolve("PaymentDetailsModal")(self.driver, pay_modal_we)
 
     @allure.step("Check if success snack bar is visible on Menu page")
     def get_snackbar_success_we(self) -> WebElement | None:
@@ -151,8 +240,11 @@ class MenuPage(BasePage):
         """
         try:
             self.driver.implicitly_wait(0)
-            WebDriverWait(self.driver, 5).until(
-                lambda wd: (wd.find_element(*self.locators["success_snackbar"]).get_attribute("style") or "") == ""
+            self.wait_until(
+                "MenuPage.get_snackbar_success_we",
+                lambda wd: (wd.find_element(*self.locators["success_snackbar"]).get_attribute("style") or "") == "",
+                5,
+                may_miss=True,
             )
             return self.find_element(self.locators["success_snackbar"])
         except (NoSuchElementException, TimeoutException):
@@ -162,8 +254,10 @@ class MenuPage(BasePage):
 
     def get_cart_total_price_display(self) -> str:
         """Retrieve the text of the "Total" price display element."""
-        total_price_element = WebDriverWait(self.driver, 10).until(
-            EC.presence_of_element_located(self.locators["total_price_display"])
+        total_price_element = self.wait_until(
+            "MenuPage.get_cart_total_price_display",
+            EC.presence_of_element_located(self.locators["total_price_display"]),
+            10,
         )
         return total_price_element.text
 
@@ -171,7 +265,7 @@ class MenuPage(BasePage):
         """Clicks the cart icon/Total button and returns the CartPage object."""
         self.wait_for_element_and_click(self.locators["open_cart_button"])
 
-        return CartPage(self.driver)
+        return CartPage.opened(self.driver)
 
     @allure.step("Add {count} products to the cart")
     def add_products_to_cart(self, count: int) -> "MenuPage":
@@ -196,6 +290,40 @@ class MenuPage(BasePage):
 
         return self
 
+    @collect_web_vitals()
+    @allure.step("Add drinks to the cart in one operation: {order}")
+    def add_to_cart(self, order: Dict[str, int]) -> Dict[str, int]:
+        """
+        Add several drinks to the cart with a single in-page script.
+
+        All clicks are dispatched in the browser at once, then the header counter is awaited once.
+
+        Args:
+            order: Mapping of cup name to the number of cups to add, e.g. {"Espresso": 3, "Mocha": 2}.
+
+        Returns:
+            dict: Cart snapshot as a mapping of item name to quantity.
+
+        Raises:
+            ValueError: If any of the requested cups is not on the menu.
+        """
+        result = self.driver.execute_script(ADD_TO_CART, order)
+        if result["missing"]:
+            raise ValueError(f"Cups not found on the menu: {', '.join(result['missing'])}")
+
+        expected_count = result["before"] + sum(order.values())
+        self.wait_for_nav_count_update(f"({expected_count})")
+        return self.get_cart_snapshot()
+
+    def get_cart_snapshot(self) -> Dict[str, int]:
+        """
+        Return the current cart content read from the cart preview in one script call.
+
+        Returns:
+            dict: Mapping of item name to quantity.
+        """
+        return self.driver.execute_script(CART_SNAPSHOT)
+
     def get_checkout_button_text(self) -> str:
         """
         Return the text of the ‘Total: $XX.XX’ button in the shopping cart preview.
@@ -216,8 +344,10 @@ class MenuPage(BasePage):
             MenuPage: The current MenuPage object for the chain of calls.
         """
         expected_text = f"Total: {expected_total}"
-        WebDriverWait(self.driver, 5).until(
-            EC.text_to_be_present_in_element(self.locators["checkout_button"], expected_text)
+        self.wait_until(
+            "MenuPage.wait_for_total_update",
+            EC.text_to_be_present_in_element(self.locators["checkout_button"], expected_text),
+            5,
         )
         return self
 
@@ -232,6 +362,21 @@ class MenuPage(BasePage):
         # Розділяємо "cart (X)" і повертаємо "(X)"
         return full_text.split(" ")[-1]
 
+    @allure.step("Observe cart count and total changes")
+    def observe_cart(self, capacity: int = 256) -> CartObserverComponent:
+        """
+        Start recording every change of the header cart count and the total button in the page.
+
+        Calling it again on the same page restarts the recording; changes not drained yet are dropped.
+
+        Args:
+            capacity: Number of changes kept in the page before the oldest are dropped.
+
+        Returns:
+            CartObserverComponent: Observer to drain the recorded changes from.
+        """
+        return CartObserverComponent(self.driver, capacity=capacity)
+
     def wait_for_nav_count_update(self, expected_count: str) -> "MenuPage":
         """
         Wait until the basket counter in navigation updates its text.
@@ -243,8 +388,10 @@ class MenuPage(BasePage):
             MenuPage: Current MenuPage object.
         """
         expected_text = f"cart {expected_count}"
-        WebDriverWait(self.driver, 5).until(
-            EC.text_to_be_present_in_element(self.locators["nav_cart_count"], expected_text)
+        self.wait_until(
+            "MenuPage.wait_for_nav_count_update",
+            EC.text_to_be_present_in_element(self.locators["nav_cart_count"], expected_text),
+            5,
         )
         return self
 
@@ -256,4 +403,4 @@ class MenuPage(BasePage):
             CartPage: The shopping cart page object.
         """
         self.find_element(self.locators["nav_cart_count"]).click()
-        return CartPage(self.driver)
+        return CartPage.opened(self.driver)
@@ -0,0 +1,66 @@
+"""Lazily populated registry of page object and component classes.
+
+Pages and components return each other: the header's links return pages, modals
+return the page they close to, and every page has a header. Rather than importing
+each other (a cycle), they look the classes up here by name. A class's module is
+imported on its first lookup and the class cached, so later lookups are a single
+dictionary hit, and importing one page does not import all the others::
+
+    from pages.registry import resolve
+
+    return resolve("MenuPage").of(self.driver)
+"""
+
+import importlib
+from typing import Dict, List
+
+__all__ = ["loaded", "register", "resolve"]
+
+_modules: Dict[str, str] = {
+    "AddCupModal": "pages.components.add_cup_modal",
+    "CartPage": "pages.cart_page",
+    "GitHubPage": "pages.githab_page",
+    "HeaderComponent": "pages.components.header_component",
+    "MenuPage": "pages.menu_page",
+    "PaymentDetailsModal": "pages.components.payment_details_modal",
+    "PromoComponent": "pages.components.promo_component",
+}
+_classes: Dict[str, type] = {}
+
+
+def register(name: str, module: str) -> None:
+    """Register the module of a class, replacing a resolved class of the same name.
+
+    Args:
+        name: Class name, also its attribute in the module.
+        module: Dotted module path, imported on the first :func:`resolve`.
+    """
+    _modules[name] = module
+    _classes.pop(name, None)
+
+
+def resolve(name: str) -> type:
+    """Return a registered class, importing its module on first use.
+
+    Args:
+        name: Class name, e.g. ``MenuPage``.
+
+    Returns:
+        type: The class.
+
+    Raises:
+        KeyError: If no class of that name is registered.
+    """
+    try:
+        return _classes[name]
+    except KeyError:
+        pass
+    if name not in _modules:
+        raise KeyError(f"No page object class registered as {name!r}")
+    cls = _classes[name] = getattr(importlib.import_module(_modules[name]), name)
+    return cls
+
+
+def loaded() -> List[str]:
+    """Return the names of the classes resolved so far."""
+    return sorted(_classes)
@@ -0,0 +1,461 @@
+"""JavaScript snippets executed in the coffee-cart page by page objects.
+
+Each snippet is a plain string passed to ``driver.execute_script`` (or
+``execute_async_script`` where noted); arguments are documented next to the constant
+and are read from ``arguments[...]``.
+"""
+
+__all__ = [
+    "ADD_TO_CART",
+    "AWAIT_ABSENCE",
+    "CART_SNAPSHOT",
+    "COLLECT_WEB_VITALS",
+    "CUP_RECTS",
+    "DRAIN_CART_OBSERVER",
+    "INSTALL_CART_OBSERVER",
+    "INSTALL_IDLE_TRACKER",
+    "SNAPSHOT_DOM",
+    "TRANSLATE_ALL",
+    "WAIT_FOR_IDLE",
+]
+
+# arguments[0]: {cup name: number of clicks}.
+# Returns {"missing": [names not on the menu], "before": header count before clicking}.
+ADD_TO_CART = """
+var order = arguments[0];
+var bodies = {};
+document.querySelectorAll('li > h4').forEach(function (h4) {
+    var name = h4.firstChild ? h4.firstChild.textContent.trim() : '';
+    var body = h4.parentElement.querySelector('.cup-body');
+    if (name && body && !(name in bodies)) {
+        bodies[name] = body;
+    }
+});
+var missing = Object.keys(order).filter(function (name) { return !(name in bodies); });
+if (missing.length) {
+    return {missing: missing, before: null};
+}
+var link = document.querySelector("a[aria-label='Cart page']");
+var match = /\\((\\d+)\\)/.exec(link ? link.textContent : '');
+var before = match ? parseInt(match[1], 10) : 0;
+Object.keys(order).forEach(function (name) {
+    for (var i = 0; i < order[name]; i++) {
+        bodies[name].click();
+    }
+});
+return {missing: [], before: before};
+"""
+
+# Returns {item name: quantity} for every row of the cart preview list.
+CART_SNAPSHOT = """
+var snapshot = {};
+document.querySelectorAll('ul.cart-preview > li.list-item').forEach(function (li) {
+    var name = li.querySelector('span');
+    var unit = li.querySelector('span.unit-desc');
+    var match = /x\\s*(\\d+)/.exec(unit ? unit.textContent : '');
+    if (name) {
+        snapshot[name.textContent.trim()] = match ? parseInt(match[1], 10) : 0;
+    }
+});
+return snapshot;
+"""
+
+# findAll(using, value): the elements matching a W3C locator strategy ("css selector",
+# "xpath", "tag name", "link text" or "partial link text") in the whole document, in
+# document order. Link texts are compared with the trimmed rendered text, as WebDriver does.
+_FIND_ALL = """
+function findAll(using, value) {
+    if (using === 'xpath') {
+        var snapshot = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        var nodes = [];
+        for (var i = 0; i < snapshot.snapshotLength; i++) {
+            nodes.push(snapshot.snapshotItem(i));
+        }
+        return nodes;
+    }
+    if (using === 'tag name') {
+        return Array.prototype.slice.call(document.getElementsByTagName(value));
+    }
+    if (using === 'link text' || using === 'partial link text') {
+        return Array.prototype.filter.call(document.querySelectorAll('a'), function (a) {
+            var text = a.innerText.trim();
+            return using === 'link text' ? text === value : text.indexOf(value) !== -1;
+        });
+    }
+    return Array.prototype.slice.call(document.querySelectorAll(value));
+}
+"""
+
+# Asynchronous. arguments[0]: W3C locator strategy, see _FIND_ALL,
+# arguments[1]: selector, arguments[2]: true to ignore matches that are not displayed,
+# arguments[3]: quiet period in ms, arguments[4]: upper bound in ms.
+# Resolves as soon as a match is found, or once the document has had no mutation for the
+# quiet period with no match, to {"present": bool, "quiescent": bool, "waitedMs": int}.
+# "quiescent" is false when mutations kept coming until the upper bound.
+AWAIT_ABSENCE = (
+    """/* awaitAbsence */
+var using = arguments[0], value = arguments[1], visibleOnly = arguments[2];
+var quietMs = arguments[3], maxMs = arguments[4], done = arguments[arguments.length - 1];
+var start = Date.now();"""
+    + _FIND_ALL
+    + """function matches() {
+    return findAll(using, value);
+}
+function displayed(el) {
+    var style = window.getComputedStyle(el);
+    return style.visibility !== 'hidden' && style.display !== 'none' && el.getClientRects().length > 0;
+}
+function present() {
+    return matches().some(function (el) { return !visibleOnly || displayed(el); });
+}
+var quietTimer = null, deadline = null, finished = false;
+var observer = new MutationObserver(function () {
+    if (present()) {
+        finish(true, true);
+    } else {
+        clearTimeout(quietTimer);
+        quietTimer = setTimeout(function () { finish(false, true); }, quietMs);
+    }
+});
+function finish(found, quiescent) {
+    if (finished) {
+        return;
+    }
+    finished = true;
+    observer.disconnect();
+    clearTimeout(quietTimer);
+    clearTimeout(deadline);
+    done({present: found, quiescent: quiescent, waitedMs: Date.now() - start});
+}
+if (present()) {
+    finish(true, true);
+} else {
+    observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+    quietTimer = setTimeout(function () { finish(false, true); }, quietMs);
+    deadline = setTimeout(function () { finish(present(), false); }, maxMs);
+}
+"""
+)
+
+# Installs window.__idleTracker (once per page), which counts pending fetch/XMLHttpRequest
+# calls and animation frames and records the time of the last DOM mutation. A frame
+# requested from inside a frame callback continues an animation loop and is not counted,
+# otherwise a page running a requestAnimationFrame loop would never settle; the DOM
+# writes of such a loop still keep the page busy through the mutation time.
+_IDLE_TRACKER = """
+var tracker = window.__idleTracker;
+if (!tracker) {
+    tracker = window.__idleTracker = {requests: 0, frames: 0, lastMutation: Date.now()};
+    var settle = function () { tracker.requests = Math.max(tracker.requests - 1, 0); };
+    if (window.fetch) {
+        var fetch = window.fetch;
+        window.fetch = function () {
+            tracker.requests++;
+            return fetch.apply(this, arguments).finally(settle);
+        };
+    }
+    var send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        tracker.requests++;
+        this.addEventListener('loadend', settle, {once: true});
+        return send.apply(this, arguments);
+    };
+    var frames = new Set(), inFrame = 0;
+    var requestFrame = window.requestAnimationFrame;
+    window.requestAnimationFrame = function (callback) {
+        var counted = inFrame === 0;
+        var id = requestFrame.call(window, function (time) {
+            frames.delete(id);
+            tracker.frames = frames.size;
+            inFrame++;
+            try {
+                callback(time);
+            } finally {
+                inFrame--;
+            }
+        });
+        if (counted) {
+            frames.add(id);
+            tracker.frames = frames.size;
+        }
+        return id;
+    };
+    var cancelFrame = window.cancelAnimationFrame;
+    window.cancelAnimationFrame = function (id) {
+        frames.delete(id);
+        tracker.frames = frames.size;
+        return cancelFrame.call(window, id);
+    };
+    new MutationObserver(function () { tracker.lastMutation = Date.now(); }).observe(
+        document, {childList: true, subtree: true, attributes: true, characterData: true}
+    );
+}
+"""
+
+# Synchronous, no arguments. Installs the idle tracker ahead of an action, so the
+# requests and frames the action starts are counted by the following WAIT_FOR_IDLE.
+INSTALL_IDLE_TRACKER = "/* installIdleTracker */" + _IDLE_TRACKER
+
+# Asynchronous. arguments[0]: quiet period in ms, arguments[1]: upper bound in ms.
+# Installs the idle tracker if INSTALL_IDLE_TRACKER has not run on this page. Resolves
+# once nothing is pending, the document has had no mutation for the quiet period and a
+# Vue nextTick (when the app exposes one) and a macrotask have run, so queued microtasks
+# and re-renders are flushed, to {"idle": bool, "waitedMs": int, "requests": int, "frames": int}.
+WAIT_FOR_IDLE = (
+    """/* waitForIdle */
+var quietMs = arguments[0], maxMs = arguments[1], done = arguments[arguments.length - 1];
+var start = Date.now();"""
+    + _IDLE_TRACKER
+    + """function nextTick() {
+    var root = document.querySelector('#app');
+    var app = root && root.__vue_app__;
+    var instance = app && app._instance && app._instance.proxy;
+    var vm = instance || (root && root.__vue__);
+    return vm && vm.$nextTick ? vm.$nextTick() : Promise.resolve();
+}
+function check() {
+    var now = Date.now();
+    var busy = tracker.requests > 0 || tracker.frames > 0 || now - tracker.lastMutation < quietMs;
+    if (busy && now - start < maxMs) {
+        setTimeout(check, Math.min(quietMs, 16));
+        return;
+    }
+    nextTick().then(function () {
+        setTimeout(function () {
+            var quiet = tracker.requests === 0 && tracker.frames === 0 && Date.now() - tracker.lastMutation >= quietMs;
+            if (!quiet && Date.now() - start < maxMs) {
+                check();
+                return;
+            }
+            done({idle: quiet, waitedMs: Date.now() - start, requests: tracker.requests, frames: tracker.frames});
+        }, 0);
+    });
+}
+check();
+"""
+)
+
+# arguments[0]: CSS selector of the header cart link, arguments[1]: CSS selector of the
+# total button, arguments[2]: ring buffer capacity.
+# Installs window.__cartObserver (once per page), a MutationObserver that pushes
+# {"count": int, "total": "$X.XX", "atMs": ms since install} into a ring buffer whenever
+# the header count or the total text changes; the oldest entries are dropped when the
+# buffer is full. Installing again on the same page restarts the recording with an empty
+# buffer. Returns the current {"count", "total", "atMs"}.
+INSTALL_CART_OBSERVER = """
+var countSelector = arguments[0], totalSelector = arguments[1], capacity = arguments[2];
+var observer = window.__cartObserver;
+function read() {
+    var link = document.querySelector(countSelector);
+    var button = document.querySelector(totalSelector);
+    var match = /\\((\\d+)\\)/.exec(link ? link.textContent : '');
+    return {
+        count: match ? parseInt(match[1], 10) : 0,
+        total: button ? button.textContent.replace(/^\\s*Total:\\s*/, '').trim() : '',
+        atMs: Math.round(performance.now() - observer.started)
+    };
+}
+if (!observer) {
+    observer = window.__cartObserver = {};
+    new MutationObserver(function () {
+        var state = read();
+        if (state.count === observer.last.count && state.total === observer.last.total) {
+            return;
+        }
+        observer.last = state;
+        observer.lastChange = Date.now();
+        observer.buffer.push(state);
+        if (observer.buffer.length > observer.capacity) {
+            observer.buffer.shift();
+            observer.dropped++;
+        }
+    }).observe(document, {childList: true, subtree: true, characterData: true});
+}
+observer.buffer = [];
+observer.dropped = 0;
+observer.capacity = capacity;
+observer.started = performance.now();
+observer.last = read();
+observer.lastChange = Date.now();
+return observer.last;
+"""
+
+# Asynchronous. arguments[0]: quiet period in ms, arguments[1]: upper bound in ms.
+# Waits until the observed values have not changed for the quiet period (and at least one
+# macrotask, so pending re-renders land), then empties the ring buffer of
+# window.__cartObserver and resolves to {"changes": [...], "dropped": int}, or to null
+# when the observer is not installed.
+DRAIN_CART_OBSERVER = """
+var quietMs = arguments[0], maxMs = arguments[1], done = arguments[arguments.length - 1];
+var observer = window.__cartObserver, start = Date.now();
+if (!observer) {
+    done(null);
+    return;
+}
+function drain() {
+    if (Date.now() - observer.lastChange < quietMs && Date.now() - start < maxMs) {
+        setTimeout(drain, 10);
+        return;
+    }
+    var result = {changes: observer.buffer.splice(0, observer.buffer.length), dropped: observer.dropped};
+    observer.dropped = 0;
+    done(result);
+}
+setTimeout(drain, 0);
+"""
+
+# Asynchronous. arguments[0]: upper bound in ms.
+# Double-clicks the name of every menu cup, waits until every name has changed, and
+# resolves to {name before: name after}. A second call switches the names back.
+TRANSLATE_ALL = """
+var maxMs = arguments[0], done = arguments[arguments.length - 1];
+var headings = Array.prototype.filter.call(document.querySelectorAll('li > h4'), function (h4) {
+    return h4.parentElement.querySelector('.cup-body');
+});
+function nameOf(h4) {
+    return h4.firstChild ? h4.firstChild.textContent.trim() : '';
+}
+var before = headings.map(nameOf);
+headings.forEach(function (h4) {
+    h4.dispatchEvent(new MouseEvent('dblclick', {bubbles: true, cancelable: true, view: window, detail: 2}));
+});
+var start = Date.now();
+function collect() {
+    var after = headings.map(nameOf);
+    var pending = after.some(function (name, i) { return name === before[i]; });
+    if (pending && Date.now() - start < maxMs) {
+        setTimeout(collect, 10);
+        return;
+    }
+    var names = {};
+    before.forEach(function (name, i) { names[name] = after[i]; });
+    done(names);
+}
+setTimeout(collect, 0);
+"""
+
+# Returns page performance metrics. On first use installs window.__webVitals, buffered
+# PerformanceObservers for largest-contentful-paint, layout-shift, event, longtask and paint
+# entries. Times are in ms relative to timeOrigin: {"url", "timeOrigin", "navigation": {...}
+# Navigation Timing of the document, "fcp", "lcp", "cls" (largest session window),
+# "inp" (longest interaction), "longTasks", "totalBlockingTime"}.
+COLLECT_WEB_VITALS = """
+var vitals = window.__webVitals;
+if (!vitals) {
+    vitals = window.__webVitals = {fcp: null, lcp: null, cls: 0, session: 0, sessionStart: 0, last: 0,
+                                   inp: 0, longTasks: 0, blocking: 0};
+    var observe = function (type, callback, options) {
+        try {
+            new PerformanceObserver(function (list) { list.getEntries().forEach(callback); })
+                .observe(Object.assign({type: type, buffered: true}, options || {}));
+        } catch (e) {
+            // Entry type not supported by this browser.
+        }
+    };
+    observe('paint', function (entry) {
+        if (entry.name === 'first-contentful-paint') {
+            vitals.fcp = entry.startTime;
+        }
+    });
+    observe('largest-contentful-paint', function (entry) { vitals.lcp = entry.startTime; });
+    observe('layout-shift', function (entry) {
+        if (entry.hadRecentInput) {
+            return;
+        }
+        if (entry.startTime - vitals.last > 1000 || entry.startTime - vitals.sessionStart > 5000) {
+            vitals.session = 0;
+            vitals.sessionStart = entry.startTime;
+        }
+        vitals.session += entry.value;
+        vitals.last = entry.startTime;
+        vitals.cls = Math.max(vitals.cls, vitals.session);
+    });
+    observe('event', function (entry) {
+        if (entry.interactionId) {
+            vitals.inp = Math.max(vitals.inp, entry.duration);
+        }
+    }, {durationThreshold: 16});
+    observe('longtask', function (entry) {
+        vitals.longTasks++;
+        vitals.blocking += Math.max(entry.duration - 50, 0);
+    });
+}
+var nav = performance.getEntriesByType('navigation')[0];
+var round = function (value) { return value === null ? null : Math.round(value * 10) / 10; };
+return {
+    url: location.href,
+    timeOrigin: performance.timeOrigin,
+    navigation: nav ? {
+        type: nav.type,
+        ttfb: round(nav.responseStart - nav.startTime),
+        domContentLoaded: round(nav.domContentLoadedEventEnd - nav.startTime),
+        load: round(nav.loadEventEnd - nav.startTime),
+        transferSize: nav.transferSize
+    } : null,
+    fcp: round(vitals.fcp),
+    lcp: round(vitals.lcp),
+    cls: Math.round(vitals.cls * 10000) / 10000,
+    inp: round(vitals.inp),
+    longTasks: vitals.longTasks,
+    totalBlockingTime: round(vitals.blocking)
+};
+"""
+
+# arguments[0]: the list element holding the cups. Returns {"scale": devicePixelRatio,
+# "cups": [{"name", "x", "y", "width", "height"}]}, boxes in CSS pixels relative to the list.
+CUP_RECTS = """
+var list = arguments[0];
+var origin = list.getBoundingClientRect();
+var cups = [];
+Array.prototype.forEach.call(list.children, function (li) {
+    var h4 = li.querySelector('h4');
+    if (!h4) {
+        return;
+    }
+    var rect = li.getBoundingClientRect();
+    cups.push({
+        name: h4.firstChild ? h4.firstChild.textContent.trim() : '',
+        x: rect.left - origin.left,
+        y: rect.top - origin.top,
+        width: rect.width,
+        height: rect.height
+    });
+});
+return {scale: window.devicePixelRatio || 1, cups: cups};
+"""
+
+# arguments: locator strategy (see _FIND_ALL) and value of the root, attribute names,
+# computed style properties. Returns the pruned subtree {"tag", "attrs", "text" (own text, whitespace
+# collapsed), "styles", "children"}, or null if nothing matches. Script, style and
+# template elements are left out, and SVG content is not descended into.
+SNAPSHOT_DOM = (
+    """/* snapshotDom */
+var using = arguments[0], value = arguments[1], attributes = arguments[2], styles = arguments[3];"""
+    + _FIND_ALL
+    + """var root = findAll(using, value)[0];
+var skipped = {SCRIPT: true, STYLE: true, NOSCRIPT: true, TEMPLATE: true};
+function snapshot(el) {
+    var node = {tag: el.tagName.toLowerCase(), attrs: {}, text: '', styles: {}, children: []};
+    attributes.forEach(function (name) {
+        if (el.hasAttribute(name)) {
+            node.attrs[name] = el.getAttribute(name);
+        }
+    });
+    if (styles.length) {
+        var computed = window.getComputedStyle(el);
+        styles.forEach(function (name) { node.styles[name] = computed.getPropertyValue(name); });
+    }
+    var text = [];
+    for (var child = el.firstChild; child; child = child.nextSibling) {
+        if (child.nodeType === Node.TEXT_NODE) {
+            text.push(child.data);
+        } else if (child.nodeType === Node.ELEMENT_NODE && !skipped[child.tagName] && node.tag !== 'svg') {
+            node.children.push(snapshot(child));
+        }
+    }
+    node.text = text.join(' ').replace(/\\s+/g, ' ').trim();
+    return node;
+}
+return root ? snapshot(root) : null;
+"""
+)
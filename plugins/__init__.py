@@ -0,0 +1 @@
+"""Pytest plugins of the test automation project, registered in conftest.py."""
@@ -0,0 +1,43 @@
+"""Pytest plugin switching the ``driver`` fixture between live, record and replay modes.
+
+Each test that uses the ``driver`` fixture gets its own recording, started before its
+function-scoped fixtures and finished after its teardown, see
+``utilities.driver_recording``.
+"""
+
+import pytest
+
+from utilities.driver_recording import DRIVER_MODES, driver_recorder
+from utilities.test_scheduler import base_node_id
+
+
+def pytest_addoption(parser):
+    """Add the driver mode command line option."""
+    group = parser.getgroup("driver-recording")
+    group.addoption(
+        "--driver-mode",
+        choices=DRIVER_MODES,
+        default=None,
+        help="run against the browser, record WebDriver traffic or replay it without a browser (default: DRIVER_MODE)",
+    )
+
+
+def pytest_configure(config):
+    """Apply the command line option."""
+    if config.getoption("--driver-mode"):
+        driver_recorder.mode = config.getoption("--driver-mode")
+
+
+@pytest.fixture(autouse=True)
+def _driver_recording(request):
+    """Record or replay the WebDriver commands of the test."""
+    if driver_recorder.mode == "live" or "driver" not in request.fixturenames:
+        yield
+        return
+    test_id = base_node_id(request.node.nodeid)
+    if driver_recorder.mode == "replay" and not driver_recorder.has_recording(test_id):
+        pytest.skip(f"no WebDriver recording for {test_id}")
+
+    driver_recorder.start(test_id)
+    yield
+    driver_recorder.stop()
@@ -0,0 +1,100 @@
+"""Pytest plugin intercepting the browser's network requests during tests.
+
+With ``NETWORK_INTERCEPTION=on`` the browser session of the ``driver`` fixture
+blocks the third-party requests listed in ``NETWORK_BLOCK`` and answers repeated
+static asset requests from a response cache, see ``utilities.network_interception``.
+The cache lives in the pytest cache directory, so it is shared by pytest-xdist
+workers and kept between runs, see ``utilities.asset_cache``.
+Tests adjust the rules with the ``network`` marker::
+
+    @pytest.mark.network(allow=["*?ad=1*"])          # let the advertising assets load
+    @pytest.mark.network(block=["*/api/*"], cache=False)
+    @pytest.mark.network(intercept=False)            # plain network for this test
+"""
+
+import weakref
+
+import pytest
+
+from config.resources import NETWORK_INTERCEPTION
+from utilities.asset_cache import DiskResponseCache
+from utilities.driver_recording import driver_recorder
+from utilities.network_interception import NetworkInterceptor, NetworkRules, ResponseCache, default_rules
+
+_cache = ResponseCache()
+_interceptors: "weakref.WeakKeyDictionary[object, NetworkInterceptor]" = weakref.WeakKeyDictionary()
+_enabled = NETWORK_INTERCEPTION == "on"
+
+
+def pytest_addoption(parser):
+    """Add the network interception command line option."""
+    group = parser.getgroup("network")
+    group.addoption(
+        "--network-interception",
+        choices=("on", "off"),
+        default=None,
+        help="block third-party requests and cache static assets (default: NETWORK_INTERCEPTION)",
+    )
+
+
+def pytest_configure(config):
+    """Register the marker, apply the command line option and share static assets through the pytest cache."""
+    global _enabled, _cache
+    config.addinivalue_line(
+        "markers",
+        "network(block=(), allow=(), cache=True, intercept=True): "
+        "extra blocked and allowed URL patterns and static asset caching for the test's browser requests",
+    )
+    if config.getoption("--network-interception"):
+        _enabled = config.getoption("--network-interception") == "on"
+    cache = getattr(config, "cache", None)
+    if cache is not None:
+        _cache = DiskResponseCache(cache.mkdir("asset_cache"))
+
+
+def rules_for(marker) -> NetworkRules:
+    """Return the rules of a test: the defaults extended by its ``network`` marker, if any."""
+    rules = default_rules()
+    if marker is None:
+        return rules
+    if not marker.kwargs.get("intercept", True):
+        return NetworkRules(cache=False)
+    return NetworkRules(
+        block=rules.block + tuple(marker.kwargs.get("block", ())),
+        allow=tuple(marker.kwargs.get("allow", ())),
+        cache=marker.kwargs.get("cache", rules.cache),
+    )
+
+
+@pytest.fixture(autouse=True)
+def network_interception(request):
+    """Apply the test's network rules to the browser session of the ``driver`` fixture."""
+    if not _enabled or "driver" not in request.fixturenames or driver_recorder.mode == "replay":
+        yield None
+        return
+    driver = request.getfixturevalue("driver")
+    interceptor = _interceptors.get(driver)
+    if interceptor is None:
+        interceptor = _interceptors[driver] = NetworkInterceptor(driver, _cache)
+    if not interceptor.start():
+        yield None
+        return
+    interceptor.rules = rules_for(request.node.get_closest_marker("network"))
+    yield interceptor
+    interceptor.rules = default_rules()
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Stop the interceptors at the end of the session."""
+    for interceptor in list(_interceptors.values()):
+        interceptor.stop()
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Report blocked requests and static asset cache use."""
+    blocked = sum(interceptor.blocked for interceptor in _interceptors.values())
+    if blocked or _cache.stored:
+        terminalreporter.write_line(
+            f"network: {blocked} requests blocked, {_cache.stored} static assets cached, "
+            f"{_cache.hits} served from cache"
+        )
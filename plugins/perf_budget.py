@@ -0,0 +1,82 @@
+"""Pytest plugin enforcing performance budgets on whole tests.
+
+Tests marked with ``@pytest.mark.perf_budget(max_commands=..., max_ms=...)`` have the
+WebDriver commands and wall time of their call phase checked against the budget
+baseline, see ``utilities.perf_budget``. Under pytest-xdist the workers send their
+observed values to the controller, which alone writes the baseline.
+"""
+
+import time
+
+import pytest
+
+from utilities.perf_budget import BUDGET_MODES, Budget, perf_budgets
+from utilities.webdriver_metrics import get_command_counter
+
+
+def pytest_addoption(parser):
+    """Add performance budget command line options."""
+    group = parser.getgroup("perf-budget")
+    group.addoption(
+        "--update-perf-budgets",
+        action="store_true",
+        default=False,
+        help="record observed values into the performance budget baseline instead of enforcing it",
+    )
+    group.addoption(
+        "--perf-budget-mode",
+        choices=BUDGET_MODES,
+        default=None,
+        help="fail or warn when a command count budget is exceeded (default: PERF_BUDGET_MODE)",
+    )
+    group.addoption(
+        "--perf-budget-time-mode",
+        choices=BUDGET_MODES,
+        default=None,
+        help="fail or warn when a wall time budget is exceeded (default: PERF_BUDGET_TIME_MODE)",
+    )
+
+
+def pytest_configure(config):
+    """Register the marker and apply command line options."""
+    config.addinivalue_line(
+        "markers", "perf_budget(max_commands=None, max_ms=None): limit WebDriver commands and wall time of a test"
+    )
+    perf_budgets.update = config.getoption("--update-perf-budgets")
+    if config.getoption("--perf-budget-mode"):
+        perf_budgets.mode = config.getoption("--perf-budget-mode")
+    if config.getoption("--perf-budget-time-mode"):
+        perf_budgets.time_mode = config.getoption("--perf-budget-time-mode")
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    """Measure the call phase of budgeted tests and check it against the budget."""
+    marker = item.get_closest_marker("perf_budget")
+    driver = item.funcargs.get("driver") if marker else None
+    if driver is None:
+        return (yield)
+
+    counter = get_command_counter(driver)
+    commands_before = counter.total
+    start = time.perf_counter()
+    result = yield
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    perf_budgets.check(item.nodeid, counter.total - commands_before, elapsed_ms, Budget(**marker.kwargs))
+    return result
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Collect the values observed by a finished xdist worker."""
+    perf_budgets.merge(getattr(node, "workeroutput", {}).get("perf_budgets", {}))
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Write observed values to the baseline when updating it; xdist workers hand them to the controller."""
+    workeroutput = getattr(session.config, "workeroutput", None)
+    if workeroutput is not None:
+        workeroutput["perf_budgets"] = {key: tuple(value) for key, value in perf_budgets.observed.items()}
+        return
+    if perf_budgets.update and perf_budgets.observed:
+        perf_budgets.save()
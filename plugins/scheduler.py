@@ -0,0 +1,80 @@
+"""Pytest plugin scheduling tests over pytest-xdist workers by recorded duration.
+
+Every run stores the duration of each test (setup, call and teardown) in the pytest
+cache. With ``--lpt`` and ``-n N`` the tests are split into one ``xdist_group`` per
+worker by longest-processing-time-first, see ``utilities.test_scheduler``, and run
+with ``--dist loadgroup`` so every worker receives exactly one group.
+"""
+
+import pytest
+
+from utilities.test_scheduler import ScheduledTest, assign_lpt, base_node_id, estimate_durations
+
+CACHE_KEY = "scheduler/durations"
+GROUP_PREFIX = "lpt-"
+
+_durations = {}
+
+
+def pytest_addoption(parser):
+    """Add the scheduler command line option."""
+    group = parser.getgroup("scheduler")
+    group.addoption(
+        "--lpt",
+        action="store_true",
+        default=False,
+        help="assign tests to xdist workers longest-first using recorded durations (implies --dist loadgroup)",
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    """Switch xdist to group distribution when scheduling is requested."""
+    if not config.getoption("--lpt"):
+        return
+    if hasattr(config, "workerinput"):
+        config.option.loadgroup = True
+    elif getattr(config.option, "dist", "no") != "no":
+        config.option.dist = "loadgroup"
+
+
+def affinity_key(item) -> tuple:
+    """Return the driver fixtures a test uses; tests with the same key share a worker where possible."""
+    return tuple(sorted(name for name in item.fixturenames if name.startswith("driver")))
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(session, config, items):
+    """Order the tests by worker and mark each with its worker group."""
+    workerinput = getattr(config, "workerinput", None)
+    if not config.getoption("--lpt") or workerinput is None or workerinput["workercount"] < 2:
+        return
+
+    cache = getattr(config, "cache", None)
+    recorded = cache.get(CACHE_KEY, {}) if cache is not None else {}
+    durations = estimate_durations([item.nodeid for item in items], recorded)
+    by_id = {item.nodeid: item for item in items}
+    tests = [ScheduledTest(item.nodeid, durations[item.nodeid], affinity_key(item)) for item in items]
+
+    items[:] = []
+    for worker, node_ids in enumerate(assign_lpt(tests, workerinput["workercount"])):
+        for node_id in node_ids:
+            item = by_id[node_id]
+            item.add_marker(pytest.mark.xdist_group(f"{GROUP_PREFIX}{worker}"))
+            items.append(item)
+
+
+def pytest_runtest_logreport(report):
+    """Accumulate the duration of every test phase."""
+    node_id = base_node_id(report.nodeid)
+    _durations[node_id] = _durations.get(node_id, 0.0) + report.duration
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Merge the measured durations into the stored ones."""
+    cache = getattr(session.config, "cache", None)
+    if cache is None or hasattr(session.config, "workerinput") or not _durations:
+        return
+    durations = cache.get(CACHE_KEY, {})
+    durations.update({node_id: round(duration, 3) for node_id, duration in _durations.items()})
+    cache.set(CACHE_KEY, durations)
@@ -0,0 +1,104 @@
+"""Pytest plugin recording test impact and selecting tests affected by changes.
+
+Runs started with ``--impact-trace`` store which page-object functions each executed
+test called in the pytest cache. ``--impacted`` then runs only the tests affected by the files changed
+against ``--impacted-base`` (uncommitted and untracked files included), and
+``--impacted-by`` names the changed files explicitly.
+"""
+
+import subprocess
+
+import pytest
+
+from utilities.test_impact import ImpactTracer, changed_files, impacted_tests
+from utilities.test_scheduler import base_node_id
+
+CACHE_KEY = "test_impact/map"
+
+_tracer = ImpactTracer()
+_observed = {}
+
+
+def pytest_addoption(parser):
+    """Add test impact command line options."""
+    group = parser.getgroup("test-impact")
+    group.addoption(
+        "--impacted",
+        action="store_true",
+        default=False,
+        help="run only tests affected by files changed against --impacted-base",
+    )
+    group.addoption(
+        "--impacted-base", default="HEAD", help="git revision the changes are computed against (default: HEAD)"
+    )
+    group.addoption(
+        "--impacted-by",
+        action="append",
+        default=[],
+        metavar="PATH",
+        help="run only tests affected by this changed file; may be repeated",
+    )
+    group.addoption(
+        "--impact-trace",
+        action="store_true",
+        default=False,
+        help="record which page-object code the tests call, refreshing the map --impacted selects from",
+    )
+
+
+def _load_map(config) -> dict:
+    cache = getattr(config, "cache", None)
+    return cache.get(CACHE_KEY, {}) if cache is not None else {}
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(session, config, items):
+    """Deselect tests not affected by the changed files."""
+    changed = list(config.getoption("--impacted-by"))
+    if config.getoption("--impacted"):
+        try:
+            changed += changed_files(config.getoption("--impacted-base"), config.rootpath)
+        except (OSError, subprocess.CalledProcessError) as e:
+            raise pytest.UsageError(f"--impacted: cannot list changed files: {e}")
+    if not changed:
+        return
+
+    selected = impacted_tests((base_node_id(item.nodeid) for item in items), _load_map(config), changed)
+    if selected is None:
+        return
+    deselected = [item for item in items if base_node_id(item.nodeid) not in selected]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = [item for item in items if base_node_id(item.nodeid) in selected]
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    """Trace the page-object code called during setup, call and teardown of the test."""
+    if not item.config.getoption("--impact-trace") or not _tracer.start():
+        yield
+        return
+    try:
+        yield
+    finally:
+        _observed[base_node_id(item.nodeid)] = _tracer.stop()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Collect the tests traced by a finished pytest-xdist worker."""
+    _observed.update(getattr(node, "workeroutput", {}).get("test_impact", {}))
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Merge the traced tests into the stored impact map."""
+    workeroutput = getattr(session.config, "workeroutput", None)
+    if workeroutput is not None:
+        workeroutput["test_impact"] = dict(_observed)
+        return
+    cache = getattr(session.config, "cache", None)
+    if cache is None or not _observed:
+        return
+    impact_map = _load_map(session.config)
+    impact_map.update(_observed)
+    cache.set(CACHE_KEY, impact_map)
@@ -0,0 +1,84 @@
+"""Pytest plugin for visual regression checks against baseline images.
+
+Tests request the ``visual_baselines`` fixture and pass it their captures, see
+``utilities.visual_regression``; they are marked ``visual`` and run only with
+``--visual`` or ``--update-visual-baselines``. The browser window is set to
+``VISUAL_WINDOW_SIZE`` first, so captures do not depend on the machine. A test whose
+captures have no baseline is skipped with the missing names, unless
+``--update-visual-baselines`` writes them; baselines written in the run are listed in
+the terminal summary.
+"""
+
+import pytest
+
+from config.resources import VISUAL_WINDOW_SIZE
+from utilities.visual_regression import VisualBaselines
+
+_written = []
+
+
+def pytest_addoption(parser):
+    """Add the visual baseline command line option."""
+    group = parser.getgroup("visual")
+    group.addoption(
+        "--visual",
+        action="store_true",
+        default=False,
+        help="run the visual checks marked visual against the committed baselines",
+    )
+    group.addoption(
+        "--update-visual-baselines",
+        action="store_true",
+        default=False,
+        help="write the visual baselines from this run's captures instead of checking them",
+    )
+
+
+def pytest_configure(config):
+    """Register the marker."""
+    config.addinivalue_line("markers", "visual: compares screenshots with baseline images, run with --visual")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip the visual checks unless they were asked for."""
+    if config.getoption("--visual") or config.getoption("--update-visual-baselines"):
+        return
+    skip = pytest.mark.skip(reason="visual checks run only with --visual or --update-visual-baselines")
+    for item in items:
+        if item.get_closest_marker("visual"):
+            item.add_marker(skip)
+
+
+@pytest.fixture
+def visual_baselines(request):
+    """Return the visual baselines, checked or rewritten depending on the command line.
+
+    A test using the ``driver`` fixture has its window set to ``VISUAL_WINDOW_SIZE``.
+    """
+    if "driver" in request.fixturenames:
+        width, height = (int(size) for size in VISUAL_WINDOW_SIZE.lower().split("x"))
+        request.getfixturevalue("driver").set_window_size(width, height)
+    baselines = VisualBaselines(update=request.config.getoption("--update-visual-baselines"), on_missing=pytest.skip)
+    yield baselines
+    _written.extend(baselines.written)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Collect the baselines written by a pytest-xdist worker."""
+    _written.extend(getattr(node, "workeroutput", {}).get("visual_baselines_written", []))
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Hand the written baselines to the controller on a pytest-xdist worker."""
+    workeroutput = getattr(session.config, "workeroutput", None)
+    if workeroutput is not None:
+        workeroutput["visual_baselines_written"] = list(_written)
+
+
+def pytest_terminal_summary(terminalreporter):
+    """List the baselines written in this run."""
+    if _written:
+        terminalreporter.write_sep("=", "visual baselines written")
+        for name in sorted(_written):
+            terminalreporter.write_line(name)
@@ -0,0 +1,70 @@
+"""Pytest plugin keeping wait telemetry between runs and reporting flaky waits.
+
+Success times of the named page-object waits are stored in the pytest cache and
+loaded at the start of the next run to derive the expected time of each wait, see
+``utilities.wait_telemetry``. Waits that ran over their expected time or timed out
+are listed in the terminal summary.
+"""
+
+import pytest
+
+from utilities.driver_recording import driver_recorder
+from utilities.wait_telemetry import WAIT_TIMEOUT_MODES, wait_telemetry
+
+CACHE_KEY = "wait_telemetry/samples"
+
+
+def pytest_addoption(parser):
+    """Add the wait timeout command line option."""
+    group = parser.getgroup("wait-telemetry")
+    group.addoption(
+        "--wait-timeouts",
+        choices=WAIT_TIMEOUT_MODES,
+        default=None,
+        help="report waits slower than their recorded times (adaptive) or only timeouts (fixed) "
+        "(default: WAIT_TIMEOUT_MODE)",
+    )
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_configure(config):
+    """Apply the command line option and load the stored samples.
+
+    Recorded and replayed runs do not report late waits, since replayed times are not
+    real; replayed waits are not recorded.
+    """
+    if config.getoption("--wait-timeouts"):
+        wait_telemetry.mode = config.getoption("--wait-timeouts")
+    if driver_recorder.mode != "live":
+        wait_telemetry.mode = "fixed"
+    wait_telemetry.recording = driver_recorder.mode != "replay"
+    cache = getattr(config, "cache", None)
+    if cache is not None:
+        wait_telemetry.load(cache.get(CACHE_KEY, {}))
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Merge the telemetry collected by a pytest-xdist worker."""
+    wait_telemetry.merge(getattr(node, "workeroutput", {}).get("wait_telemetry", {}))
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Store the samples, or hand them to the controller on a pytest-xdist worker."""
+    workeroutput = getattr(session.config, "workeroutput", None)
+    if workeroutput is not None:
+        workeroutput["wait_telemetry"] = wait_telemetry.export()
+        return
+    cache = getattr(session.config, "cache", None)
+    if cache is not None and wait_telemetry.observed:
+        cache.set(CACHE_KEY, wait_telemetry.stored())
+
+
+def pytest_terminal_summary(terminalreporter):
+    """List the waits that ran late or timed out."""
+    lines = wait_telemetry.summary()
+    if not lines:
+        return
+    terminalreporter.write_sep("=", "flaky waits")
+    for line in lines:
+        terminalreporter.write_line(line)
@@ -0,0 +1,56 @@
+"""Pytest plugin collecting the app's Web Vitals per test.
+
+Page objects record the metrics after navigations and key interactions, see
+``utilities.web_vitals``; this plugin adds a last reading when a test's call phase
+ends and reports where the records were written.
+"""
+
+import pytest
+
+from utilities.web_vitals import web_vitals
+
+
+def pytest_addoption(parser):
+    """Add the Web Vitals command line option."""
+    group = parser.getgroup("web-vitals")
+    group.addoption(
+        "--web-vitals",
+        metavar="PATH",
+        default=None,
+        help="append the app's Web Vitals per test to this JSON-lines file (default: WEB_VITALS_FILE)",
+    )
+
+
+def pytest_configure(config):
+    """Apply the command line option."""
+    if config.getoption("--web-vitals"):
+        web_vitals.path = config.getoption("--web-vitals")
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    """Record the metrics of the page the test ended on."""
+    result = yield
+    driver = item.funcargs.get("driver") if web_vitals.enabled else None
+    if driver is not None:
+        web_vitals.record(driver, "test finished")
+    return result
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Count the records written by a pytest-xdist worker."""
+    web_vitals.records += getattr(node, "workeroutput", {}).get("web_vitals_records", 0)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Hand the record count to the controller on a pytest-xdist worker."""
+    workeroutput = getattr(session.config, "workeroutput", None)
+    if workeroutput is not None:
+        workeroutput["web_vitals_records"] = web_vitals.records
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Report where the records were written."""
+    if web_vitals.records:
+        terminalreporter.write_line(f"web vitals: {web_vitals.records} records appended to {web_vitals.path}")
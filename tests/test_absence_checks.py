@@ -0,0 +1,62 @@
+import pytest
+from selenium.webdriver.common.by import By
+
+from pages.cart_page import CartPage
+from pages.menu_page import MenuPage
+from utilities.fake_webdriver import FakeWebDriver
+from utilities.fake_webdriver.fake_app import APP_HTML, FakeCoffeeCart
+
+HTML = """
+<div id="app">
+  <ul><li><a href="/">menu</a></li><li><a href="/cart">cart (0)</a></li></ul>
+  <div class="promo" style="display: none;"><span>Get an extra cup of Mocha for $4.</span></div>
+  <div class="list"><p>No coffee, go add some.</p></div>
+</div>
+"""
+
+
+def test_absence_checks_use_the_in_page_primitive():
+    """Test absence checks honour visibility and XPath locators."""
+    driver = FakeWebDriver(HTML)
+    menu_page = MenuPage(driver)
+
+    assert menu_page.is_promo_absent()
+    assert not menu_page.is_absent(menu_page.locators["promo"], displayed=False)
+    assert not CartPage(driver).is_empty_cart_absent()
+
+    driver.remove_attribute(driver.query_selector(".promo"), "style")
+    driver.set_text(driver.query_selector("div.list"), "")
+
+    assert not menu_page.is_promo_absent()
+    assert CartPage(driver).is_empty_cart_absent()
+
+
+def test_absence_checks_support_link_text_locators():
+    """Test link text locators are evaluated in the page and unknown strategies are rejected."""
+    menu_page = MenuPage(FakeWebDriver(HTML))
+
+    assert not menu_page.is_absent((By.LINK_TEXT, "cart (0)"))
+    assert not menu_page.is_absent((By.PARTIAL_LINK_TEXT, "cart"))
+    assert menu_page.is_absent((By.LINK_TEXT, "cart"))
+    assert menu_page.snapshot_dom((By.PARTIAL_LINK_TEXT, "menu")).tag == "a"
+    with pytest.raises(ValueError, match="cannot be evaluated in the page"):
+        menu_page.is_absent(("-android uiautomator", "new UiSelector()"))
+
+
+def test_wait_for_idle_after_click():
+    """Test actions can wait for the app to settle after a click."""
+    driver = FakeWebDriver(APP_HTML)
+    FakeCoffeeCart(driver)
+    menu_page = MenuPage(driver)
+    commands = []
+    execute = driver.execute
+
+    def spy(command, params=None):
+        commands.append(params["script"].split("\n")[0] if command.startswith("w3cExecuteScript") else command)
+        return execute(command, params)
+
+    driver.execute = spy
+
+    assert menu_page.click_on_cup_by_name("Espresso", wait_for_idle=True).get_nav_cart_count() == "(1)"
+    assert commands.index("/* installIdleTracker */") < commands.index("clickElement")
+    assert menu_page.wait_for_idle()
@@ -0,0 +1,8 @@
+def test_add_to_cart_in_one_operation(driver_menu_page):
+    """Test adding several drinks at once updates the header count, total and cart snapshot."""
+    menu_page = driver_menu_page
+    snapshot = menu_page.add_to_cart({"Espresso": 3, "Mocha": 2})
+
+    assert snapshot == {"Espresso": 3, "Mocha": 2}
+    assert menu_page.get_nav_cart_count() == "(5)"
+    assert menu_page.pay().get_total_amount() == 46.0
@@ -0,0 +1,80 @@
+import base64
+import os
+import time
+
+from utilities.asset_cache import DiskResponseCache, freshness
+from utilities.network_interception import CachedResponse
+
+APP_JS = "https://coffee-cart.app/js/app.3f9a2b1c.js"
+FRESH = [("Cache-Control", "public, max-age=600")]
+
+
+def response(body: bytes, headers=(("Content-Type", "text/javascript"),), status: int = 200) -> CachedResponse:
+    return CachedResponse(status, list(headers), base64.b64encode(body).decode("ascii"))
+
+
+def test_entries_are_shared_between_cache_instances(tmp_path):
+    """Test a response stored by one session is served to another one using the same directory."""
+    DiskResponseCache(tmp_path).put(APP_JS, response(b"console.log(1)"))
+    cache = DiskResponseCache(tmp_path)
+
+    assert APP_JS in cache
+    cached = cache.get(APP_JS)
+    assert base64.b64decode(cached.body) == b"console.log(1)"
+    assert cached.headers == [("Content-Type", "text/javascript")]
+    assert cache.hits == 1
+
+
+def test_damaged_or_uncacheable_entries_are_not_served(tmp_path):
+    """Test bodies failing their hash are dropped and no-store or failed responses are not kept."""
+    cache = DiskResponseCache(tmp_path)
+    cache.put(APP_JS, response(b"console.log(1)"))
+    next(tmp_path.glob("*.body")).write_bytes(b"console.log(2)")
+    cache.put("https://coffee-cart.app/api.1a2b3c4d.js", response(b"x", [("Cache-Control", "no-store")]))
+    cache.put("https://coffee-cart.app/missing.js", response(b"", status=404))
+
+    assert cache.get(APP_JS) is None
+    assert APP_JS not in cache
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    """Test the cache stays under its size by evicting the entries read longest ago."""
+    cache = DiskResponseCache(tmp_path, max_bytes=25)
+    for age, name in enumerate(["a.png", "b.png"]):
+        cache.put(f"https://coffee-cart.app/{name}", response(b"x" * 10, FRESH))
+        meta = next(path for path in tmp_path.glob("*.json") if name in path.read_text())
+        os.utime(meta, (1000 + age, 1000 + age))
+    cache.get("https://coffee-cart.app/a.png")
+
+    cache.put("https://coffee-cart.app/c.png", response(b"x" * 10, FRESH))
+
+    assert "https://coffee-cart.app/b.png" not in cache
+    assert "https://coffee-cart.app/a.png" in cache and "https://coffee-cart.app/c.png" in cache
+    assert cache.evicted == 1
+
+
+def test_responses_are_served_only_while_fresh(tmp_path, monkeypatch):
+    """Test unhashed assets follow their freshness headers and are asked for again once stale."""
+    cache = DiskResponseCache(tmp_path)
+    cache.put("https://coffee-cart.app/js/app.js", response(b"old"))
+    cache.put("https://coffee-cart.app/css/app.css", response(b"a", [("Cache-Control", "no-cache")]))
+    cache.put("https://coffee-cart.app/img/cup.png", response(b"png", FRESH))
+
+    assert "https://coffee-cart.app/js/app.js" not in cache
+    assert "https://coffee-cart.app/css/app.css" not in cache
+    assert cache.get("https://coffee-cart.app/img/cup.png") is not None
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 601)
+    assert cache.get("https://coffee-cart.app/img/cup.png") is None
+
+
+def test_freshness_of_response_headers():
+    """Test max-age wins over Expires, which counts from the response's Date."""
+    expires = [("Date", "Mon, 19 Oct 2026 10:00:00 GMT"), ("Expires", "Mon, 19 Oct 2026 10:05:00 GMT")]
+
+    assert freshness("https://coffee-cart.app/app.js", expires) == 300
+    assert freshness("https://coffee-cart.app/app.js", expires + [("Cache-Control", "max-age=60")]) == 60
+    assert freshness("https://coffee-cart.app/app.js", [("Cache-Control", "private, max-age=60")]) == 0
+    assert freshness(APP_JS, []) == float("inf")
@@ -1,5 +1,4 @@
 import allure
-from selenium.webdriver.common.by import By
 
 
 @allure.feature("Cart")
@@ -7,17 +6,10 @@ from selenium.webdriver.common.by import By
 def test_cart_count_updates(driver_menu_page):
     """Verify cart count in header updates when adding items."""
     menu_page = driver_menu_page
-    driver = menu_page.driver
+    cart_observer = menu_page.observe_cart()
 
-    def get_cart_count():
-        cart_text = driver.find_element(By.CSS_SELECTOR, "#app ul li:nth-child(2) a").text
-        return int(cart_text.strip().split("(")[1].split(")")[0])
-
-    menu_page.click_on_cup_by_name("Espresso")
-    assert get_cart_count() == 1
-
-    menu_page.click_on_cup_by_name("Cappuccino")
-    assert get_cart_count() == 2
+    menu_page.click_on_cup_by_name("Espresso").click_on_cup_by_name("Cappuccino")
+    assert cart_observer.counts() == [1, 2]
 
 
 @allure.feature("Cart")
@@ -46,4 +38,4 @@ def test_non_empty_cart(driver_menu_page):
     """Verify empty cart message is not displayed when cart has items."""
     menu_page = driver_menu_page
     cart_page = menu_page.click_on_cup_by_name("Cappuccino").click_on_cup_by_name("Espresso").go_to_cart_page()
-    assert not cart_page.is_empty_cart_displayed()
+    assert cart_page.is_empty_cart_absent()
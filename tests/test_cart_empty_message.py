@@ -21,4 +21,4 @@ def test_non_empty_cart(driver_menu_page):
     """Test verify empty cart message is not displayed when non-empty cart."""
     menu_page = driver_menu_page
     cart_page = menu_page.click_on_cup_by_name("Cappuccino").click_on_cup_by_name("Espresso").go_to_cart_page()
-    assert not cart_page.is_empty_cart_displayed()
+    assert cart_page.is_empty_cart_absent()
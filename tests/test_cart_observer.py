@@ -0,0 +1,42 @@
+from pages.components.cart_observer_component import CartState
+from pages.menu_page import MenuPage
+from utilities.fake_webdriver import FakeWebDriver
+from utilities.fake_webdriver.fake_app import APP_HTML, FakeCoffeeCart
+from utilities.webdriver_metrics import get_command_counter
+
+
+def test_cart_observer_drains_burst_of_changes():
+    """Test one drain returns every count and total change of a burst of clicks, oldest first."""
+    driver = FakeWebDriver(APP_HTML)
+    FakeCoffeeCart(driver)
+    menu_page = MenuPage(driver)
+    cart_observer = menu_page.observe_cart(capacity=2)
+
+    assert cart_observer.initial == CartState(0, "$0.00", 0)
+    menu_page.click_on_cup_by_name("Espresso").click_on_cup_by_name("Espresso")
+    assert cart_observer.counts() == [1, 2]
+
+    menu_page.add_to_cart({"Mocha": 1, "Cappuccino": 2})
+    assert cart_observer.totals() == ["$47.00", "$66.00"]
+    assert cart_observer.dropped == 1
+    assert cart_observer.drain() == []
+
+
+def test_observing_again_restarts_the_recording():
+    """Test a second observe_cart on the same page drops undrained changes and costs one script call."""
+    driver = FakeWebDriver(APP_HTML)
+    FakeCoffeeCart(driver)
+    menu_page = MenuPage(driver)
+    menu_page.observe_cart(capacity=1)
+    menu_page.click_on_cup_by_name("Espresso").click_on_cup_by_name("Espresso")
+    counter = get_command_counter(driver)
+    commands_before = counter.total
+
+    cart_observer = menu_page.observe_cart()
+
+    assert counter.total - commands_before == 1
+    assert cart_observer.initial == CartState(2, "$20.00", 0)
+    assert cart_observer.drain() == []
+    assert cart_observer.dropped == 0
+    menu_page.click_on_cup_by_name("Espresso")
+    assert cart_observer.counts() == [3]
@@ -0,0 +1,10 @@
+import pytest
+
+
+@pytest.mark.visual
+def test_cups_render_like_baseline(driver_menu_page, visual_baselines):
+    """Test all cups on the menu render like their baselines, captured in one screenshot."""
+    cups = driver_menu_page.capture_cups()
+
+    assert len(cups) == 9
+    visual_baselines.check_all({f"menu/{name}": image for name, image in cups.items()})
@@ -0,0 +1,74 @@
+import pytest
+
+from pages.menu_page import MenuPage
+from utilities.dom_diff import DomChange, DomNode
+from utilities.fake_webdriver import FakeWebDriver
+from utilities.fake_webdriver.fake_app import APP_HTML, FakeCoffeeCart
+
+
+def node(tag, children=(), text="", **attrs):
+    """Return a snapshot node without styles."""
+    return DomNode(
+        tag, {name.rstrip("_").replace("_", "-"): value for name, value in attrs.items()}, text, {}, tuple(children)
+    )
+
+
+def test_diff_aligns_inserted_siblings():
+    """Test an inserted element is one addition, not a change of every later sibling."""
+    before = node("ul", [node("li", text="Espresso", class_="item"), node("li", text="Mocha", class_="item")])
+    after = node(
+        "ul",
+        [node("li", text="Espresso", class_="item"), node("li", text="Latte", data_test="new"), before.children[1]],
+    )
+
+    assert list(after.diff(before)) == [DomChange("li[data-test=new]", "added")]
+
+
+def test_diff_reports_text_attribute_and_style_changes():
+    """Test changed values are reported with their path, name and both values."""
+    before = node("div", [node("button", text="Total: $0.00", id="pay")], id="menu")
+    after = before._replace(
+        children=(node("button", text="Total: $10.00", id="pay", disabled="true"),),
+        styles={"display": "none"},
+    )
+
+    diff = after.diff(before)
+
+    assert [str(change) for change in diff] == [
+        "div#menu style display: None -> 'none'",
+        "button#pay text: 'Total: $0.00' -> 'Total: $10.00'",
+        "button#pay attribute disabled: None -> 'true'",
+    ]
+    assert diff.paths() == ["div#menu", "button#pay"]
+    assert not after.diff(after)
+
+
+def test_assert_only_lists_unexpected_changes():
+    """Test changes outside the allowed paths fail with a readable message."""
+    before = node("div", [node("span", text="a", class_="count"), node("p", text="b")])
+    after = node("div", [node("span", text="c", class_="count"), node("p", text="d")])
+    diff = after.diff(before)
+
+    diff.assert_only("span.count", "p")
+    with pytest.raises(AssertionError, match=r"p text: 'b' -> 'd'"):
+        diff.assert_only("span.*")
+
+
+def test_clicking_a_cup_changes_only_the_cart_state():
+    """Test adding a cup updates the header count, the total and the cart preview, and nothing else."""
+    driver = FakeWebDriver(APP_HTML)
+    FakeCoffeeCart(driver)
+    menu_page = MenuPage(driver)
+
+    before = menu_page.snapshot_dom()
+    menu_page.click_on_cup_by_name("Espresso")
+    diff = menu_page.snapshot_dom().diff(before)
+
+    # The fake app keeps the cart page in the same document and renders it on every change.
+    diff.assert_only(
+        "ul/li[1]/a[aria-label=Cart page]",
+        "div#menu/div.pay-container/button[aria-label=Proceed to checkout]",
+        "div#menu/div.pay-container/ul.cart-preview*",
+        "div#cart/*",
+    )
+    assert "ul/li[1]/a[aria-label=Cart page]" in diff.paths()
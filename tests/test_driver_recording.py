@@ -0,0 +1,62 @@
+import time
+
+import pytest
+from selenium.webdriver.support import wait
+
+from pages.menu_page import MenuPage
+from utilities.driver_recording import DriverRecorder, ReplayDivergence, ReplayWebDriver
+from utilities.fake_webdriver import FakeWebDriver
+from utilities.fake_webdriver.fake_app import APP_HTML, FakeCoffeeCart
+
+TEST_ID = "tests/test_example.py::test_add_to_cart"
+
+
+def add_espresso(driver) -> str:
+    menu_page = MenuPage(driver)
+    menu_page.get_cup_by_name("Espresso").click()
+    menu_page.wait_for_nav_count_update("(1)")
+    return menu_page.get_nav_cart_count()
+
+
+@pytest.fixture()
+def recorder(tmp_path):
+    """Return a recorder holding one recording made on the fake driver."""
+    recorder = DriverRecorder("record", str(tmp_path))
+    live_driver = FakeWebDriver(APP_HTML, "http://coffee-cart.local/")
+    FakeCoffeeCart(live_driver)
+    recorder.install(live_driver)
+    recorder.start(TEST_ID)
+    add_espresso(live_driver)
+    recorder.stop()
+    recorder.mode = "replay"
+    return recorder
+
+
+def test_replay_serves_recorded_responses(recorder):
+    """Test a replayed page-object flow gets the recorded responses without a browser."""
+    recorder.start(TEST_ID)
+    nav_cart_count = add_espresso(ReplayWebDriver(recorder))
+    recorder.stop()
+
+    assert nav_cart_count == "(1)"
+
+
+def test_replay_clock_is_scoped_to_the_replay_driver(recorder):
+    """Test replaying keeps the global clock of WebDriverWait for other drivers."""
+    recorder.start(TEST_ID)
+    MenuPage(FakeWebDriver(APP_HTML)).wait_for_nav_count_update("(0)")
+    nav_cart_count = add_espresso(ReplayWebDriver(recorder))
+    recorder.stop()
+
+    assert nav_cart_count == "(1)"
+    assert wait.time is time
+
+
+def test_replay_detects_divergence(recorder):
+    """Test a different command sequence fails the replay."""
+    recorder.start(TEST_ID)
+    menu_page = MenuPage(ReplayWebDriver(recorder))
+
+    with pytest.raises(ReplayDivergence):
+        menu_page.get_cup_by_name("Mocha").double_click_on_cup_name()
+    recorder.stop()
@@ -0,0 +1,63 @@
+import gzip
+from types import SimpleNamespace
+
+from allure_commons.types import AttachmentType
+
+from utilities.failure_artifacts import FailureArtifactPipeline
+
+DOM = "<html><body>" + "<p>cup</p>" * 10000 + "</body></html>"
+
+
+class AllureListener:
+    """Stand-in for the Allure listener of the running test."""
+
+    def __init__(self):
+        self.result = SimpleNamespace(attachments=[])
+        self.allure_logger = SimpleNamespace(get_test=lambda uuid: self.result)
+
+
+def failed_item(listener):
+    plugins = SimpleNamespace(getplugin=lambda name: listener)
+    return SimpleNamespace(name="test_checkout", config=SimpleNamespace(pluginmanager=plugins))
+
+
+def failing_driver():
+    return SimpleNamespace(get_screenshot_as_png=lambda: b"png", page_source=DOM, get_log=lambda kind: [])
+
+
+def test_dom_attached_as_html_while_under_the_cap():
+    """Test a large DOM snapshot is attached as viewable HTML."""
+    listener = AllureListener()
+    pipeline = FailureArtifactPipeline(max_bytes=1024 * 1024)
+
+    pipeline.capture(failed_item(listener), failing_driver())
+    pipeline.close()
+
+    dom = listener.result.attachments[1]
+    assert (dom.type, dom.source.endswith(".html")) == (AttachmentType.HTML.mime_type, True)
+    assert pipeline.used_bytes == 3 + len(DOM)
+
+
+def test_dom_compressed_only_above_the_cap():
+    """Test a DOM snapshot over the remaining cap is compressed and counted at its compressed size."""
+    listener = AllureListener()
+    pipeline = FailureArtifactPipeline(max_bytes=len(DOM) // 2)
+
+    pipeline.capture(failed_item(listener), failing_driver())
+    pipeline.close()
+
+    dom = listener.result.attachments[1]
+    assert (dom.type, dom.source.endswith(".html.gz")) == ("application/gzip", True)
+    assert pipeline.used_bytes == 3 + len(gzip.compress(DOM.encode("utf-8")))
+
+
+def test_dom_over_the_cap_even_compressed_is_dropped_in_the_background():
+    """Test a DOM snapshot that does not fit compressed either leaves the cap untouched."""
+    listener = AllureListener()
+    pipeline = FailureArtifactPipeline(max_bytes=10)
+
+    pipeline.capture(failed_item(listener), failing_driver())
+    pipeline.close()
+
+    assert [attachment.type for attachment in listener.result.attachments] == ["image/png", "application/gzip"]
+    assert pipeline.used_bytes == 3
@@ -0,0 +1,81 @@
+import pytest
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+from pages.menu_page import MenuPage
+from utilities.fake_webdriver import FakeWebDriver
+from utilities.fake_webdriver.fake_app import APP_HTML, FakeCoffeeCart
+
+HTML = """
+<html><head><title>Coffee cart</title><style>
+  .hidden { display: none; }
+  dialog button { background-color: #efefef; }
+  h4 small { display: block; }
+</style></head><body>
+<div id="app">
+  <ul><li><a href="/">menu</a></li><li><a href="/cart" aria-label="Cart page">cart (0)</a></li></ul>
+  <div></div>
+  <div id="menu"><ul>
+    <li><h4>Espresso<small>$10.00</small></h4><div class="cup"><div class="cup-body" aria-label="Espresso">
+      <div class="ingredient espresso" style="height: 100%;">espresso</div></div></div></li>
+    <li><h4>Mocha<small>$8.00</small></h4><div class="cup"><div class="cup-body" aria-label="Mocha">
+      <div class="ingredient espresso" style="height: 30%;">espresso</div>
+      <div class="ingredient chocolate-syrup" style="height: 70%;">chocolate syrup</div></div></div></li>
+  </ul></div>
+  <p class="hidden">No coffee, go add some.</p>
+  <dialog><form><button>Yes</button><button>No</button></form></dialog>
+</div>
+</body></html>
+"""
+
+
+def test_fake_webdriver_locators():
+    """Test the fake driver resolves the locator strategies used by page objects."""
+    driver = FakeWebDriver(HTML)
+
+    assert driver.title == "Coffee cart"
+    assert driver.find_element(By.CSS_SELECTOR, "#app > ul > li:nth-child(2) > a").text == "cart (0)"
+    assert [h4.text for h4 in driver.find_elements(By.XPATH, "//li/h4")] == ["Espresso\n$10.00", "Mocha\n$8.00"]
+    assert driver.find_element(By.XPATH, "(//li/h4/..)[2]").find_element(By.XPATH, ".//h4/small").text == "$8.00"
+    assert len(driver.find_elements(By.XPATH, "//div[starts-with(@class, 'ingredient')]")) == 3
+    assert driver.find_element(By.XPATH, "//form/button[normalize-space()='No']").text == ""
+    assert not driver.find_element(By.XPATH, "//p[text()='No coffee, go add some.']").is_displayed()
+    assert driver.find_elements(By.LINK_TEXT, "missing") == []
+    with pytest.raises(NoSuchElementException):
+        driver.find_element(By.CLASS_NAME, "promo")
+
+
+def test_fake_webdriver_runs_page_objects():
+    """Test page objects run unchanged on the fake driver."""
+    driver = FakeWebDriver(HTML)
+    clicked = []
+    driver.on("click", ".cup-body", lambda fake, element: clicked.append(element.attrs["aria-label"]))
+
+    menu_page = MenuPage(driver)
+    mocha = menu_page.get_cup_by_name("Mocha")
+    ingredients = mocha.get_ingredients()
+    mocha.click()
+
+    assert mocha.get_price() == 8.0
+    assert [ingredient.get_height_percent(ingredient.parent) for ingredient in ingredients] == [30.0, 70.0]
+    assert ingredients[1].parent.value_of_css_property("height") == "70%"
+    assert clicked == ["Mocha"]
+
+
+def test_cup_handles_survive_translation():
+    """Test cup handles keep addressing their cup while names are translated in place."""
+    driver = FakeWebDriver(APP_HTML)
+    FakeCoffeeCart(driver)
+    menu_page = MenuPage(driver)
+
+    cups = menu_page.cup_handles()
+    cups[1].double_click_on_cup_name()
+    assert [cup.get_name() for cup in cups[:3]] == ["Espresso", "浓缩玛奇朵", "Cappuccino"]
+    assert menu_page.cup_handle(1).component().get_price() == 12.0
+
+    names = menu_page.translate_all()
+    assert list(names.items())[:3] == [
+        ("Espresso", "特浓咖啡"),
+        ("浓缩玛奇朵", "Espresso Macchiato"),
+        ("Cappuccino", "卡布奇诺"),
+    ]
@@ -0,0 +1,29 @@
+from utilities.test_impact import impacted_tests
+
+IMPACT_MAP = {
+    "tests/test_cart.py::test_remove": ["pages/cart_page.py::CartPage.items", "pages/base.py::Base.__init__"],
+    "tests/test_cart.py::test_price": ["pages/components/cart_item_component.py::CartItemComponent.price"],
+    "tests/test_menu.py::test_cups": ["pages/menu_page.py::MenuPage.cups"],
+}
+
+
+def test_impacted_tests_by_changed_page_object():
+    """Test only tests that called code of a changed page-object module are selected."""
+    node_ids = [*IMPACT_MAP, "tests/test_new.py::test_not_traced_yet"]
+
+    selected = impacted_tests(node_ids, IMPACT_MAP, ["pages/components/cart_item_component.py", "README.md"])
+
+    assert selected == {"tests/test_cart.py::test_price", "tests/test_new.py::test_not_traced_yet"}
+
+
+def test_impacted_tests_by_changed_test_file_and_shared_code():
+    """Test changed test files select their tests and changed shared code selects everything."""
+    assert impacted_tests(IMPACT_MAP, IMPACT_MAP, ["tests/test_menu.py"]) == {"tests/test_menu.py::test_cups"}
+    assert impacted_tests(IMPACT_MAP, IMPACT_MAP, ["fixtures/drivers.py"]) is None
+
+
+def test_impacted_tests_by_changed_data_or_configuration():
+    """Test changed test data and configuration select everything and documentation selects nothing."""
+    assert impacted_tests(IMPACT_MAP, IMPACT_MAP, ["test_data/drink_ingredient_colors.csv"]) is None
+    assert impacted_tests(IMPACT_MAP, IMPACT_MAP, ["pytest.ini"]) is None
+    assert impacted_tests(IMPACT_MAP, IMPACT_MAP, ["README.md", "docs/setup.md"]) == set()
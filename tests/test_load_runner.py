@@ -0,0 +1,74 @@
+from utilities.fake_webdriver import FakeWebDriver
+from utilities.fake_webdriver.fake_app import APP_HTML, FakeCoffeeCart
+from utilities.load_runner import SCENARIOS, LoadReport, LoadSettings, run_load, run_session
+
+
+def fake_coffee_cart() -> FakeWebDriver:
+    driver = FakeWebDriver(APP_HTML, "http://coffee-cart.local/")
+    FakeCoffeeCart(driver)
+    return driver
+
+
+def test_session_times_actions_and_completes_purchases():
+    """Test a session times every action of its scenarios and purchases through the payment modal."""
+    settings = LoadSettings(
+        "http://coffee-cart.local/",
+        {"add_cups": 3, "purchase": 1},
+        iterations=12,
+        seed=7,
+        driver_factory=fake_coffee_cart,
+    )
+
+    result = run_session(settings)
+    report = LoadReport([result, run_session(settings, user=1)], elapsed=2.0)
+
+    assert sum(report.scenarios.values()) == 24
+    assert report.scenarios["purchase"] > 0
+    assert report.failed_scenarios == {}
+    assert report.actions["open_menu"].count == 24
+    assert report.actions["add_cup"].count >= 24
+    assert report.actions["submit_payment"].count == report.scenarios["purchase"]
+    assert report.error_rate == 0.0
+    assert report.throughput == 24 / 2.0
+    assert report.actions["add_cup"].p50_ms <= report.actions["add_cup"].p95_ms <= report.actions["add_cup"].max_ms
+
+
+def test_session_counts_failures_without_stopping(monkeypatch):
+    """Test a failing action is counted as an error of the action and its scenario, and the session goes on."""
+
+    def broken(session):
+        session.open_menu()
+        with session.action("broken_action"):
+            raise AssertionError("Broken on purpose")
+
+    monkeypatch.setitem(SCENARIOS, "broken", broken)
+    settings = LoadSettings(
+        "http://coffee-cart.local/",
+        {"broken": 1, "browse_menu": 1},
+        iterations=10,
+        seed=3,
+        driver_factory=fake_coffee_cart,
+    )
+
+    report = LoadReport([run_session(settings)], elapsed=1.0)
+
+    assert sum(report.scenarios.values()) == 10
+    assert report.failed_scenarios == {"broken": report.scenarios["broken"]}
+    assert report.actions["broken_action"].errors == report.scenarios["broken"]
+    assert report.actions["broken_action"].error_rate == 1.0
+    assert report.actions["read_menu"].count == report.scenarios["browse_menu"]
+    assert report.error_rate == report.scenarios["broken"] / 10
+
+
+def test_load_runs_one_process_per_user():
+    """Test the sessions of all users are merged into one report."""
+    settings = LoadSettings(
+        "http://coffee-cart.local/", {"browse_menu": 1}, iterations=3, driver_factory=fake_coffee_cart
+    )
+
+    report = run_load(settings, users=2)
+
+    assert report.users == 2
+    assert report.scenarios == {"browse_menu": 6}
+    assert report.actions["read_menu"].count == 6
+    assert report.error_rate == 0.0
@@ -0,0 +1,70 @@
+import json
+import logging
+import time
+
+from pages.base import BasePage
+from pages.menu_page import MenuPage
+from utilities.logger import JsonLinesFormatter, Logger
+
+
+class ListHandler(logging.Handler):
+    """Collect the records the queue listener hands over."""
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def test_records_are_written_by_the_queue_listener(monkeypatch):
+    """Test accepted records reach the handlers through the background listener, stamped with the test id."""
+    logger = Logger.get_logger("test_logger.listener", logging.INFO)
+    handler = ListHandler()
+    monkeypatch.setattr(Logger._listener, "handlers", (handler,))
+
+    logger.debug("dropped %s", "unformatted")
+    logger.info("Found %s cups", 9)
+    deadline = time.monotonic() + 2
+    while not handler.records and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert [record.getMessage() for record in handler.records] == ["Found 9 cups"]
+    assert handler.records[0].test_id.endswith("test_records_are_written_by_the_queue_listener")
+
+
+def test_json_lines_formatter():
+    """Test a record is serialized as one JSON object with the test context fields."""
+    record = logging.LogRecord("MenuPage", logging.WARNING, __file__, 1, "Wait '%s' late", ("cups",), None)
+    record.test_id, record.test_elapsed_ms = "tests/test_menu.py::test_cups", 12.5
+
+    line = JsonLinesFormatter().format(record)
+
+    assert "\n" not in line
+    payload = json.loads(line)
+    assert payload["message"] == "Wait 'cups' late"
+    assert (payload["level"], payload["logger"], payload["test_id"]) == ("WARNING", "MenuPage", record.test_id)
+    assert payload["test_elapsed_ms"] == 12.5
+
+
+def test_loggers_are_cached_per_class():
+    """Test every page object class logs under its own name, whichever class resolved its logger first."""
+
+    class PromoMenu(MenuPage):
+        pass
+
+    assert BasePage.logger.name == "BasePage"
+    assert MenuPage.logger.name == "MenuPage"
+    assert PromoMenu.logger.name == "PromoMenu"
+    assert MenuPage.logger is Logger.get_logger("MenuPage")
+
+
+def test_console_level_applies_to_cached_loggers():
+    """Test a level passed after the first request changes the cached logger, and no level keeps it."""
+    logger = Logger.get_logger("test_logger.level", logging.WARNING)
+
+    assert Logger.get_logger("test_logger.level", logging.DEBUG) is logger
+    assert logger.level == logging.DEBUG
+    Logger.get_logger("test_logger.level")
+    assert logger.level == logging.DEBUG
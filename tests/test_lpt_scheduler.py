@@ -0,0 +1,25 @@
+from utilities.test_scheduler import ScheduledTest, assign_lpt, base_node_id, estimate_durations
+
+
+def test_assign_lpt_balances_and_keeps_affinity():
+    """Test tests share a worker with their page fixture unless that unbalances the workers."""
+    tests = [
+        ScheduledTest("a", 5.0, ("driver_menu_page",)),
+        ScheduledTest("b", 4.0, ("driver_cart_page",)),
+        ScheduledTest("c", 3.0, ("driver_menu_page",)),
+        ScheduledTest("d", 3.0, ("driver_cart_page",)),
+        ScheduledTest("e", 1.0, ("driver_menu_page",)),
+    ]
+
+    schedule = assign_lpt(tests, 2)
+
+    assert schedule == [["a", "c"], ["b", "d", "e"]]
+
+
+def test_estimate_durations_and_group_suffix():
+    """Test unknown tests are expected to take the median and xdist group suffixes are stripped."""
+    durations = estimate_durations(["a", "b", "c", "new"], {"a": 1.0, "b": 2.0, "c": 9.0, "gone": 50.0})
+
+    assert durations == {"a": 1.0, "b": 2.0, "c": 9.0, "new": 2.0}
+    assert base_node_id("tests/test_x.py::test_y@lpt-1") == "tests/test_x.py::test_y"
+    assert base_node_id("tests/test_x.py::test_y[a@b]") == "tests/test_x.py::test_y[a@b]"
@@ -0,0 +1,77 @@
+import pytest
+
+from plugins.network import rules_for
+from utilities.fake_webdriver import FakeWebDriver
+from utilities.fake_webdriver.fake_app import APP_HTML
+from utilities.network_interception import CachedResponse, NetworkInterceptor, NetworkRules, ResponseCache
+
+RULES = NetworkRules(block=("*://fonts.googleapis.com/*", "*?ad=1*"), allow=("*/ads/allowed.js?ad=1",))
+
+
+@pytest.mark.parametrize(
+    "url, resource_type, cached, action",
+    [
+        ("https://fonts.googleapis.com/css?family=Lato", "Stylesheet", False, "block"),
+        ("https://coffee-cart.app/ads/banner.png?ad=1", "Image", False, "block"),
+        ("https://coffee-cart.app/ads/allowed.js?ad=1", "Script", False, "store"),
+        ("https://coffee-cart.app/?ad=1", "Document", False, "continue"),
+        ("https://coffee-cart.app/js/app.js", "Script", False, "store"),
+        ("https://coffee-cart.app/js/app.js", "Script", True, "fulfill"),
+        ("https://coffee-cart.app/api/list.json", "Fetch", True, "continue"),
+    ],
+)
+def test_rules_plan_paused_requests(url, resource_type, cached, action):
+    """Test block, allow and cache rules decide how a paused request is answered."""
+    assert RULES.plan(url, resource_type, "GET", cached, at_response=False) == action
+
+
+def test_rules_without_cache_continue_static_assets():
+    """Test static assets are not cached when the test turns caching off."""
+    rules = RULES._replace(cache=False)
+
+    assert rules.plan("https://coffee-cart.app/js/app.js", "Script", "GET", True, at_response=False) == "continue"
+    assert rules.plan("https://coffee-cart.app/js/app.js", "Script", "POST", True, at_response=False) == "continue"
+
+
+def test_rules_pause_only_requests_they_act_on():
+    """Test only blocked URLs and, with caching on, static assets pause in the browser."""
+    assert RULES.request_patterns() == [
+        ("*://fonts.googleapis.com/*", None),
+        ("*?ad=1*", None),
+        ("*", "Font"),
+        ("*", "Image"),
+        ("*", "Script"),
+        ("*", "Stylesheet"),
+    ]
+    assert NetworkRules(cache=False).request_patterns() == []
+
+
+def test_response_cache_keeps_successful_responses():
+    """Test only successful responses are cached and hits are counted."""
+    cache = ResponseCache()
+    cache.put("https://coffee-cart.app/app.css", CachedResponse(200, [("Content-Type", "text/css")], "Ym9keQ=="))
+    cache.put("https://coffee-cart.app/missing.css", CachedResponse(404, [], ""))
+
+    assert "https://coffee-cart.app/missing.css" not in cache
+    assert cache.get("https://coffee-cart.app/app.css").body == "Ym9keQ=="
+    assert (cache.stored, cache.hits) == (1, 1)
+
+
+@pytest.mark.network(block=["*/api/*"], allow=["*?ad=1*"], cache=False)
+def test_marker_extends_default_rules(request):
+    """Test the network marker adds block and allow patterns to the configured ones."""
+    rules = rules_for(request.node.get_closest_marker("network"))
+
+    assert "*/api/*" in rules.block and "*://fonts.googleapis.com/*" in rules.block
+    assert rules.allow == ("*?ad=1*",)
+    assert not rules.blocks("https://coffee-cart.app/ads/banner.png?ad=1", "Image")
+    assert not rules.cache
+
+
+def test_interceptor_without_cdp_is_skipped():
+    """Test a driver without a CDP endpoint leaves the network alone instead of failing."""
+    interceptor = NetworkInterceptor(FakeWebDriver(APP_HTML))
+
+    assert not interceptor.start()
+    assert not interceptor.running
+    assert not interceptor.start()
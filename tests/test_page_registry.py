@@ -0,0 +1,23 @@
+import pytest
+
+from pages import registry
+from pages.base import BasePage
+from pages.cart_page import CartPage
+
+
+def test_resolve_imports_on_first_use_and_caches():
+    """Test classes are resolved by name and later lookups return the cached class."""
+    assert registry.resolve("CartPage") is CartPage
+    assert "CartPage" in registry.loaded()
+    assert registry.resolve("CartPage") is registry.resolve("CartPage")
+
+
+def test_register_and_unknown_names(monkeypatch):
+    """Test registering a class and the error of an unregistered name."""
+    monkeypatch.setattr(registry, "_modules", dict(registry._modules))
+    monkeypatch.setattr(registry, "_classes", dict(registry._classes))
+
+    registry.register("BasePage", "pages.base")
+    assert registry.resolve("BasePage") is BasePage
+    with pytest.raises(KeyError, match="NoSuchPage"):
+        registry.resolve("NoSuchPage")
@@ -0,0 +1,35 @@
+from pages.base import PageObjectCounter
+from pages.cart_page import CartPage
+from pages.menu_page import MenuPage
+from utilities.fake_webdriver import FakeWebDriver
+from utilities.fake_webdriver.fake_app import APP_HTML, FakeCoffeeCart
+from utilities.webdriver_metrics import get_command_counter
+
+
+def test_chained_pages_are_reused_and_counted(monkeypatch):
+    """Test pages returned for chaining are constructed once per session and reuses are counted."""
+    page_objects = PageObjectCounter()
+    monkeypatch.setattr("pages.base.page_objects", page_objects)
+    driver = FakeWebDriver(APP_HTML)
+    FakeCoffeeCart(driver)
+    menu_page = MenuPage.of(driver)
+
+    cart_page = menu_page.go_to_cart_page()
+    assert cart_page.go_to_menu_page() is menu_page
+    assert menu_page.go_to_cart_page() is cart_page
+    assert CartPage.of(FakeWebDriver(APP_HTML)) is not cart_page
+    assert page_objects.constructed == {"MenuPage": 1, "CartPage": 2}
+    assert page_objects.avoided == 2
+
+
+def test_chain_issues_only_the_round_trips_of_its_actions():
+    """Test clicking a cup and opening the cart neither reads the other cups nor looks up pages."""
+    driver = FakeWebDriver(APP_HTML)
+    FakeCoffeeCart(driver)
+    counter = get_command_counter(driver)
+
+    cart_page = MenuPage(driver).click_on_cup_by_name("Espresso").go_to_cart_page()
+
+    # Find the cups, read the first name, find its body and click it; find the cart link and click it.
+    assert counter.total == 7
+    assert cart_page.clear_cart().get_number_of_items() == 0
@@ -0,0 +1,30 @@
+from decimal import Decimal
+
+import pytest
+
+from utilities.parsing import (
+    UnitPrice,
+    parse_cart_count,
+    parse_height_percent_all,
+    parse_money,
+    parse_money_all,
+    parse_quantity,
+    parse_unit_price,
+)
+
+
+def test_parse_money_and_unit_prices():
+    """Test amounts are parsed exactly from the price texts of the app."""
+    assert parse_money_all(["$10.00", "Total: $1,234.50", "€7"]) == [Decimal("10.00"), Decimal("1234.50"), Decimal("7")]
+    assert sum(parse_money_all(["$0.10", "$0.20"])) == Decimal("0.30")
+    assert parse_unit_price("$19.00 x 2") == UnitPrice(Decimal("19.00"), 2)
+    assert parse_quantity(" x 3") == 3
+    with pytest.raises(ValueError):
+        parse_money("Total:")
+
+
+def test_parse_counts_and_heights():
+    """Test header counts and ingredient heights default to zero when missing."""
+    assert parse_cart_count("cart (12)") == 12
+    assert parse_cart_count("cart") == 0
+    assert parse_height_percent_all(["height: 30%;", "background: red; height:12.5%", ""]) == [30.0, 12.5, 0.0]
@@ -0,0 +1,54 @@
+import warnings
+
+import pytest
+
+from pages.cart_page import CartPage
+from pages.menu_page import MenuPage
+from utilities.fake_webdriver import FakeWebDriver
+from utilities.fake_webdriver.fake_app import APP_HTML, FakeCoffeeCart
+from utilities.perf_budget import Budget, PerfBudgetExceeded, PerfBudgets, PerfBudgetWarning, perf_budgets
+
+
+def test_wall_time_violations_warn_by_default(tmp_path):
+    """Test a slow call only warns while an extra WebDriver command fails."""
+    budgets = PerfBudgets(path=tmp_path / "budgets.json", mode="fail", time_mode="warn")
+
+    with pytest.warns(PerfBudgetWarning, match="150 ms > 100 ms"):
+        budgets.check("Page.open", 3, 150.0, Budget(max_commands=3, max_ms=100))
+    with pytest.raises(PerfBudgetExceeded, match="4 WebDriver commands > 3, 150 ms > 100 ms"):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            budgets.check("Page.open", 4, 150.0, Budget(max_commands=3, max_ms=100))
+
+
+def test_worker_observations_are_merged_before_saving(tmp_path):
+    """Test the baseline keeps the maximum observed by any worker and is written once."""
+    budgets = PerfBudgets(path=tmp_path / "budgets.json")
+    budgets.update = True
+    budgets.check("Page.open", 3, 100.0)
+
+    budgets.merge({"Page.open": (5, 80.0), "Page.close": (1, 10.0)})
+    budgets.save()
+
+    assert PerfBudgets(path=tmp_path / "budgets.json").baseline == {
+        "Page.close": Budget(1, 15.0),
+        "Page.open": Budget(5, 150.0),
+    }
+
+
+def test_page_object_budgets_come_from_the_baseline_file(monkeypatch):
+    """Test the budgeted page-object methods are limited by the checked-in baseline alone."""
+    monkeypatch.setattr(perf_budgets, "update", False)
+    monkeypatch.setattr(perf_budgets, "mode", "fail")
+    monkeypatch.setattr(perf_budgets, "observed", {})
+    driver = FakeWebDriver(APP_HTML, "http://coffee-cart.local/")
+    FakeCoffeeCart(driver).add("Espresso", 10.0)
+
+    MenuPage(driver).cups()
+    CartPage(driver).pay()
+
+    assert perf_budgets.baseline["pages.menu_page.MenuPage.cups"] == Budget(1, None)
+    assert perf_budgets.baseline["pages.cart_page.CartPage.pay"] == Budget(2, None)
+    monkeypatch.setattr(perf_budgets, "_baseline", {"pages.menu_page.MenuPage.cups": Budget(0, None)})
+    with pytest.raises(PerfBudgetExceeded, match="MenuPage.cups: 1 WebDriver commands > 0"):
+        MenuPage(driver).cups()
@@ -0,0 +1,96 @@
+from collections import OrderedDict
+from types import SimpleNamespace
+
+import allure
+import pytest
+
+import conftest
+from utilities import reporting
+from utilities.reporting import StepRecorder, step, step_recorder
+
+
+@pytest.fixture()
+def allure_calls(monkeypatch):
+    """Record the Allure steps and attachments created instead of reporting them."""
+    calls = []
+
+    def fake_step(title):
+        def decorator(func):
+            def allure_step(*args, **kwargs):
+                calls.append(("step", title))
+                return func(*args, **kwargs)
+
+            return allure_step
+
+        return decorator
+
+    monkeypatch.setattr(allure, "step", fake_step)
+    monkeypatch.setattr(reporting.allure, "attach", lambda body, name, attachment_type: calls.append((name, body)))
+    monkeypatch.setattr(step_recorder, "_aggregates", OrderedDict())
+    return calls
+
+
+def lookup(locator):
+    return f"element {locator}"
+
+
+@pytest.mark.parametrize("mode, reported", [("full", [("step", "Find {locator}")]), ("off", [])])
+def test_full_mode_reports_every_step_and_off_mode_none(monkeypatch, allure_calls, mode, reported):
+    """Test full mode creates an Allure step per call, off mode none, and neither buffers."""
+    monkeypatch.setattr(step_recorder, "mode", mode)
+
+    assert step("Find {locator}")(lookup)("#cart") == "element #cart"
+    step_recorder.flush()
+
+    assert allure_calls == reported
+    assert step_recorder.render() == ""
+
+
+def test_sampled_mode_collapses_repeated_steps_into_one_attachment(monkeypatch, allure_calls):
+    """Test sampled mode counts repeated steps and keeps the formatted title of every N-th call."""
+    monkeypatch.setattr(step_recorder, "mode", "sampled")
+    monkeypatch.setattr(step_recorder, "sample_rate", 2)
+    find = step("Find {locator}")(lookup)
+
+    for index in range(5):
+        find(f"#cup-{index}")
+    step_recorder.flush()
+    step_recorder.flush()
+
+    assert [name for name, _ in allure_calls] == ["Low-level steps"]
+    lines = allure_calls[0][1].splitlines()
+    assert lines[0].startswith("5 x Find {locator} (")
+    assert lines[1:] == ["    e.g. Find '#cup-0'", "    e.g. Find '#cup-2'", "    e.g. Find '#cup-4'"]
+
+
+def test_sampled_mode_keeps_a_bounded_number_of_samples():
+    """Test an aggregate keeps at most ``max_samples`` titles however often the step runs."""
+    recorder = StepRecorder("sampled", sample_rate=1)
+
+    for index in range(20):
+        recorder.record("Find {locator}", lookup, (f"#cup-{index}",), {}, 0.001)
+
+    assert len(recorder.render().splitlines()) == 1 + 5
+    assert recorder.render().startswith("20 x Find {locator} (20.0 ms)")
+
+
+def test_unknown_mode_is_rejected():
+    """Test a mode other than full, sampled or off raises."""
+    with pytest.raises(ValueError, match="Unknown Allure step mode 'verbose'"):
+        StepRecorder("verbose")
+
+
+def test_steps_are_flushed_before_the_failure_screenshot(monkeypatch, allure_calls):
+    """Test the buffered steps of a failed test are attached before its failure artifacts."""
+    monkeypatch.setattr(step_recorder, "mode", "sampled")
+    monkeypatch.setattr(conftest.failure_artifacts, "capture", lambda item, driver: allure_calls.append(("capture",)))
+    step("Find {locator}")(lookup)("#cart")
+    item = SimpleNamespace(funcargs={"driver": object()}, instance=None)
+    report = SimpleNamespace(when="call", failed=True)
+
+    hook = conftest.pytest_runtest_makereport(item, SimpleNamespace(when="call"))
+    next(hook)
+    with pytest.raises(StopIteration):
+        hook.send(SimpleNamespace(get_result=lambda: report))
+
+    assert [call[0] for call in allure_calls] == ["Low-level steps", "capture"]
@@ -0,0 +1,50 @@
+from selenium.webdriver.common.by import By
+
+from pages.cart_page import CartPage
+from pages.menu_page import MenuPage
+from utilities.fake_webdriver import FakeWebDriver
+from utilities.fake_webdriver.fake_app import APP_HTML, FakeCoffeeCart
+from utilities.webdriver_metrics import get_command_counter
+
+
+def test_page_construction_costs_no_round_trips():
+    """Test page objects share one header and constructing them issues no WebDriver commands."""
+    driver = FakeWebDriver(APP_HTML)
+    FakeCoffeeCart(driver)
+    counter = get_command_counter(driver)
+
+    menu_page, cart_page = MenuPage(driver), CartPage(driver)
+
+    assert counter.total == 0
+    assert menu_page.get_header() is cart_page.get_header()
+
+
+def test_shared_header_is_found_once_and_again_when_stale():
+    """Test the header element is looked up on first use and after a reload replaced it."""
+    driver = FakeWebDriver(APP_HTML)
+    FakeCoffeeCart(driver)
+    counter = get_command_counter(driver)
+    cart_page = CartPage(driver)
+
+    assert isinstance(cart_page.go_to_menu_page(), MenuPage)
+    assert isinstance(cart_page.go_to_menu_page(), MenuPage)
+    assert counter.by_command["findElement"] == 1
+
+    driver.refresh()
+    assert isinstance(cart_page.go_to_menu_page(), MenuPage)
+    assert counter.by_command["findElement"] == 2
+
+
+def test_shared_header_binds_on_every_access():
+    """Test every access to the shared header binds it first and rebinds it after a reload."""
+    driver = FakeWebDriver(APP_HTML)
+    FakeCoffeeCart(driver)
+    counter = get_command_counter(driver)
+    header = MenuPage.of(driver).get_header()
+
+    assert len(header.find_elements((By.TAG_NAME, "a"))) == 3
+    driver.refresh()
+    assert len(header.find_elements((By.TAG_NAME, "a"))) == 3
+    assert counter.by_command["findElement"] == 2
+    assert header._get_classes() == []
+    header.hover_on()
@@ -1,15 +1,14 @@
-import re
 from pages.menu_page import MenuPage
 from pages.cart_page import CartPage
+from utilities.parsing import parse_money, to_float
 
 def parse_price(price_text: str) -> float:
     """
     Utility function to clean and convert price string
     (e.g., "Total: $10.50" or "$10.50") to float.
     """
-    cleaned_price = re.sub(r'(Total:|\s|\$|€|₴|,)', '', price_text).strip()
     try:
-        return float(cleaned_price)
+        return to_float(parse_money(price_text))
     except ValueError:
         return 0.0
 
@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+from utilities.visual_regression import (
+    MissingBaseline,
+    VisualBaselines,
+    VisualMismatch,
+    compare_images,
+    crop,
+    heatmap,
+    load_png,
+)
+
+
+def cup_image(foam=(245, 245, 220), espresso=(108, 59, 42)) -> np.ndarray:
+    image = np.full((40, 30, 3), 255, dtype=np.uint8)
+    image[10:25, 5:25] = foam
+    image[25:38, 5:25] = espresso
+    return image
+
+
+def test_small_differences_are_tolerated():
+    """Test anti-aliasing sized channel noise does not count as a difference."""
+    noisy = cup_image().astype(np.int16) + np.random.default_rng(1).integers(-6, 7, size=(40, 30, 3))
+
+    assert compare_images(np.clip(noisy, 0, 255).astype(np.uint8), cup_image()).mismatch_ratio == 0.0
+
+
+def test_changed_color_is_detected_and_highlighted():
+    """Test a wrong ingredient color is found and shown in red on the heatmap."""
+    actual = cup_image(espresso=(40, 120, 200))
+
+    diff = compare_images(actual, cup_image())
+    marked = heatmap(actual, diff)
+
+    assert diff.mismatched_pixels == 13 * 20
+    assert (marked[30, 10] == [255, 0, 0]).all()
+    assert marked[5, 5, 0] == marked[5, 5, 1]
+
+
+def test_crop_cuts_regions_scaled_to_device_pixels():
+    """Test element rects in CSS pixels are cut from a capture taken at a device pixel ratio of 2."""
+    capture = np.concatenate([cup_image(), cup_image(espresso=(0, 0, 0))], axis=1).repeat(2, axis=0).repeat(2, axis=1)
+
+    first, second = crop(
+        capture, [{"x": 0, "y": 0, "width": 30, "height": 40}, {"x": 30, "y": 0, "width": 30, "height": 40}], 2
+    )
+
+    assert first.shape == second.shape == (80, 60, 3)
+    assert compare_images(first[::2, ::2], cup_image()).mismatch_ratio == 0.0
+    assert (second[60, 20] == 0).all()
+
+
+def test_missing_baseline_is_reported_not_written(tmp_path):
+    """Test a capture without a baseline neither passes nor writes one unless baselines are updated."""
+    skipped = []
+    baselines = VisualBaselines(str(tmp_path), on_missing=skipped.append)
+
+    with pytest.raises(MissingBaseline):
+        baselines.check("menu/Espresso", cup_image())
+    with pytest.raises(MissingBaseline):
+        baselines.check_all({"menu/Espresso": cup_image(), "menu/Mocha": cup_image()})
+
+    assert skipped == [
+        f"No visual baseline for menu/Espresso, menu/Mocha in {tmp_path}; "
+        "run with --update-visual-baselines to write them"
+    ]
+    assert not list(tmp_path.iterdir())
+
+
+def test_baselines_are_written_then_checked(tmp_path):
+    """Test updating writes the baseline from the capture and later captures are compared to it."""
+    VisualBaselines(str(tmp_path), update=True).check("menu/Espresso", cup_image())
+    baselines = VisualBaselines(str(tmp_path))
+    baselines.check("menu/Espresso", cup_image())
+
+    assert baselines.written == []
+    assert (load_png(baselines.path("menu/Espresso").read_bytes()) == cup_image()).all()
+    with pytest.raises(VisualMismatch, match="menu/Espresso: 25.00% of pixels differ"):
+        baselines.check_all({"menu/Espresso": cup_image(foam=(90, 60, 30))})
@@ -0,0 +1,46 @@
+import time
+
+import pytest
+from selenium.common import TimeoutException
+
+from pages.menu_page import MenuPage
+from utilities.fake_webdriver import FakeWebDriver
+from utilities.wait_telemetry import WaitTelemetry, wait_telemetry
+
+HTML = '<div id="app"><ul><li><a href="/">menu</a></li></ul><div id="menu"></div></div>'
+
+
+@pytest.fixture
+def adaptive_waits(monkeypatch):
+    """Fresh adaptive telemetry in place of the session-wide one."""
+    for name, value in vars(WaitTelemetry("adaptive")).items():
+        monkeypatch.setattr(wait_telemetry, name, value)
+    return wait_telemetry
+
+
+def test_expected_miss_runs_its_fixed_timeout_and_is_not_flaky(adaptive_waits):
+    """Test a lookup turning a timeout into False waits its full timeout and is not reported."""
+    adaptive_waits.load({"MenuPage.is_promo_displayed": [0.02, 0.03, 0.05, 0.04, 0.03]})
+    driver = FakeWebDriver(HTML)
+
+    start = time.monotonic()
+    assert MenuPage(driver).is_promo_displayed(timeout=0.5) is False
+    assert time.monotonic() - start >= 0.5
+    assert adaptive_waits.late_after("MenuPage.is_promo_displayed", 5) == 0.1
+    assert adaptive_waits.summary() == []
+
+
+def test_slow_wait_is_reported_late_and_timeouts_counted(adaptive_waits):
+    """Test a wait over its expected time succeeds and is reported late, and an unexpected timeout is counted."""
+    adaptive_waits.load({"slow": [0.01] * 5})
+    ready_at = time.monotonic() + 0.3
+
+    assert adaptive_waits.wait(None, "slow", lambda _: time.monotonic() > ready_at, 2) is True
+    with pytest.raises(TimeoutException):
+        adaptive_waits.wait(None, "slow", lambda _: False, 0.2)
+    with pytest.raises(TimeoutException):
+        adaptive_waits.wait(None, "slow", lambda _: False, 0.2, may_miss=True)
+
+    assert adaptive_waits.late == {"slow": 1}
+    assert adaptive_waits.summary()[0].startswith("slow: 1 late, 1 timed out")
+    assert 0.3 <= adaptive_waits.stored()["slow"][-1] < 2
@@ -0,0 +1,71 @@
+import json
+
+import pytest
+
+from pages.menu_page import MenuPage
+from pages.scripts import COLLECT_WEB_VITALS
+from utilities.fake_webdriver import FakeWebDriver
+from utilities.fake_webdriver.fake_app import APP_HTML, FakeCoffeeCart
+from utilities.web_vitals import web_vitals
+
+METRICS = {
+    "url": "https://coffee-cart.app/",
+    "timeOrigin": 1700000000000.5,
+    "navigation": {"type": "navigate", "ttfb": 80.2, "domContentLoaded": 310.0, "load": 420.4, "transferSize": 1500},
+    "fcp": 350.1,
+    "lcp": 512.3,
+    "cls": 0.0125,
+    "inp": 48.0,
+    "longTasks": 1,
+    "totalBlockingTime": 12.5,
+}
+
+
+@pytest.fixture
+def vitals_file(tmp_path, monkeypatch):
+    path = tmp_path / "web_vitals.jsonl"
+    monkeypatch.setattr(web_vitals, "path", str(path))
+    monkeypatch.setattr(web_vitals, "records", 0)
+    return path
+
+
+def test_web_vitals_recorded_per_navigation_and_interaction(vitals_file):
+    """Test page objects append Web Vitals records with navigation timing once per document."""
+    driver = FakeWebDriver(APP_HTML)
+    FakeCoffeeCart(driver)
+    driver.register_script(COLLECT_WEB_VITALS, lambda driver: dict(METRICS))
+
+    MenuPage.opened(driver).click_on_cup_by_name("Espresso")
+
+    records = [json.loads(line) for line in vitals_file.read_text(encoding="utf-8").splitlines()]
+    assert [record["event"] for record in records] == ["MenuPage opened", "MenuPage.click_on_cup_by_name"]
+    assert records[0]["navigation"] == METRICS["navigation"]
+    assert "navigation" not in records[1]
+    assert records[1]["lcp"] == 512.3
+    assert records[1]["test_id"].endswith("test_web_vitals_recorded_per_navigation_and_interaction")
+
+
+def test_web_vitals_never_fail_a_test(vitals_file):
+    """Test a page that cannot report metrics is skipped without an error."""
+    driver = FakeWebDriver(APP_HTML)
+
+    MenuPage.opened(driver)
+
+    assert web_vitals.record(driver, "unsupported") is None
+    driver.register_script(COLLECT_WEB_VITALS, lambda driver: None)
+    assert web_vitals.record(driver, "no metrics") is None
+    assert not vitals_file.exists()
+
+
+def test_web_vitals_recorded_only_after_navigations(vitals_file):
+    """Test constructing or reusing a page object records nothing, a navigation does."""
+    driver = FakeWebDriver(APP_HTML)
+    FakeCoffeeCart(driver)
+    driver.register_script(COLLECT_WEB_VITALS, lambda driver: dict(METRICS))
+
+    MenuPage.of(driver).get_header().click_cart()
+    MenuPage(driver)
+    MenuPage.of(driver)
+
+    records = [json.loads(line) for line in vitals_file.read_text(encoding="utf-8").splitlines()]
+    assert [record["event"] for record in records] == ["CartPage opened"]
@@ -0,0 +1,193 @@
+"""Disk-backed static asset cache shared by browser sessions, workers and runs.
+
+Drop-in for the in-memory ``ResponseCache`` of ``utilities.network_interception``:
+responses of static assets are written to a directory (by default in the pytest
+cache), so a new Chrome of another pytest-xdist worker or of the next run gets the
+app bundle without fetching it. Every entry is a body file plus a JSON file with
+status, headers and the SHA-256 of the body; a body that does not match its hash
+(a torn write, a manual edit) is dropped and fetched again. Files are written to a
+temporary name and renamed, so concurrent processes never read half an entry.
+
+Entries are served only while the response's own freshness allows it: for its
+``Cache-Control: max-age`` or until its ``Expires`` date, never longer than
+``max_age``. Responses marked ``no-store``, ``no-cache`` or ``private`` are not kept,
+and a response without freshness headers is kept only when its URL carries a
+content hash (``app.3f9a2b1c.js``), which changes with every deploy of the app.
+The cache is bounded by size: a read touches the entry, and when a write takes the
+total over the limit the least recently used entries are evicted.
+"""
+
+import base64
+import hashlib
+import json
+import math
+import os
+import re
+import tempfile
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from config.resources import ASSET_CACHE_MAX_MB
+from utilities.logger import Logger
+from utilities.network_interception import CachedResponse
+
+__all__ = ["DiskResponseCache", "freshness"]
+
+
+def _key(url: str) -> str:
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+
+# A hex hash of at least 8 characters, with a digit, right before the extension, e.g. app.3f9a2b1c.js.
+_HASHED_URL = re.compile(r"[.\-_](?=[0-9a-f]*[0-9])[0-9a-f]{8,}\.[a-z0-9]+(?:\?|$)", re.IGNORECASE)
+
+
+def _header(headers: List[Tuple[str, str]], name: str) -> Optional[str]:
+    return next((value for key, value in headers if key.lower() == name), None)
+
+
+def freshness(url: str, headers: List[Tuple[str, str]]) -> float:
+    """Return for how many seconds a response may be served without asking the server, 0 if not at all.
+
+    Args:
+        url: Request URL.
+        headers: Response headers.
+    """
+    directives = {}
+    for directive in (_header(headers, "cache-control") or "").lower().split(","):
+        name, _, value = directive.strip().partition("=")
+        directives[name] = value.strip('"')
+    if {"no-store", "no-cache", "private"} & directives.keys():
+        return 0.0
+    if "max-age" in directives:
+        try:
+            return max(float(directives["max-age"]), 0.0)
+        except ValueError:
+            return 0.0
+    expires = _header(headers, "expires")
+    if expires is not None:
+        try:
+            date = _header(headers, "date")
+            now = parsedate_to_datetime(date).timestamp() if date else time.time()
+            return max(parsedate_to_datetime(expires).timestamp() - now, 0.0)
+        except (TypeError, ValueError):
+            return 0.0
+    return math.inf if _HASHED_URL.search(url) else 0.0
+
+
+class DiskResponseCache:
+    """Fresh responses of static assets in a directory, keyed by URL, evicted least recently used first."""
+
+    max_age = 24 * 3600
+
+    def __init__(self, directory: Path, max_bytes: int = ASSET_CACHE_MAX_MB * 1024 * 1024) -> None:
+        """Initialize the cache.
+
+        Args:
+            directory: Directory of the entries; created if missing.
+            max_bytes: Total size of the bodies above which entries are evicted.
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.stored = 0
+        self.evicted = 0
+        self._lock = threading.Lock()
+        self.logger = Logger.get_logger(self.__class__.__name__)
+
+    def _paths(self, url: str) -> Tuple[Path, Path]:
+        key = _key(url)
+        return self.directory / f"{key}.json", self.directory / f"{key}.body"
+
+    def __contains__(self, url: str) -> bool:
+        """Return whether the cache has an entry for the URL; age and body are checked by :meth:`get`."""
+        return self._paths(url)[0].exists()
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """Return the cached response of a URL and mark it as recently used, or None."""
+        meta_path, body_path = self._paths(url)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            body = body_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+        if time.time() >= meta.get("expires_at", 0):
+            self._remove(meta_path, body_path)
+            return None
+        if hashlib.sha256(body).hexdigest() != meta["sha256"]:
+            self.logger.warning("Cached body of %s does not match its hash, dropping it", url)
+            self._remove(meta_path, body_path)
+            return None
+        try:
+            os.utime(meta_path)
+        except OSError:
+            pass
+        with self._lock:
+            self.hits += 1
+        headers = [tuple(header) for header in meta["headers"]]
+        return CachedResponse(meta["status"], headers, base64.b64encode(body).decode("ascii"))
+
+    def put(self, url: str, response: CachedResponse) -> None:
+        """Store a successful, cacheable response and evict old entries if the cache grew over its size."""
+        lifetime = min(freshness(url, response.headers), self.max_age)
+        if not 200 <= response.status < 300 or lifetime <= 0:
+            return
+        body = base64.b64decode(response.body)
+        meta = {
+            "url": url,
+            "status": response.status,
+            "headers": [list(header) for header in response.headers],
+            "sha256": hashlib.sha256(body).hexdigest(),
+            "size": len(body),
+            "expires_at": time.time() + lifetime,
+        }
+        meta_path, body_path = self._paths(url)
+        # Body first: a metadata file always points to a complete body.
+        self._write(body_path, body)
+        self._write(meta_path, json.dumps(meta).encode("utf-8"))
+        with self._lock:
+            self.stored += 1
+        self.evict()
+
+    def evict(self) -> int:
+        """Remove least recently used entries until the bodies fit the size limit.
+
+        Returns:
+            int: Number of evicted entries.
+        """
+        entries = []
+        for meta_path in self.directory.glob("*.json"):
+            body_path = meta_path.with_suffix(".body")
+            try:
+                entries.append((meta_path.stat().st_mtime, body_path.stat().st_size, meta_path, body_path))
+            except OSError:
+                continue
+        total = sum(size for _, size, _, _ in entries)
+        evicted = 0
+        for _, size, meta_path, body_path in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self.max_bytes:
+                break
+            self._remove(meta_path, body_path)
+            total -= size
+            evicted += 1
+        with self._lock:
+            self.evicted += evicted
+        return evicted
+
+    def _write(self, path: Path, data: bytes) -> None:
+        fd, temp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+        os.replace(temp, path)
+
+    @staticmethod
+    def _remove(*paths: Path) -> None:
+        for path in paths:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
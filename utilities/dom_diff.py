@@ -0,0 +1,184 @@
+"""Structural snapshots of a DOM subtree and the differences between two of them.
+
+A snapshot, taken with ``Base.snapshot_dom``, keeps per element its tag, a few key
+attributes, its own text and selected computed styles. :func:`diff_dom` aligns the
+children of both snapshots by a key (tag plus id, ``aria-label``, ``data-test`` or
+first class), so an inserted row shows up as one addition instead of a change of
+every row after it, and reports what changed with a readable path::
+
+    before = menu_page.snapshot_dom()
+    menu_page.click_on_cup_by_name("Espresso")
+    menu_page.snapshot_dom().diff(before).assert_only(
+        "ul/li[1]/a*", "*/button[aria-label=Proceed to checkout]", "*/ul.cart-preview*"
+    )
+"""
+
+import re
+from collections import Counter
+from difflib import SequenceMatcher
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+__all__ = ["DomChange", "DomDiff", "DomNode", "diff_dom"]
+
+
+class DomNode(NamedTuple):
+    """One element of a DOM snapshot."""
+
+    tag: str
+    attrs: Dict[str, str]
+    text: str
+    styles: Dict[str, str]
+    children: Tuple["DomNode", ...]
+
+    @classmethod
+    def from_json(cls, data: dict) -> "DomNode":
+        """Build a snapshot from the result of the ``SNAPSHOT_DOM`` script."""
+        children = tuple(cls.from_json(child) for child in data.get("children", ()))
+        return cls(
+            data["tag"], dict(data.get("attrs", {})), data.get("text", ""), dict(data.get("styles", {})), children
+        )
+
+    @property
+    def key(self) -> str:
+        """Return the path segment of the element, e.g. ``a[aria-label=Cart page]`` or ``ul.cart-preview``."""
+        for name in ("id", "aria-label", "data-test"):
+            if self.attrs.get(name):
+                return f"{self.tag}#{self.attrs[name]}" if name == "id" else f"{self.tag}[{name}={self.attrs[name]}]"
+        classes = self.attrs.get("class", "").split()
+        return f"{self.tag}.{classes[0]}" if classes else self.tag
+
+    def iter(self) -> Iterator["DomNode"]:
+        """Yield the element and all descendants in document order."""
+        yield self
+        for child in self.children:
+            yield from child.iter()
+
+    def diff(self, before: "DomNode") -> "DomDiff":
+        """Return the changes from an earlier snapshot to this one, see :func:`diff_dom`."""
+        return diff_dom(before, self)
+
+
+class DomChange(NamedTuple):
+    """One difference between two snapshots.
+
+    ``kind`` is ``text``, ``attribute`` or ``style`` for a changed value (``name`` is
+    the attribute or style property), or ``added`` / ``removed`` for a whole element.
+    """
+
+    path: str
+    kind: str
+    name: Optional[str] = None
+    before: Optional[str] = None
+    after: Optional[str] = None
+
+    def __str__(self) -> str:
+        """Return a one-line description of the change."""
+        if self.kind in ("added", "removed"):
+            return f"{self.kind} {self.path}"
+        target = f"{self.path} {self.kind}" + (f" {self.name}" if self.name else "")
+        return f"{target}: {self.before!r} -> {self.after!r}"
+
+
+class DomDiff:
+    """Changes between two snapshots."""
+
+    def __init__(self, changes: List[DomChange]) -> None:
+        """Initialize the diff."""
+        self.changes = changes
+
+    def __bool__(self) -> bool:
+        """Return whether anything changed."""
+        return bool(self.changes)
+
+    def __iter__(self) -> Iterator[DomChange]:
+        """Iterate over the changes."""
+        return iter(self.changes)
+
+    def __len__(self) -> int:
+        """Return the number of changes."""
+        return len(self.changes)
+
+    def __str__(self) -> str:
+        """Return the changes, one per line."""
+        return "\n".join(str(change) for change in self.changes) or "no changes"
+
+    def paths(self) -> List[str]:
+        """Return the paths of the changed elements, without duplicates, in document order."""
+        return list(dict.fromkeys(change.path for change in self.changes))
+
+    def outside(self, *patterns: str) -> List[DomChange]:
+        """Return the changes not at or below a path matching one of the patterns.
+
+        In a pattern ``*`` matches any run of characters, including ``/``; everything
+        else, brackets included, matches itself.
+        """
+        matchers = [_pattern(pattern) for pattern in patterns]
+        return [change for change in self.changes if not any(match(change.path) for match in matchers)]
+
+    def assert_only(self, *patterns: str) -> None:
+        """Assert that every change is below a path matching one of the patterns.
+
+        Raises:
+            AssertionError: Listing the unexpected changes.
+        """
+        unexpected = self.outside(*patterns)
+        if unexpected:
+            raise AssertionError("Unexpected DOM changes:\n" + "\n".join(str(change) for change in unexpected))
+
+
+def _pattern(pattern: str):
+    """Return a matcher of paths at or below a path matching the pattern."""
+    return re.compile(re.escape(pattern).replace(r"\*", ".*") + "(?:/.*)?").fullmatch
+
+
+def _segments(nodes: Tuple[DomNode, ...]) -> List[str]:
+    """Return the path segments of siblings, indexed where siblings share a key."""
+    keys = [node.key for node in nodes]
+    counts = Counter(keys)
+    seen: Dict[str, int] = {}
+    segments = []
+    for key in keys:
+        index = seen.get(key, 0)
+        seen[key] = index + 1
+        segments.append(f"{key}[{index}]" if counts[key] > 1 else key)
+    return segments
+
+
+def _compare(before: DomNode, after: DomNode, path: str, changes: List[DomChange]) -> None:
+    if before.text != after.text:
+        changes.append(DomChange(path, "text", None, before.text, after.text))
+    for kind, old, new in (("attribute", before.attrs, after.attrs), ("style", before.styles, after.styles)):
+        for name in sorted(set(old) | set(new)):
+            if old.get(name) != new.get(name):
+                changes.append(DomChange(path, kind, name, old.get(name), new.get(name)))
+
+    old_segments, new_segments = _segments(before.children), _segments(after.children)
+    matcher = SequenceMatcher(None, [node.key for node in before.children], [node.key for node in after.children])
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            for i, j in zip(range(i1, i2), range(j1, j2)):
+                _compare(before.children[i], after.children[j], f"{path}/{new_segments[j]}", changes)
+            continue
+        changes.extend(DomChange(f"{path}/{old_segments[i]}", "removed") for i in range(i1, i2))
+        changes.extend(DomChange(f"{path}/{new_segments[j]}", "added") for j in range(j1, j2))
+
+
+def diff_dom(before: DomNode, after: DomNode) -> DomDiff:
+    """Return the changes between two snapshots of the same subtree.
+
+    Paths are relative to the snapshot root, joined by ``/``; siblings sharing a key
+    get an index, e.g. ``ul/li[1]/a[aria-label=Cart page]``.
+
+    Args:
+        before: Earlier snapshot.
+        after: Later snapshot.
+
+    Returns:
+        DomDiff: Changed texts, attributes and styles, and added and removed elements.
+    """
+    if before.key != after.key:
+        return DomDiff([DomChange(before.key, "removed"), DomChange(after.key, "added")])
+    changes: List[DomChange] = []
+    _compare(before, after, "", changes)
+    # Changes of the root itself are reported under its key, all others relative to it.
+    return DomDiff([change._replace(path=change.path[1:] or after.key) for change in changes])
@@ -0,0 +1,251 @@
+"""Record and replay of WebDriver traffic.
+
+In ``record`` mode every command a test sends through the ``driver`` fixture is
+logged together with its response to a gzip-compressed JSON-lines file per test. In
+``replay`` mode the fixture yields a :class:`ReplayWebDriver` that answers the same
+commands from that file without a browser and raises :class:`ReplayDivergence` as
+soon as a page object issues a different command sequence.
+
+Clock readings of the page objects' waits are logged too, so on replay every wait
+polls exactly as often as it did while recording and never sleeps. The clock is
+attached to the recorded and the replay driver as ``driver.wait_clock`` and read
+only by their waits, see ``utilities.wait_telemetry``. Script bodies longer
+than a few hundred characters (the Selenium atoms behind ``get_attribute`` and
+``is_displayed``) are stored as a digest.
+"""
+
+import gzip
+import hashlib
+import json
+import re
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Optional
+
+import selenium
+from selenium.common import exceptions
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+from config.resources import DRIVER_MODE, RECORDINGS_DIR, ROOT_DIR
+from utilities.fake_webdriver import FakeWebDriver
+
+__all__ = ["DRIVER_MODES", "DriverRecorder", "ReplayDivergence", "ReplayWebDriver", "driver_recorder"]
+
+DRIVER_MODES = ("live", "record", "replay")
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+MAX_SCRIPT_LENGTH = 256
+
+
+class ReplayDivergence(AssertionError):
+    """Raised when a replayed test issues a command sequence different from the recording."""
+
+
+def _encode(value):
+    """Return a JSON-compatible copy of a command parameter or response value."""
+    if isinstance(value, WebElement):
+        return {ELEMENT_KEY: value.id}
+    if isinstance(value, dict):
+        return {key: _encode(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode(item) for item in value]
+    return value
+
+
+def _decode(value, driver: WebDriver):
+    """Rebuild ``WebElement`` objects in a recorded response value."""
+    if isinstance(value, dict):
+        if ELEMENT_KEY in value and len(value) == 1:
+            return driver.create_web_element(value[ELEMENT_KEY])
+        return {key: _decode(item, driver) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_decode(item, driver) for item in value]
+    return value
+
+
+def _compact_params(params: Optional[dict]) -> dict:
+    """Return command parameters as logged, with long scripts replaced by their digest."""
+    params = _encode(params or {})
+    script = params.get("script")
+    if isinstance(script, str) and len(script) > MAX_SCRIPT_LENGTH:
+        params["script"] = "sha1:" + hashlib.sha1(script.encode("utf-8")).hexdigest()
+    return params
+
+
+class _WaitClock:
+    """``monotonic`` and ``sleep`` of the recorder, used by the waits of a recorded or replayed driver."""
+
+    def __init__(self, recorder: "DriverRecorder") -> None:
+        self._recorder = recorder
+
+    def monotonic(self) -> float:
+        return self._recorder.clock()
+
+    def sleep(self, seconds: float) -> None:
+        if not self._recorder.replaying:
+            time.sleep(seconds)
+
+
+class DriverRecorder:
+    """Per-test log of WebDriver commands, written in ``record`` and served in ``replay`` mode."""
+
+    def __init__(self, mode: str = DRIVER_MODE, directory: str = RECORDINGS_DIR) -> None:
+        """Initialize the recorder.
+
+        Args:
+            mode: ``live`` (no recording), ``record`` or ``replay``.
+            directory: Directory of the recordings, relative to the project root.
+        """
+        self.mode = mode
+        self.directory = ROOT_DIR / directory
+        self.test_id: Optional[str] = None
+        self._entries: List[dict] = []
+        self._position = 0
+        self._started = 0.0
+        self._diverged = False
+
+    @property
+    def replaying(self) -> bool:
+        """Return True while a recording is being replayed."""
+        return self.mode == "replay" and self.test_id is not None
+
+    def path_for(self, test_id: str) -> Path:
+        """Return the recording file of a test."""
+        return self.directory / (re.sub(r"[^\w.-]+", "_", test_id).strip("_") + ".jsonl.gz")
+
+    def has_recording(self, test_id: str) -> bool:
+        """Return True if a recording exists for the test."""
+        return self.path_for(test_id).exists()
+
+    def install(self, driver: WebDriver) -> None:
+        """Log the commands of a live driver while a test is being recorded."""
+        execute = driver.execute
+
+        def recording_execute(driver_command, params=None):
+            if self.mode != "record" or self.test_id is None:
+                return execute(driver_command, params)
+            entry = {"command": driver_command, "params": _compact_params(params)}
+            self._entries.append(entry)
+            try:
+                response = execute(driver_command, params)
+            except exceptions.WebDriverException as e:
+                entry.update(error=type(e).__name__, message=e.msg)
+                raise
+            entry["value"] = _encode((response or {}).get("value"))
+            return response
+
+        driver.execute = recording_execute
+        driver.wait_clock = _WaitClock(self)
+
+    def start(self, test_id: str) -> None:
+        """Start recording or replaying a test."""
+        self.test_id = test_id
+        self._position = 0
+        self._diverged = False
+        self._started = time.monotonic()
+        if self.mode == "replay":
+            with gzip.open(self.path_for(test_id), "rt", encoding="utf-8") as file:
+                self._entries = [json.loads(line) for line in file][1:]
+        else:
+            self._entries = []
+
+    def stop(self) -> None:
+        """Write the recording, or check that the whole recording was replayed."""
+        test_id, entries, position = self.test_id, self._entries, self._position
+        self.test_id = None
+        self._entries = []
+        if self.mode == "record":
+            path = self.path_for(test_id)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            header = {
+                "test_id": test_id,
+                "recorded_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "selenium": selenium.__version__,
+            }
+            with gzip.open(path, "wt", encoding="utf-8") as file:
+                for entry in [header, *entries]:
+                    file.write(json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n")
+        elif self.mode == "replay" and not self._diverged and position < len(entries):
+            raise ReplayDivergence(
+                f"{test_id}: {len(entries) - position} recorded commands were not issued, "
+                f"next expected {self._describe(entries[position])}"
+            )
+
+    def clock(self) -> float:
+        """Return the wait clock: real time, logged while recording, served while replaying."""
+        now = time.monotonic()
+        if self.test_id is None or self.mode == "live":
+            return now
+        if self.mode == "record":
+            self._entries.append({"clock": round(now - self._started, 6)})
+            return now
+        return self._next({"clock": None})["clock"]
+
+    def replay(self, driver: WebDriver, driver_command: str, params: Optional[dict]) -> dict:
+        """Return the recorded response to a command.
+
+        Raises:
+            ReplayDivergence: If the command differs from the next recorded one.
+        """
+        entry = self._next({"command": driver_command, "params": _compact_params(params)})
+        if "error" in entry:
+            raise getattr(exceptions, entry["error"], exceptions.WebDriverException)(entry["message"])
+        return {"value": _decode(entry.get("value"), driver)}
+
+    def _next(self, issued: dict) -> dict:
+        """Consume the next recorded entry, which must match the issued command or clock reading."""
+        position = self._position
+        if position >= len(self._entries):
+            self._diverged = True
+            raise ReplayDivergence(
+                f"{self.test_id}: recording ended, but {self._describe(issued)} was issued at #{position}"
+            )
+        entry = self._entries[position]
+        if "clock" in issued:
+            matches = "clock" in entry
+        else:
+            matches = entry.get("command") == issued["command"] and entry.get("params") == json.loads(
+                json.dumps(issued["params"])
+            )
+        if not matches:
+            self._diverged = True
+            raise ReplayDivergence(
+                f"{self.test_id}: command #{position} diverged from the recording: "
+                f"expected {self._describe(entry)}, issued {self._describe(issued)}"
+            )
+        self._position += 1
+        return entry
+
+    @staticmethod
+    def _describe(entry: dict) -> str:
+        if "clock" in entry:
+            return "a WebDriverWait clock reading"
+        return f"{entry['command']} {json.dumps(entry['params'], ensure_ascii=False)[:200]}"
+
+
+driver_recorder = DriverRecorder()
+
+
+class ReplayWebDriver(FakeWebDriver):
+    """Driver without a browser that answers commands from recordings.
+
+    Commands issued outside a replayed test, such as the session setup in the
+    ``driver`` fixture, are answered by the empty fake document.
+    """
+
+    def __init__(self, recorder: DriverRecorder = driver_recorder) -> None:
+        """Initialize the driver.
+
+        Args:
+            recorder: Recorder serving the per-test recordings.
+        """
+        super().__init__()
+        self.recorder = recorder
+        self.wait_clock = _WaitClock(recorder)
+
+    def execute(self, driver_command: str, params: dict = None) -> dict:
+        """Answer a command from the recording of the running test."""
+        if not self.recorder.replaying:
+            return super().execute(driver_command, params)
+        return self.recorder.replay(self, driver_command, params)
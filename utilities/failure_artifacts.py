@@ -0,0 +1,172 @@
+"""Failure artifact pipeline for Allure reports.
+
+On test failure only the browser round trips (screenshot, DOM snapshot, console log)
+run on the test worker. Compressing and writing the attachment files is handed to a
+background thread. Identical screenshots are stored once and the total size of the
+artifacts written during a run is capped. A DOM snapshot is attached as HTML,
+viewable in the report; only one that no longer fits under the cap is compressed,
+and attached as a gzip download holding the DOM if the compressed copy fits, or a
+note that it was dropped.
+"""
+
+import gzip
+import hashlib
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+from uuid import uuid4
+
+import allure_commons
+from allure_commons.model2 import ATTACHMENT_PATTERN, Attachment
+from allure_commons.types import AttachmentType
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from config.resources import FAILURE_ARTIFACTS_MAX_MB
+from utilities.logger import Logger
+
+__all__ = ["FailureArtifactPipeline", "failure_artifacts"]
+
+
+class FailureArtifactPipeline:
+    """Capture failure artifacts synchronously and write them to Allure in the background."""
+
+    def __init__(self, max_bytes: int = FAILURE_ARTIFACTS_MAX_MB * 1024 * 1024) -> None:
+        """Initialize the pipeline.
+
+        Args:
+            max_bytes: Upper bound for the size of all artifacts attached during the run.
+        """
+        self.max_bytes = max_bytes
+        self.used_bytes = 0
+        self.logger = Logger.get_logger(self.__class__.__name__)
+        self._screenshots: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._bytes_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def capture(self, item, driver: WebDriver) -> None:
+        """Capture screenshot, DOM snapshot and browser console log for a failed test.
+
+        Args:
+            item: The pytest test item.
+            driver: WebDriver instance used by the test.
+        """
+        screenshot = driver.get_screenshot_as_png()
+        self._attach_screenshot(item, screenshot)
+
+        dom = driver.page_source.encode("utf-8")
+        name = f"dom_on_failure_{item.name}"
+        if not self._attach(item, name, dom, AttachmentType.HTML.mime_type, "html", warn=False):
+            # The type has to be registered while the test result is open; the size is checked once compressed.
+            file_name = ATTACHMENT_PATTERN.format(prefix=uuid4(), ext="html.gz")
+            if self._register(item, name, "application/gzip", file_name):
+                self._get_executor().submit(self._write_compressed, name, file_name, dom)
+
+        console = self._get_console_log(driver)
+        if console:
+            self._attach(item, f"console_on_failure_{item.name}", console, AttachmentType.TEXT.mime_type, "txt")
+
+    def close(self) -> None:
+        """Wait for queued artifacts to be written."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _attach_screenshot(self, item, screenshot: bytes) -> None:
+        """Attach a screenshot, reusing the already written file for identical images."""
+        name = f"screenshot_on_failure_{item.name}"
+        digest = hashlib.sha1(screenshot).hexdigest()
+        file_name = self._screenshots.get(digest)
+        if file_name:
+            self._register(item, name, AttachmentType.PNG.mime_type, file_name)
+            return
+        file_name = self._attach(item, name, screenshot, AttachmentType.PNG.mime_type, AttachmentType.PNG.extension)
+        if file_name:
+            self._screenshots[digest] = file_name
+
+    def _attach(self, item, name: str, body: bytes, mime_type: str, extension: str, warn: bool = True) -> Optional[str]:
+        """Register an attachment on the current test and queue writing its file.
+
+        Args:
+            warn: Log a warning when the attachment is dropped for the size cap.
+
+        Returns:
+            str: Attachment file name, or None if the attachment was dropped.
+        """
+        if not self._reserve(len(body)):
+            if warn:
+                self.logger.warning("Failure artifact '%s' dropped: size cap of %d bytes reached", name, self.max_bytes)
+            return None
+        file_name = ATTACHMENT_PATTERN.format(prefix=uuid4(), ext=extension)
+        if not self._register(item, name, mime_type, file_name):
+            self._reserve(-len(body))
+            return None
+        self._get_executor().submit(self._write, file_name, body)
+        return file_name
+
+    def _reserve(self, size: int) -> bool:
+        """Count an artifact against the size cap if it fits; a negative size releases it again.
+
+        Returns:
+            bool: False if the artifact does not fit.
+        """
+        with self._bytes_lock:
+            if self.used_bytes + size > self.max_bytes:
+                return False
+            self.used_bytes += size
+            return True
+
+    @staticmethod
+    def _register(item, name: str, mime_type: str, file_name: str) -> bool:
+        """Add attachment metadata to the running Allure test result.
+
+        Returns:
+            bool: False if Allure reporting is not enabled for the run.
+        """
+        listener = item.config.pluginmanager.getplugin("allure_listener")
+        if listener is None:
+            return False
+        test_result = listener.allure_logger.get_test(None)
+        if test_result is None:
+            return False
+        test_result.attachments.append(Attachment(source=file_name, name=name, type=mime_type))
+        return True
+
+    def _write(self, file_name: str, body: bytes) -> None:
+        """Write the attachment file to the Allure results directory."""
+        try:
+            allure_commons.plugin_manager.hook.report_attached_data(body=body, file_name=file_name)
+        except Exception as e:
+            self.logger.error("Failed to write failure artifact %s: %s", file_name, e)
+
+    def _write_compressed(self, name: str, file_name: str, body: bytes) -> None:
+        """Compress an attachment and write it, or a note in its place if it still exceeds the size cap."""
+        try:
+            body = gzip.compress(body)
+        except Exception as e:
+            self.logger.error("Failed to compress failure artifact %s: %s", file_name, e)
+            return
+        if not self._reserve(len(body)):
+            self.logger.warning("Failure artifact '%s' dropped: size cap of %d bytes reached", name, self.max_bytes)
+            body = gzip.compress(f"{name} dropped: size cap of {self.max_bytes} bytes reached\n".encode("utf-8"))
+        self._write(file_name, body)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the background writer, starting it on first use."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="failure-artifacts")
+            return self._executor
+
+    @staticmethod
+    def _get_console_log(driver: WebDriver) -> bytes:
+        """Return the browser console log as JSON lines, or empty bytes if it is not available."""
+        try:
+            entries = driver.get_log("browser")
+        except Exception:
+            return b""
+        return "\n".join(json.dumps(entry) for entry in entries).encode("utf-8")
+
+
+failure_artifacts = FailureArtifactPipeline()
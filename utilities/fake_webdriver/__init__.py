@@ -0,0 +1,5 @@
+"""In-memory fake WebDriver for running page objects without a browser."""
+
+from utilities.fake_webdriver.driver import FakeWebDriver
+
+__all__ = ["FakeWebDriver"]
@@ -0,0 +1,278 @@
+"""CSS selector engine for the fake WebDriver.
+
+Supports type, universal, ``#id``, ``.class`` and attribute selectors
+(``[a]``, ``=``, ``~=``, ``|=``, ``^=``, ``$=``, ``*=``), the ``:nth-child()``,
+``:first-child``, ``:last-child`` and ``:not()`` pseudo-classes and the descendant,
+``>``, ``+`` and ``~`` combinators. Parsed selectors are cached.
+"""
+
+import functools
+import re
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+from utilities.fake_webdriver.dom import Element
+
+__all__ = ["Selector", "SelectorError", "matches", "parse", "select", "specificity"]
+
+_IDENT = r"-?[_a-zA-Z][-_a-zA-Z0-9]*"
+_TOKEN_RE = re.compile(
+    rf"""
+    (?P<ws>\s+)
+  | (?P<comb>\s*[>+~]\s*)
+  | (?P<comma>\s*,\s*)
+  | (?P<id>\#{_IDENT})
+  | (?P<cls>\.{_IDENT})
+  | (?P<attr>\[\s*(?P<attr_name>{_IDENT})\s*
+        (?:(?P<attr_op>[~|^$*]?=)\s*(?:"(?P<dq>[^"]*)"|'(?P<sq>[^']*)'|(?P<bare>[^\]\s]+))\s*)?\])
+  | (?P<pseudo>:{{1,2}}(?P<pseudo_name>{_IDENT})(?:\((?P<pseudo_arg>(?:[^()]|\([^()]*\))*)\))?)
+  | (?P<tag>\*|{_IDENT})
+    """,
+    re.VERBOSE,
+)
+_NTH_RE = re.compile(r"^\s*(?:(?P<a>[+-]?\d*)n\s*(?:(?P<sign>[+-])\s*(?P<b>\d+))?|(?P<only_b>[+-]?\d+))\s*$")
+
+
+class SelectorError(ValueError):
+    """Raised for selectors the engine cannot parse."""
+
+
+class Compound(NamedTuple):
+    """Simple selectors that all apply to one element."""
+
+    tag: Optional[str]
+    ids: Tuple[str, ...]
+    classes: Tuple[str, ...]
+    attrs: Tuple[Tuple[str, Optional[str], Optional[str]], ...]
+    pseudos: Tuple[Tuple[str, object], ...]
+
+
+# One complex selector: ``(combinator, compound)`` pairs from left to right, the first
+# combinator is None.
+Selector = Tuple[Tuple[Optional[str], Compound], ...]
+
+
+def _parse_nth(argument: str) -> Tuple[int, int]:
+    """Return ``(a, b)`` of an ``an+b`` expression."""
+    argument = argument.strip().lower()
+    if argument == "odd":
+        return 2, 1
+    if argument == "even":
+        return 2, 0
+    match = _NTH_RE.match(argument)
+    if not match:
+        raise SelectorError(f"Invalid :nth-child argument: {argument!r}")
+    if match.group("only_b") is not None:
+        return 0, int(match.group("only_b"))
+    a = match.group("a")
+    a = 1 if a in ("", "+") else -1 if a == "-" else int(a)
+    b = int(match.group("b") or 0)
+    return a, -b if match.group("sign") == "-" else b
+
+
+@functools.lru_cache(maxsize=512)
+def parse(text: str) -> Tuple[Selector, ...]:
+    """Parse a selector list.
+
+    Args:
+        text: Selector list, e.g. ``"div.list ul:not(.cart-preview) > li"``.
+
+    Returns:
+        tuple: One parsed selector per comma-separated entry.
+    """
+    selectors: List[Selector] = []
+    current: List[Tuple[Optional[str], Compound]] = []
+    parts = {"tag": None, "ids": [], "classes": [], "attrs": [], "pseudos": []}
+    combinator: Optional[str] = None
+    started = False
+
+    def close_compound() -> None:
+        nonlocal started, combinator
+        if not started:
+            raise SelectorError(f"Invalid selector: {text!r}")
+        current.append(
+            (
+                combinator,
+                Compound(
+                    parts["tag"],
+                    tuple(parts["ids"]),
+                    tuple(parts["classes"]),
+                    tuple(parts["attrs"]),
+                    tuple(parts["pseudos"]),
+                ),
+            )
+        )
+        parts.update(tag=None, ids=[], classes=[], attrs=[], pseudos=[])
+        started = False
+        combinator = None
+
+    position = 0
+    text = text.strip()
+    while position < len(text):
+        match = _TOKEN_RE.match(text, position)
+        if not match:
+            raise SelectorError(f"Invalid selector: {text!r}")
+        position = match.end()
+        if match.group("ws") is not None:
+            close_compound()
+            combinator = " "
+        elif match.group("comb") is not None:
+            if started:
+                close_compound()
+            combinator = match.group("comb").strip()
+        elif match.group("comma") is not None:
+            if started:
+                close_compound()
+            selectors.append(tuple(current))
+            current = []
+        elif match.group("id") is not None:
+            parts["ids"].append(match.group("id")[1:])
+            started = True
+        elif match.group("cls") is not None:
+            parts["classes"].append(match.group("cls")[1:])
+            started = True
+        elif match.group("attr") is not None:
+            value = next((v for v in match.group("dq", "sq", "bare") if v is not None), None)
+            parts["attrs"].append((match.group("attr_name").lower(), match.group("attr_op"), value))
+            started = True
+        elif match.group("pseudo") is not None:
+            name = match.group("pseudo_name").lower()
+            argument = match.group("pseudo_arg")
+            if name == "nth-child":
+                parts["pseudos"].append((name, _parse_nth(argument or "")))
+            elif name == "not":
+                parts["pseudos"].append((name, parse(argument or "")))
+            elif name in ("first-child", "last-child"):
+                parts["pseudos"].append((name, None))
+            else:
+                raise SelectorError(f"Unsupported pseudo-class: :{name}")
+            started = True
+        elif match.group("tag") is not None:
+            if started:
+                raise SelectorError(f"Invalid selector: {text!r}")
+            parts["tag"] = match.group("tag").lower()
+            started = True
+    close_compound()
+    selectors.append(tuple(current))
+    return tuple(selectors)
+
+
+def specificity(selector: Selector) -> Tuple[int, int, int]:
+    """Return the ``(ids, classes, types)`` specificity of a parsed selector."""
+    ids = classes = types = 0
+    for _, compound in selector:
+        ids += len(compound.ids)
+        classes += len(compound.classes) + len(compound.attrs)
+        for name, argument in compound.pseudos:
+            if name == "not":
+                inner = max(specificity(s) for s in argument)
+                ids, classes, types = ids + inner[0], classes + inner[1], types + inner[2]
+            else:
+                classes += 1
+        if compound.tag not in (None, "*"):
+            types += 1
+    return ids, classes, types
+
+
+def _match_attr(element: Element, name: str, op: Optional[str], value: Optional[str]) -> bool:
+    """Match one attribute selector."""
+    actual = element.attrs.get(name)
+    if actual is None:
+        return False
+    if op is None:
+        return True
+    if op == "=":
+        return actual == value
+    if op == "~=":
+        return value in actual.split()
+    if op == "|=":
+        return actual == value or actual.startswith(value + "-")
+    if not value:
+        return False
+    if op == "^=":
+        return actual.startswith(value)
+    if op == "$=":
+        return actual.endswith(value)
+    return value in actual
+
+
+def _sibling_elements(element: Element) -> List[Element]:
+    """Return the element children of the parent of ``element``."""
+    return element.parent.element_children if element.parent is not None else [element]
+
+
+def _match_compound(element: Element, compound: Compound) -> bool:
+    """Match a compound selector against one element."""
+    if compound.tag not in (None, "*") and element.tag != compound.tag:
+        return False
+    if compound.ids and any(element.attrs.get("id") != ident for ident in compound.ids):
+        return False
+    if compound.classes:
+        classes = element.classes
+        if any(name not in classes for name in compound.classes):
+            return False
+    for name, op, value in compound.attrs:
+        if not _match_attr(element, name, op, value):
+            return False
+    for name, argument in compound.pseudos:
+        if name == "not":
+            if any(matches(element, selector) for selector in argument):
+                return False
+            continue
+        siblings = _sibling_elements(element)
+        if name == "first-child":
+            if siblings[0] is not element:
+                return False
+        elif name == "last-child":
+            if siblings[-1] is not element:
+                return False
+        else:
+            a, b = argument
+            position = siblings.index(element) + 1
+            if a == 0:
+                if position != b:
+                    return False
+            elif (position - b) % a != 0 or (position - b) // a < 0:
+                return False
+    return True
+
+
+def _match_at(element: Element, selector: Selector, position: int) -> bool:
+    """Match ``selector[:position + 1]`` with ``element`` as the subject."""
+    combinator, compound = selector[position]
+    if not _match_compound(element, compound):
+        return False
+    if position == 0:
+        return True
+    if combinator == ">":
+        parent = element.parent
+        return isinstance(parent, Element) and parent.tag[0] != "#" and _match_at(parent, selector, position - 1)
+    if combinator == " ":
+        return any(_match_at(ancestor, selector, position - 1) for ancestor in element.ancestors())
+    siblings = _sibling_elements(element)
+    before = siblings[: siblings.index(element)]
+    if combinator == "+":
+        return bool(before) and _match_at(before[-1], selector, position - 1)
+    return any(_match_at(sibling, selector, position - 1) for sibling in before)
+
+
+def matches(element: Element, selector: Selector) -> bool:
+    """Return True if the element matches a parsed selector."""
+    return _match_at(element, selector, len(selector) - 1)
+
+
+def select(root: Element, text: str, include_root: bool = False) -> List[Element]:
+    """Return elements under ``root`` that match a selector list, in document order.
+
+    Like ``querySelectorAll``, ancestors of ``root`` take part in matching.
+
+    Args:
+        root: Element or document to search.
+        text: Selector list.
+        include_root: Also consider ``root`` itself.
+
+    Returns:
+        list: Matching elements.
+    """
+    selectors = parse(text)
+    candidates: Iterable[Element] = root.iter() if include_root else root.descendants()
+    return [element for element in candidates if any(matches(element, selector) for selector in selectors)]
@@ -0,0 +1,206 @@
+"""Minimal HTML document model used by the fake WebDriver."""
+
+from html import escape
+from html.parser import HTMLParser
+from typing import Dict, Iterator, List, Optional, Union
+
+__all__ = ["Attr", "Document", "Element", "Text", "parse_html", "serialize"]
+
+VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+
+
+class Text:
+    """Text node."""
+
+    __slots__ = ("data", "parent", "index")
+
+    def __init__(self, data: str, parent: "Element") -> None:
+        """Initialize the text node."""
+        self.data = data
+        self.parent = parent
+        self.index = 0
+
+    @property
+    def string_value(self) -> str:
+        """Return the XPath string value of the node."""
+        return self.data
+
+
+class Attr:
+    """Attribute node, only created while evaluating XPath ``@name`` steps."""
+
+    __slots__ = ("name", "value", "parent")
+
+    def __init__(self, name: str, value: str, parent: "Element") -> None:
+        """Initialize the attribute node."""
+        self.name = name
+        self.value = value
+        self.parent = parent
+
+    @property
+    def index(self) -> float:
+        """Sort attributes right after their owner element in document order."""
+        return self.parent.index + 0.5
+
+    @property
+    def string_value(self) -> str:
+        """Return the XPath string value of the node."""
+        return self.value
+
+
+class Element:
+    """Element node."""
+
+    __slots__ = ("tag", "attrs", "children", "parent", "index", "properties", "content")
+
+    def __init__(self, tag: str, attrs: Optional[Dict[str, str]] = None, parent: "Element" = None) -> None:
+        """Initialize the element.
+
+        Args:
+            tag: Lower-case tag name.
+            attrs: Attribute values by name.
+            parent: Parent element, None for the document.
+        """
+        self.tag = tag
+        self.attrs: Dict[str, str] = dict(attrs or {})
+        self.children: List[Union["Element", Text]] = []
+        self.parent = parent
+        self.index = 0
+        self.properties: Dict[str, object] = {}
+        self.content: Optional["Element"] = None
+
+    def __repr__(self) -> str:
+        """Return a short description of the element."""
+        return f"<{self.tag} {self.attrs}>"
+
+    @property
+    def element_children(self) -> List["Element"]:
+        """Return child elements without text nodes."""
+        return [child for child in self.children if isinstance(child, Element)]
+
+    @property
+    def classes(self) -> List[str]:
+        """Return the class list of the element."""
+        return self.attrs.get("class", "").split()
+
+    def get(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        """Return an attribute value."""
+        return self.attrs.get(name, default)
+
+    def iter(self) -> Iterator["Element"]:
+        """Yield the element and all descendant elements in document order."""
+        yield self
+        for child in self.children:
+            if isinstance(child, Element):
+                yield from child.iter()
+
+    def descendants(self) -> Iterator["Element"]:
+        """Yield descendant elements in document order."""
+        iterator = self.iter()
+        next(iterator)
+        yield from iterator
+
+    def ancestors(self) -> Iterator["Element"]:
+        """Yield ancestor elements from the parent up, excluding the document."""
+        node = self.parent
+        while node is not None and not isinstance(node, Document):
+            yield node
+            node = node.parent
+
+    def text_content(self) -> str:
+        """Return the concatenated text of all descendant text nodes."""
+        parts = []
+        for child in self.children:
+            if isinstance(child, Text):
+                parts.append(child.data)
+            else:
+                parts.append(child.text_content())
+        return "".join(parts)
+
+    @property
+    def string_value(self) -> str:
+        """Return the XPath string value of the node."""
+        return self.text_content()
+
+
+class Document(Element):
+    """Document node, the root of a parsed tree."""
+
+    def __init__(self) -> None:
+        """Initialize an empty document."""
+        super().__init__("#document")
+
+    def reindex(self) -> None:
+        """Assign document-order indexes to all nodes."""
+        position = 0
+        for element in self.iter():
+            element.index = position
+            position += 1
+            for child in element.children:
+                if isinstance(child, Text):
+                    child.index = position
+                    position += 1
+
+
+class _TreeBuilder(HTMLParser):
+    """Build a :class:`Document` from HTML source."""
+
+    def __init__(self) -> None:
+        """Initialize the builder."""
+        super().__init__(convert_charrefs=True)
+        self.document = Document()
+        self._stack = [("#document", self.document)]
+
+    def handle_starttag(self, tag, attrs):
+        """Open an element; ``<template>`` content goes to a detached fragment."""
+        parent = self._stack[-1][1]
+        element = Element(tag, {name: value if value is not None else "" for name, value in attrs}, parent)
+        parent.children.append(element)
+        if tag == "template":
+            element.content = Element("#document-fragment")
+            self._stack.append((tag, element.content))
+        elif tag not in VOID_TAGS:
+            self._stack.append((tag, element))
+
+    def handle_startendtag(self, tag, attrs):
+        """Add an element without children."""
+        parent = self._stack[-1][1]
+        parent.children.append(Element(tag, {name: value or "" for name, value in attrs}, parent))
+
+    def handle_endtag(self, tag):
+        """Close the innermost open element with this tag."""
+        for position in range(len(self._stack) - 1, 0, -1):
+            if self._stack[position][0] == tag:
+                del self._stack[position:]
+                return
+
+    def handle_data(self, data):
+        """Add a text node."""
+        parent = self._stack[-1][1]
+        parent.children.append(Text(data, parent))
+
+
+def parse_html(html: str) -> Document:
+    """Parse HTML source into a document tree."""
+    builder = _TreeBuilder()
+    builder.feed(html)
+    builder.close()
+    builder.document.reindex()
+    return builder.document
+
+
+def serialize(node: Union[Element, Text]) -> str:
+    """Serialize a node back to HTML."""
+    if isinstance(node, Text):
+        if node.parent is not None and node.parent.tag in ("script", "style"):
+            return node.data
+        return escape(node.data, quote=False)
+    inner = "".join(serialize(child) for child in node.children)
+    if node.content is not None:
+        inner += "".join(serialize(child) for child in node.content.children)
+    if isinstance(node, Document):
+        return "<!DOCTYPE html>" + inner
+    attrs = "".join(f' {name}="{escape(value)}"' for name, value in node.attrs.items())
+    if node.tag in VOID_TAGS:
+        return f"<{node.tag}{attrs}>"
+    return f"<{node.tag}{attrs}>{inner}</{node.tag}>"
@@ -0,0 +1,643 @@
+"""In-memory WebDriver backed by a parsed HTML document.
+
+``FakeWebDriver`` is a real ``selenium`` ``WebDriver`` subclass whose ``execute``
+answers commands from a :mod:`dom` tree instead of sending them to a browser, so page
+objects, ``WebElement``, ``ActionChains`` and ``WebDriverWait`` run unchanged. It
+knows the locator strategies used in ``pages/``, the atoms Selenium sends through
+``execute_script`` (``getAttribute``, ``isDisplayed``), ``getComputedStyle`` and the
+``awaitAbsence``, ``installIdleTracker`` and ``waitForIdle`` snippets of ``pages.scripts``,
+and sleeps a fixed time per command to model browser round trips. Without a JavaScript engine the
+document never changes on its own, so asynchronous scripts are answered at once.
+
+The page has no JavaScript engine. Behaviour triggered by clicks, hovers or typing is
+modelled with Python listeners registered through :meth:`FakeWebDriver.on`, and other
+``execute_script`` snippets with :meth:`FakeWebDriver.register_script`.
+"""
+
+import re
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+from uuid import uuid4
+
+from selenium.common.exceptions import (
+    InvalidSelectorException,
+    JavascriptException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    WebDriverException,
+)
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.errorhandler import ErrorHandler
+from selenium.webdriver.remote.file_detector import LocalFileDetector
+from selenium.webdriver.remote.locator_converter import LocatorConverter
+from selenium.webdriver.remote.switch_to import SwitchTo
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+from utilities.fake_webdriver import css, xpath
+from utilities.fake_webdriver.dom import Document, Element, Text, parse_html, serialize
+
+__all__ = ["FakeWebDriver"]
+
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+COMPUTED_STYLE_SCRIPT = "return window.getComputedStyle(arguments[0])[arguments[1]];"
+# 1x1 transparent PNG returned for every screenshot.
+SCREENSHOT_PNG = "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg=="
+
+NON_RENDERED_TAGS = {"head", "link", "meta", "script", "style", "template", "title"}
+BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "body", "details", "dialog", "div", "fieldset", "figure",
+    "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr", "html", "main", "nav", "ol", "p",
+    "pre", "section", "summary", "table", "tr", "ul",
+}  # fmt: skip
+INHERITED_PROPERTIES = {"color", "cursor", "font-family", "font-size", "font-weight", "list-style", "visibility"}
+DEFAULT_STYLE = {"position": "static", "visibility": "visible", "cursor": "auto", "color": "rgb(0, 0, 0)"}
+BORDER_STYLES = {"none", "hidden", "dotted", "dashed", "solid", "double", "groove", "ridge", "inset", "outset"}
+NAMED_COLORS = {"black": (0, 0, 0), "white": (255, 255, 255), "red": (255, 0, 0), "green": (0, 128, 0)}
+
+_HEX_COLOR_RE = re.compile(r"#([0-9a-fA-F]{3}|[0-9a-fA-F]{6})\b")
+_CAMEL_RE = re.compile(r"([A-Z])")
+_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+
+Listener = Callable[["FakeWebDriver", Element], None]
+ScriptHandler = Callable[..., object]
+
+
+def _hex_to_rgb(match: re.Match) -> str:
+    """Convert a ``#rgb`` or ``#rrggbb`` color to ``rgb()`` notation."""
+    digits = match.group(1)
+    if len(digits) == 3:
+        digits = "".join(ch * 2 for ch in digits)
+    red, green, blue = (int(digits[i : i + 2], 16) for i in (0, 2, 4))
+    return f"rgb({red}, {green}, {blue})"
+
+
+def _normalize_value(value: str) -> str:
+    """Return a declared value in the form ``getComputedStyle`` reports it."""
+    value = _HEX_COLOR_RE.sub(_hex_to_rgb, value.replace("!important", "").strip())
+    if value in NAMED_COLORS:
+        return "rgb({}, {}, {})".format(*NAMED_COLORS[value])
+    return value
+
+
+def _parse_declarations(text: str) -> Dict[str, str]:
+    """Parse ``prop: value; ...`` declarations, expanding the ``border`` shorthand."""
+    declarations = {}
+    for declaration in text.split(";"):
+        name, _, value = declaration.partition(":")
+        name, value = name.strip().lower(), _normalize_value(value)
+        if not name or not value:
+            continue
+        declarations[name] = value
+        if name == "border":
+            for token in re.findall(r"rgba?\([^)]*\)|\S+", value):
+                if token in BORDER_STYLES:
+                    declarations["border-style"] = token
+                elif token[0].isdigit() or token in ("thin", "medium", "thick"):
+                    declarations["border-width"] = token
+                else:
+                    declarations["border-color"] = token
+        elif name == "background" and re.fullmatch(r"rgba?\([^)]*\)|[a-z]+", value):
+            declarations["background-color"] = value
+    return declarations
+
+
+def _parse_stylesheet(text: str, order_start: int = 0) -> List[Tuple[tuple, int, tuple, Dict[str, str]]]:
+    """Parse CSS rules into ``(specificity, order, selector, declarations)`` entries.
+
+    At-rules such as ``@media`` are skipped together with their block, and so are
+    rules whose selectors the engine does not support.
+    """
+    rules = []
+    text = _COMMENT_RE.sub("", text)
+    position = 0
+    order = order_start
+    while True:
+        brace = text.find("{", position)
+        if brace == -1:
+            return rules
+        prelude = text[position:brace].strip()
+        if prelude.startswith("@"):
+            depth, position = 1, brace + 1
+            while depth and position < len(text):
+                depth += {"{": 1, "}": -1}.get(text[position], 0)
+                position += 1
+            continue
+        end = text.find("}", brace)
+        if end == -1:
+            return rules
+        declarations = _parse_declarations(text[brace + 1 : end])
+        position = end + 1
+        try:
+            selectors = css.parse(prelude)
+        except css.SelectorError:
+            continue
+        for selector in selectors:
+            rules.append((css.specificity(selector), order, selector, declarations))
+            order += 1
+
+
+class FakeWebDriver(WebDriver):
+    """WebDriver that serves commands from an in-memory HTML document."""
+
+    def __init__(self, html: str = "", url: str = "about:blank", latency_ms: float = 0.0) -> None:
+        """Initialize the driver without starting a browser session.
+
+        Args:
+            html: Document served for every URL, like a single-page app.
+            url: Initial current URL.
+            latency_ms: Simulated duration of every command in milliseconds.
+        """
+        self.session_id = f"fake-{uuid4().hex}"
+        self.caps = {"browserName": "fake", "browserVersion": "0", "platformName": "any"}
+        self.command_executor = None
+        self.error_handler = ErrorHandler()
+        self.file_detector = LocalFileDetector()
+        self.locator_converter = LocatorConverter()
+        self.pinned_scripts: Dict[str, str] = {}
+        self._is_remote = False
+        self._web_element_cls = WebElement
+        self._switch_to = SwitchTo(self)
+        self._authenticator_id = None
+
+        self.latency_ms = latency_ms
+        self._timeouts: Dict[str, int] = {}
+        self.events: List[Tuple[str, Element]] = []
+        self.console: List[dict] = []
+        self._html = html
+        self._listeners: List[Tuple[str, str, Listener]] = []
+        self._scripts: Dict[str, ScriptHandler] = {}
+        self._element_ids: Dict[int, str] = {}
+        self._elements: Dict[str, Element] = {}
+        self._styles: Dict[int, Dict[str, str]] = {}
+        self._load(url)
+
+    # Document access used by listeners and script handlers
+
+    def query_selector_all(self, selector: str, root: Optional[Element] = None) -> List[Element]:
+        """Return elements matching a CSS selector, like ``querySelectorAll``."""
+        return css.select(root or self.document, selector)
+
+    def query_selector(self, selector: str, root: Optional[Element] = None) -> Optional[Element]:
+        """Return the first element matching a CSS selector, or None."""
+        found = self.query_selector_all(selector, root)
+        return found[0] if found else None
+
+    def rendered_text(self, element: Element) -> str:
+        """Return the text of an element as rendered, like ``innerText``."""
+        if not self.is_node_displayed(element):
+            return ""
+        parts: List[str] = []
+        self._collect_text(element, parts)
+        lines = (" ".join(line.split()) for line in "".join(parts).split("\n"))
+        return "\n".join(line for line in lines if line)
+
+    def is_node_displayed(self, element: Element) -> bool:
+        """Return True if neither the element nor an ancestor is hidden."""
+        for node in (element, *element.ancestors()):
+            if node.tag in NON_RENDERED_TAGS or "hidden" in node.attrs:
+                return False
+            if node.tag == "dialog" and "open" not in node.attrs:
+                return False
+            if node.tag == "input" and node.attrs.get("type") == "hidden":
+                return False
+            style = self.computed_style(node)
+            if style["display"] == "none" or style["visibility"] == "hidden":
+                return False
+        return True
+
+    def computed_style(self, element: Element) -> Dict[str, str]:
+        """Return the cascaded style of an element: stylesheet rules, inline style and inheritance."""
+        style = self._styles.get(id(element))
+        if style is not None:
+            return style
+
+        parent = element.parent
+        inherited = self.computed_style(parent) if parent is not None and parent.tag[0] != "#" else DEFAULT_STYLE
+        style = {name: value for name, value in inherited.items() if name in INHERITED_PROPERTIES}
+        style["display"] = self._default_display(element)
+        matched = sorted((rule for rule in self._rules if css.matches(element, rule[2])), key=lambda r: r[:2])
+        for _, _, _, declarations in matched:
+            style.update(declarations)
+        style.update(_parse_declarations(element.attrs.get("style", "")))
+        for name, value in DEFAULT_STYLE.items():
+            style.setdefault(name, value)
+        self._styles[id(element)] = style
+        return style
+
+    def set_attribute(self, element: Element, name: str, value: str) -> None:
+        """Set an attribute, as a script would do."""
+        element.attrs[name] = value
+        self._invalidate()
+
+    def remove_attribute(self, element: Element, name: str) -> None:
+        """Remove an attribute if present."""
+        element.attrs.pop(name, None)
+        self._invalidate()
+
+    def set_inner_html(self, element: Element, html: str) -> None:
+        """Replace the children of an element with parsed HTML."""
+        fragment = parse_html(html)
+        element.children = fragment.children
+        for child in element.children:
+            child.parent = element
+        self._invalidate()
+
+    def set_text(self, element: Element, text: str) -> None:
+        """Replace the children of an element with a single text node."""
+        element.children = [Text(text, element)]
+        self._invalidate()
+
+    # Extension points
+
+    def on(self, event: str, selector: str, listener: Listener) -> None:
+        """Register a listener for ``click``, ``dblclick``, ``contextmenu``, ``hover`` or ``input``.
+
+        Like a delegated DOM listener it runs when the event target or one of its
+        ancestors matches ``selector``, and receives the matching element.
+        """
+        self._listeners.append((event, selector, listener))
+
+    def register_script(self, script: str, handler: ScriptHandler) -> None:
+        """Answer ``execute_script(script, *args)`` with ``handler(driver, *args)``."""
+        self._scripts[script] = handler
+
+    # WebDriver protocol
+
+    def start_client(self) -> None:
+        """Nothing to start."""
+
+    def stop_client(self) -> None:
+        """Nothing to stop."""
+
+    def quit(self) -> None:
+        """End the fake session."""
+        self.execute(Command.QUIT)
+
+    def execute(self, driver_command: str, params: dict = None) -> dict:
+        """Answer a WebDriver command from the in-memory document.
+
+        Args:
+            driver_command: Name of the command, one of ``Command``.
+            params: Command parameters.
+
+        Returns:
+            dict: Response with the command result under ``"value"``.
+        """
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+        handler = self._COMMANDS.get(driver_command)
+        if handler is None:
+            raise WebDriverException(f"Command not supported by FakeWebDriver: {driver_command}")
+        return {"value": handler(self, params or {})}
+
+    # Command handlers
+
+    def _cmd_get(self, params: dict):
+        self._load(params["url"])
+
+    def _cmd_refresh(self, params: dict):
+        self._load(self.url)
+
+    def _cmd_find_element(self, params: dict):
+        return self._wrap(self._find_one(self.document, params))
+
+    def _cmd_find_elements(self, params: dict):
+        return [self._wrap(node) for node in self._find(self.document, params)]
+
+    def _cmd_find_child_element(self, params: dict):
+        return self._wrap(self._find_one(self._element(params["id"]), params))
+
+    def _cmd_find_child_elements(self, params: dict):
+        return [self._wrap(node) for node in self._find(self._element(params["id"]), params)]
+
+    def _cmd_element_text(self, params: dict):
+        return self.rendered_text(self._element(params["id"]))
+
+    def _cmd_element_tag_name(self, params: dict):
+        return self._element(params["id"]).tag
+
+    def _cmd_element_rect(self, params: dict):
+        self._element(params["id"])
+        return {"x": 0, "y": 0, "width": 0, "height": 0}
+
+    def _cmd_element_enabled(self, params: dict):
+        return "disabled" not in self._element(params["id"]).attrs
+
+    def _cmd_element_selected(self, params: dict):
+        attrs = self._element(params["id"]).attrs
+        return "checked" in attrs or "selected" in attrs
+
+    def _cmd_element_attribute(self, params: dict):
+        return self._element(params["id"]).attrs.get(params["name"])
+
+    def _cmd_element_property(self, params: dict):
+        element = self._element(params["id"])
+        if params["name"] == "value":
+            return self._value(element)
+        return element.properties.get(params["name"], element.attrs.get(params["name"]))
+
+    def _cmd_element_css(self, params: dict):
+        value = self.computed_style(self._element(params["id"])).get(params["propertyName"], "")
+        # Chrome reports colors through this endpoint as rgba().
+        return re.sub(r"rgb\((\d+), (\d+), (\d+)\)", r"rgba(\1, \2, \3, 1)", value)
+
+    def _cmd_click(self, params: dict):
+        element = self._element(params["id"])
+        if not self.is_node_displayed(element):
+            raise WebDriverException("element not interactable")
+        self._dispatch("click", element)
+
+    def _cmd_send_keys(self, params: dict):
+        element = self._element(params["id"])
+        value = self._value(element)
+        selected = element.properties.get("selected_all", False)
+        control = False
+        for key in params["text"]:
+            if key == Keys.CONTROL:
+                control = True
+            elif key == Keys.NULL:
+                control = False
+            elif control and key == "a":
+                selected = True
+            elif key in (Keys.DELETE, Keys.BACKSPACE):
+                value = "" if selected else value[:-1] if key == Keys.BACKSPACE else value
+                selected = False
+            elif not "\ue000" <= key <= "\uf8ff":
+                value = key if selected else value + key
+                selected = False
+        element.properties["value"] = value
+        element.properties["selected_all"] = selected
+        self._dispatch("input", element)
+
+    def _cmd_clear(self, params: dict):
+        element = self._element(params["id"])
+        element.properties["value"] = ""
+        self._dispatch("input", element)
+
+    def _cmd_execute_script(self, params: dict):
+        script = params["script"]
+        args = [self._unwrap(arg) for arg in params.get("args", [])]
+        if script.startswith("/* getAttribute */"):
+            return self._get_attribute(*args)
+        if script.startswith("/* isDisplayed */"):
+            return self.is_node_displayed(args[0])
+        if script.startswith("/* awaitAbsence */"):
+            using, value, displayed = args[:3]
+            found = self._find(self.document, {"using": using, "value": value})
+            present = any(self.is_node_displayed(element) for element in found) if displayed else bool(found)
+            return {"present": present, "quiescent": True, "waitedMs": 0}
+        if script.startswith("/* installIdleTracker */"):
+            return None
+        if script.startswith("/* waitForIdle */"):
+            return {"idle": True, "waitedMs": 0, "requests": 0, "frames": 0}
+        if script.startswith("/* snapshotDom */"):
+            using, value, attributes, styles = args[:4]
+            found = self._find(self.document, {"using": using, "value": value})
+            return self._snapshot_dom(found[0], attributes, styles) if found else None
+        if script == COMPUTED_STYLE_SCRIPT:
+            return self.computed_style(args[0]).get(_CAMEL_RE.sub(r"-\1", args[1]).lower(), "")
+        handler = self._scripts.get(script)
+        if handler is None:
+            raise JavascriptException(f"Script not supported by FakeWebDriver: {script.strip()[:60]!r}")
+        return self._wrap_result(handler(self, *args))
+
+    def _snapshot_dom(self, element: Element, attributes: List[str], styles: List[str]) -> dict:
+        """Return the ``SNAPSHOT_DOM`` result for an element."""
+        style = self.computed_style(element) if styles else {}
+        text = " ".join(child.data for child in element.children if isinstance(child, Text))
+        children = [] if element.tag == "svg" else element.element_children
+        return {
+            "tag": element.tag,
+            "attrs": {name: element.attrs[name] for name in attributes if name in element.attrs},
+            "text": " ".join(text.split()),
+            "styles": {name: style.get(name, "") for name in styles},
+            "children": [
+                self._snapshot_dom(child, attributes, styles)
+                for child in children
+                if child.tag not in ("script", "style", "noscript", "template")
+            ],
+        }
+
+    def _cmd_actions(self, params: dict):
+        for source in params["actions"]:
+            if source.get("type") == "pointer":
+                self._perform_pointer(source.get("parameters", {}), source["actions"])
+
+    def _cmd_set_timeouts(self, params: dict):
+        self._timeouts.update(params)
+
+    _COMMANDS: Dict[str, Callable[["FakeWebDriver", dict], object]] = {
+        Command.GET: _cmd_get,
+        Command.REFRESH: _cmd_refresh,
+        Command.GO_BACK: lambda self, params: None,
+        Command.GO_FORWARD: lambda self, params: None,
+        Command.GET_CURRENT_URL: lambda self, params: self.url,
+        Command.GET_TITLE: lambda self, params: self._title(),
+        Command.GET_PAGE_SOURCE: lambda self, params: serialize(self.document),
+        Command.SCREENSHOT: lambda self, params: SCREENSHOT_PNG,
+        Command.GET_LOG: lambda self, params: list(self.console) if params.get("type") == "browser" else [],
+        Command.SET_TIMEOUTS: _cmd_set_timeouts,
+        Command.GET_TIMEOUTS: lambda self, params: dict(self._timeouts),
+        Command.W3C_MAXIMIZE_WINDOW: lambda self, params: {"x": 0, "y": 0, "width": 1920, "height": 1080},
+        Command.GET_WINDOW_RECT: lambda self, params: {"x": 0, "y": 0, "width": 1920, "height": 1080},
+        Command.SET_WINDOW_RECT: lambda self, params: {"x": 0, "y": 0, "width": 1920, "height": 1080},
+        Command.W3C_GET_CURRENT_WINDOW_HANDLE: lambda self, params: "fake-window",
+        Command.W3C_GET_WINDOW_HANDLES: lambda self, params: ["fake-window"],
+        Command.GET_ALL_COOKIES: lambda self, params: [],
+        Command.DELETE_ALL_COOKIES: lambda self, params: None,
+        Command.CLOSE: lambda self, params: None,
+        Command.QUIT: lambda self, params: None,
+        Command.FIND_ELEMENT: _cmd_find_element,
+        Command.FIND_ELEMENTS: _cmd_find_elements,
+        Command.FIND_CHILD_ELEMENT: _cmd_find_child_element,
+        Command.FIND_CHILD_ELEMENTS: _cmd_find_child_elements,
+        Command.GET_ELEMENT_TEXT: _cmd_element_text,
+        Command.GET_ELEMENT_TAG_NAME: _cmd_element_tag_name,
+        Command.GET_ELEMENT_RECT: _cmd_element_rect,
+        Command.IS_ELEMENT_ENABLED: _cmd_element_enabled,
+        Command.IS_ELEMENT_SELECTED: _cmd_element_selected,
+        Command.GET_ELEMENT_ATTRIBUTE: _cmd_element_attribute,
+        Command.GET_ELEMENT_PROPERTY: _cmd_element_property,
+        Command.GET_ELEMENT_VALUE_OF_CSS_PROPERTY: _cmd_element_css,
+        Command.CLICK_ELEMENT: _cmd_click,
+        Command.SEND_KEYS_TO_ELEMENT: _cmd_send_keys,
+        Command.CLEAR_ELEMENT: _cmd_clear,
+        Command.W3C_EXECUTE_SCRIPT: _cmd_execute_script,
+        Command.W3C_EXECUTE_SCRIPT_ASYNC: _cmd_execute_script,
+        Command.W3C_ACTIONS: _cmd_actions,
+        Command.W3C_CLEAR_ACTIONS: lambda self, params: None,
+    }
+
+    # Internals
+
+    def _load(self, url: str) -> None:
+        """Parse a fresh copy of the document, dropping all element references."""
+        self.url = url
+        self.document: Document = parse_html(self._html)
+        self._element_ids.clear()
+        self._elements.clear()
+        self._rules = []
+        for style in css.select(self.document, "style"):
+            self._rules.extend(_parse_stylesheet(style.text_content(), len(self._rules)))
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        """Drop cached styles and renumber nodes after a mutation."""
+        self._styles.clear()
+        self.document.reindex()
+
+    def _title(self) -> str:
+        title = css.select(self.document, "title")
+        return " ".join(title[0].text_content().split()) if title else ""
+
+    def _find(self, root: Element, params: dict) -> List[Element]:
+        """Run a locator strategy below ``root``."""
+        using, value = params["using"], params["value"]
+        if using == "css selector":
+            try:
+                return css.select(root, value)
+            except css.SelectorError as e:
+                raise InvalidSelectorException(str(e)) from e
+        if using == "xpath":
+            try:
+                result = xpath.evaluate(value, root)
+            except xpath.XPathError as e:
+                raise InvalidSelectorException(str(e)) from e
+            if not isinstance(result, list) or any(not isinstance(node, Element) for node in result):
+                raise InvalidSelectorException(f"XPath does not select elements: {value}")
+            return result
+        if using in ("link text", "partial link text"):
+            links = css.select(root, "a")
+            if using == "link text":
+                return [link for link in links if self.rendered_text(link).strip() == value]
+            return [link for link in links if value in self.rendered_text(link)]
+        if using == "tag name":
+            return [element for element in root.descendants() if element.tag == value.lower()]
+        raise InvalidSelectorException(f"Unsupported locator strategy: {using}")
+
+    def _find_one(self, root: Element, params: dict) -> Element:
+        found = self._find(root, params)
+        if not found:
+            raise NoSuchElementException(f"Unable to locate element: {params['using']}={params['value']}")
+        return found[0]
+
+    def _wrap(self, element: Element) -> WebElement:
+        """Return a ``WebElement`` for a node, reusing its id like a browser does."""
+        element_id = self._element_ids.get(id(element))
+        if element_id is None:
+            element_id = f"fake-element-{len(self._elements) + 1}"
+            self._element_ids[id(element)] = element_id
+            self._elements[element_id] = element
+        return self.create_web_element(element_id)
+
+    def _wrap_result(self, value):
+        """Convert nodes in a script result to ``WebElement``."""
+        if isinstance(value, Element):
+            return self._wrap(value)
+        if isinstance(value, list):
+            return [self._wrap_result(item) for item in value]
+        if isinstance(value, dict):
+            return {key: self._wrap_result(item) for key, item in value.items()}
+        return value
+
+    def _unwrap(self, value):
+        """Convert ``WebElement`` arguments back to nodes."""
+        if isinstance(value, WebElement):
+            return self._element(value.id)
+        if isinstance(value, dict) and ELEMENT_KEY in value:
+            return self._element(value[ELEMENT_KEY])
+        if isinstance(value, list):
+            return [self._unwrap(item) for item in value]
+        return value
+
+    def _element(self, element_id: str) -> Element:
+        """Return the node for an element id, checking it is still attached."""
+        element = self._elements.get(element_id)
+        if element is None:
+            raise StaleElementReferenceException(f"Unknown element id: {element_id}")
+        node = element
+        while node.parent is not None:
+            node = node.parent
+        if node is not self.document:
+            raise StaleElementReferenceException(f"Element {element_id} is no longer attached to the DOM")
+        return element
+
+    def _value(self, element: Element) -> str:
+        return element.properties.get("value", element.attrs.get("value", ""))
+
+    def _get_attribute(self, element: Element, name: str) -> Optional[str]:
+        """Mirror Selenium's ``getAttribute`` atom for the attributes page objects read."""
+        if name == "value" and element.tag in ("input", "textarea", "select"):
+            return self._value(element)
+        value = element.attrs.get(name)
+        if value is None:
+            return None
+        if name in ("open", "checked", "selected", "disabled", "hidden", "required", "readonly"):
+            return "true"
+        return value
+
+    def _default_display(self, element: Element) -> str:
+        if element.tag in NON_RENDERED_TAGS:
+            return "none"
+        if element.tag == "li":
+            return "list-item"
+        return "block" if element.tag in BLOCK_TAGS else "inline"
+
+    def _collect_text(self, element: Element, parts: List[str]) -> None:
+        for child in element.children:
+            if isinstance(child, Text):
+                parts.append(child.data.replace("\n", " "))
+                continue
+            if child.tag == "br":
+                parts.append("\n")
+                continue
+            if child.tag in NON_RENDERED_TAGS or not self.is_node_displayed(child):
+                continue
+            block = not self.computed_style(child)["display"].startswith("inline")
+            if block:
+                parts.append("\n")
+            self._collect_text(child, parts)
+            if block:
+                parts.append("\n")
+
+    def _dispatch(self, event: str, target: Element) -> None:
+        """Record an event and run matching delegated listeners."""
+        self.events.append((event, target))
+        for name, selector, listener in list(self._listeners):
+            if name != event:
+                continue
+            selectors = css.parse(selector)
+            for node in (target, *target.ancestors()):
+                if any(css.matches(node, parsed) for parsed in selectors):
+                    listener(self, node)
+                    break
+
+    def _perform_pointer(self, parameters: dict, actions: List[dict]) -> None:
+        """Translate a W3C pointer action sequence into hover, click, dblclick and contextmenu events."""
+        target: Optional[Element] = None
+        pressed: Optional[Element] = None
+        last_click: Tuple[Optional[Element], int] = (None, 0)
+        for action in actions:
+            kind = action["type"]
+            if kind == "pointerMove":
+                origin = action.get("origin")
+                if isinstance(origin, (dict, WebElement)):
+                    element = self._unwrap(origin)
+                    if element is not target:
+                        self._dispatch("hover", element)
+                    target = element
+                elif origin != "pointer":
+                    target = None
+            elif kind == "pointerDown":
+                pressed = target
+            elif kind == "pointerUp" and target is not None and pressed is target:
+                if action.get("button", 0) == 2:
+                    self._dispatch("contextmenu", target)
+                    continue
+                self._dispatch("click", target)
+                clicks = last_click[1] + 1 if last_click[0] is target else 1
+                last_click = (target, clicks)
+                if clicks == 2:
+                    self._dispatch("dblclick", target)
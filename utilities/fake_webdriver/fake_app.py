@@ -0,0 +1,203 @@
+"""Python model of the stand-in app's cart for tests and benchmarks on ``FakeWebDriver``.
+
+The fake driver has no JavaScript engine, so the behaviour of ``benchmarks/app/index.html``
+that the tests and benchmarks rely on (adding cups, the cart and preview lists, the header counter,
+switching to the cart view, translating cup names, paying through the payment
+details modal and the page-object script snippets) is reproduced here with the same markup.
+"""
+
+import re
+import time
+from typing import Dict, List, Optional
+
+from config.resources import ROOT_DIR
+from pages.scripts import ADD_TO_CART, CART_SNAPSHOT, DRAIN_CART_OBSERVER, INSTALL_CART_OBSERVER, TRANSLATE_ALL
+from utilities.fake_webdriver import FakeWebDriver
+from utilities.fake_webdriver.dom import Element
+
+APP_HTML = (ROOT_DIR / "benchmarks" / "app" / "index.html").read_text(encoding="utf-8")
+
+
+def _money(value: float) -> str:
+    return f"${value:.2f}"
+
+
+def _buttons(name: str) -> str:
+    return (
+        f'<div><button aria-label="Add one {name}">+</button>'
+        f'<button aria-label="Remove one {name}">-</button></div>'
+    )
+
+
+class FakeCoffeeCart:
+    """Cart state of the stand-in app, rendered into the fake driver's document."""
+
+    def __init__(self, driver: FakeWebDriver) -> None:
+        """Register the app's listeners and script snippets on the driver.
+
+        Args:
+            driver: Fake driver serving ``app/index.html``.
+        """
+        self.driver = driver
+        self.items: List[dict] = []
+        self.observer: Optional[dict] = None
+        self._names: Dict[int, str] = {}
+        driver.on("click", "#menu .cup-body", self._on_cup_click)
+        driver.on("click", "button[aria-label^='Add one']", lambda d, el: self._change(el, "Add one ", 1))
+        driver.on("click", "button[aria-label^='Remove one']", lambda d, el: self._change(el, "Remove one ", -1))
+        driver.on("click", "button.delete", self._on_delete)
+        driver.on("click", "#app > ul a", self._on_navigate)
+        driver.on("click", "#menu button.pay", self._on_pay)
+        driver.on("click", "#submit-payment", self._on_submit_payment)
+        driver.on("dblclick", "#menu li > h4", self._on_name_dblclick)
+        driver.register_script(ADD_TO_CART, self._add_to_cart)
+        driver.register_script(CART_SNAPSHOT, self._cart_snapshot)
+        driver.register_script(INSTALL_CART_OBSERVER, self._install_observer)
+        driver.register_script(DRAIN_CART_OBSERVER, self._drain_observer)
+        driver.register_script(TRANSLATE_ALL, self._translate_all)
+
+    def add(self, name: str, price: float) -> None:
+        """Add one cup to the cart."""
+        item = next((item for item in self.items if item["name"] == name), None)
+        if item:
+            item["qty"] += 1
+        else:
+            self.items.append({"name": name, "price": price, "qty": 1})
+        self.render()
+
+    def render(self) -> None:
+        """Render the header counter, totals, preview and cart lists."""
+        driver = self.driver
+        count = sum(item["qty"] for item in self.items)
+        total = sum(item["qty"] * item["price"] for item in self.items)
+        driver.set_text(driver.query_selector("a[aria-label='Cart page']"), f"cart ({count})")
+        driver.set_text(driver.query_selector("#menu button.pay"), f"Total: {_money(total)}")
+        self._observe(count, _money(total))
+        driver.set_inner_html(
+            driver.query_selector("#menu .cart-preview"),
+            "".join(
+                f'<li class="list-item"><div><span>{item["name"]}</span><span class="unit-desc"> x {item["qty"]}'
+                f'</span></div>{_buttons(item["name"])}</li>'
+                for item in self.items
+            ),
+        )
+        cart_list = driver.query_selector("#cart .list")
+        if not self.items:
+            driver.set_inner_html(cart_list, "<p>No coffee, go add some.</p>")
+            return
+        rows = "".join(
+            f'<li class="list-item"><div>{item["name"]}</div><div><span class="unit-desc">'
+            f'{_money(item["price"])} x {item["qty"]}</span>{_buttons(item["name"])}</div><div>'
+            f'{_money(item["price"] * item["qty"])}</div><div><button class="delete">x</button></div></li>'
+            for item in self.items
+        )
+        driver.set_inner_html(
+            cart_list,
+            f'<ul>{rows}</ul><div class="pay-container"><button class="pay">Total: {_money(total)}</button>'
+            '<ul class="cart-preview"></ul></div>',
+        )
+
+    def _on_cup_click(self, driver: FakeWebDriver, cup_body: Element) -> None:
+        li = next(node for node in cup_body.ancestors() if node.tag == "li")
+        price = driver.query_selector("h4 small", li).text_content()
+        self.add(cup_body.attrs["aria-label"], float(price.lstrip("$")))
+
+    def _change(self, button: Element, prefix: str, delta: int) -> None:
+        name = button.attrs["aria-label"][len(prefix) :]
+        item = next((item for item in self.items if item["name"] == name), None)
+        if item:
+            item["qty"] += delta
+            if item["qty"] <= 0:
+                self.items.remove(item)
+            self.render()
+
+    def _on_delete(self, driver: FakeWebDriver, button: Element) -> None:
+        li = next(node for node in button.ancestors() if node.tag == "li")
+        name = li.element_children[0].text_content()
+        self.items = [item for item in self.items if item["name"] != name]
+        self.render()
+
+    def _on_navigate(self, driver: FakeWebDriver, link: Element) -> None:
+        view = {"/": "menu", "/cart": "cart", "/github": "github"}.get(link.attrs.get("href"), "menu")
+        for name in ("menu", "cart", "github"):
+            driver.set_attribute(driver.query_selector(f"#{name}"), "style", "" if name == view else "display: none;")
+
+    def _on_pay(self, driver: FakeWebDriver, button: Element) -> None:
+        driver.set_attribute(driver.query_selector(".modal"), "style", "")
+
+    def _on_submit_payment(self, driver: FakeWebDriver, button: Element) -> None:
+        form = next(node for node in button.ancestors() if node.tag == "form")
+        if any(not field.properties.get("value", "") for field in driver.query_selector_all("input[required]", form)):
+            return
+        self.items = []
+        self.render()
+        driver.set_attribute(driver.query_selector(".modal"), "style", "display: none;")
+        driver.set_attribute(driver.query_selector(".snackbar"), "style", "")
+
+    def _on_name_dblclick(self, driver: FakeWebDriver, h4: Element) -> None:
+        text = h4.children[0]
+        translated = h4.parent.attrs.get("data-cn", text.data)
+        english = self._names.setdefault(id(h4), text.data)
+        text.data = english if text.data == translated else translated
+
+    def _translate_all(self, driver: FakeWebDriver, max_ms: int) -> Dict[str, str]:
+        names = {}
+        for h4 in driver.query_selector_all("#menu li > h4"):
+            before = h4.children[0].data.strip()
+            self._on_name_dblclick(driver, h4)
+            names[before] = h4.children[0].data.strip()
+        return names
+
+    def _add_to_cart(self, driver: FakeWebDriver, order: Dict[str, int]) -> dict:
+        bodies = {}
+        for h4 in driver.query_selector_all("li > h4"):
+            name = h4.children[0].data.strip() if h4.children and not isinstance(h4.children[0], Element) else ""
+            if name and name not in bodies:
+                bodies[name] = driver.query_selector(".cup-body", h4.parent)
+        missing = [name for name in order if name not in bodies]
+        if missing:
+            return {"missing": missing, "before": None}
+        match = re.search(r"\((\d+)\)", driver.query_selector("a[aria-label='Cart page']").text_content())
+        before = int(match.group(1)) if match else 0
+        for name, clicks in order.items():
+            for _ in range(clicks):
+                self._on_cup_click(driver, bodies[name])
+        return {"missing": [], "before": before}
+
+    def _cart_snapshot(self, driver: FakeWebDriver) -> Dict[str, int]:
+        snapshot = {}
+        for li in driver.query_selector_all("ul.cart-preview > li.list-item"):
+            name = driver.query_selector("span", li)
+            unit = driver.query_selector("span.unit-desc", li)
+            match = re.search(r"x\s*(\d+)", unit.text_content() if unit else "")
+            if name:
+                snapshot[name.text_content().strip()] = int(match.group(1)) if match else 0
+        return snapshot
+
+    def _observe(self, count: int, total: str) -> None:
+        observer = self.observer
+        if observer is None or (observer["last"]["count"], observer["last"]["total"]) == (count, total):
+            return
+        observer["last"] = {
+            "count": count,
+            "total": total,
+            "atMs": round((time.perf_counter() - observer["started"]) * 1000),
+        }
+        observer["buffer"].append(observer["last"])
+        if len(observer["buffer"]) > observer["capacity"]:
+            observer["buffer"].pop(0)
+            observer["dropped"] += 1
+
+    def _install_observer(self, driver: FakeWebDriver, count_selector: str, total_selector: str, capacity: int) -> dict:
+        count = sum(item["qty"] for item in self.items)
+        total = _money(sum(item["qty"] * item["price"] for item in self.items))
+        last = {"count": count, "total": total, "atMs": 0}
+        self.observer = {"buffer": [], "dropped": 0, "last": last, "started": time.perf_counter(), "capacity": capacity}
+        return last
+
+    def _drain_observer(self, driver: FakeWebDriver, quiet_ms: int, max_ms: int) -> Optional[dict]:
+        if self.observer is None:
+            return None
+        changes, self.observer["buffer"] = self.observer["buffer"], []
+        dropped, self.observer["dropped"] = self.observer["dropped"], 0
+        return {"changes": changes, "dropped": dropped}
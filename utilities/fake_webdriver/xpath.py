@@ -0,0 +1,446 @@
+"""XPath 1.0 subset for the fake WebDriver.
+
+Covers location paths with the child, descendant, descendant-or-self, self, parent,
+ancestor, following-sibling, preceding-sibling and attribute axes (abbreviated
+``//``, ``.``, ``..`` and ``@`` included), predicates, filter expressions such as
+``(//li)[2]``, unions, ``and``/``or``, comparisons and the ``text()``, ``node()``,
+``normalize-space()``, ``contains()``, ``starts-with()``, ``string()``, ``concat()``,
+``not()``, ``count()``, ``position()`` and ``last()`` functions. Parsed expressions
+are cached.
+"""
+
+import functools
+import math
+import re
+from typing import Callable, Dict, List, Tuple, Union
+
+from utilities.fake_webdriver.dom import Attr, Document, Element, Text
+
+__all__ = ["XPathError", "evaluate", "parse"]
+
+Node = Union[Element, Text, Attr]
+
+_TOKEN_RE = re.compile(
+    r"""
+    \s*(?:
+        (?P<number>\d+(?:\.\d*)?|\.\d+)
+      | (?P<literal>"[^"]*"|'[^']*')
+      | (?P<op>//|/|\.\.|::|!=|<=|>=|[()\[\]@,=<>|*.+-])
+      | (?P<name>[_a-zA-Z][-_a-zA-Z0-9.]*(?::[_a-zA-Z][-_a-zA-Z0-9.]*)?)
+    )
+    """,
+    re.VERBOSE,
+)
+_AXES = {
+    "ancestor",
+    "ancestor-or-self",
+    "attribute",
+    "child",
+    "descendant",
+    "descendant-or-self",
+    "following-sibling",
+    "parent",
+    "preceding-sibling",
+    "self",
+}
+_NODE_TESTS = {"node", "text"}
+
+
+class XPathError(ValueError):
+    """Raised for expressions the engine cannot parse or evaluate."""
+
+
+def _tokenize(text: str) -> List[Tuple[str, str]]:
+    """Split an expression into ``(kind, value)`` tokens."""
+    tokens = []
+    position = 0
+    text = text.rstrip()
+    while position < len(text):
+        match = _TOKEN_RE.match(text, position)
+        if not match or match.end() == position:
+            raise XPathError(f"Invalid XPath expression: {text!r}")
+        position = match.end()
+        tokens.append((match.lastgroup, match.group(match.lastgroup)))
+    return tokens
+
+
+class _Parser:
+    """Recursive-descent parser producing a tuple-based AST."""
+
+    def __init__(self, text: str) -> None:
+        """Initialize the parser."""
+        self.text = text
+        self.tokens = _tokenize(text)
+        self.position = 0
+
+    def peek(self, offset: int = 0) -> Tuple[str, str]:
+        """Return a token without consuming it."""
+        index = self.position + offset
+        return self.tokens[index] if index < len(self.tokens) else ("eof", "")
+
+    def take(self, value: str = None) -> Tuple[str, str]:
+        """Consume a token, optionally requiring its value."""
+        token = self.peek()
+        if value is not None and token[1] != value:
+            raise XPathError(f"Expected {value!r} in XPath expression: {self.text!r}")
+        self.position += 1
+        return token
+
+    def accept(self, value: str) -> bool:
+        """Consume the next token if it has the given operator value."""
+        if self.peek()[0] == "op" and self.peek()[1] == value:
+            self.position += 1
+            return True
+        return False
+
+    def parse(self) -> tuple:
+        """Parse the whole expression."""
+        node = self.or_expr()
+        if self.peek()[0] != "eof":
+            raise XPathError(f"Unexpected token {self.peek()[1]!r} in XPath expression: {self.text!r}")
+        return node
+
+    def or_expr(self) -> tuple:
+        node = self.and_expr()
+        while self.peek() == ("name", "or"):
+            self.take()
+            node = ("or", node, self.and_expr())
+        return node
+
+    def and_expr(self) -> tuple:
+        node = self.equality_expr()
+        while self.peek() == ("name", "and"):
+            self.take()
+            node = ("and", node, self.equality_expr())
+        return node
+
+    def equality_expr(self) -> tuple:
+        node = self.relational_expr()
+        while self.peek()[0] == "op" and self.peek()[1] in ("=", "!="):
+            node = ("compare", self.take()[1], node, self.relational_expr())
+        return node
+
+    def relational_expr(self) -> tuple:
+        node = self.union_expr()
+        while self.peek()[0] == "op" and self.peek()[1] in ("<", ">", "<=", ">="):
+            node = ("compare", self.take()[1], node, self.union_expr())
+        return node
+
+    def union_expr(self) -> tuple:
+        node = self.path_expr()
+        while self.accept("|"):
+            node = ("union", node, self.path_expr())
+        return node
+
+    def path_expr(self) -> tuple:
+        kind, value = self.peek()
+        if kind in ("number", "literal") or (kind == "op" and value == "("):
+            primary = self.primary_expr()
+        elif kind == "name" and self.peek(1) == ("op", "(") and value not in _NODE_TESTS:
+            primary = self.function_call()
+        elif kind == "op" and value == "-":
+            self.take()
+            return ("negate", self.path_expr())
+        else:
+            return self.location_path()
+        predicates = self.predicates()
+        steps = []
+        if self.peek()[0] == "op" and self.peek()[1] in ("/", "//"):
+            steps = self.relative_steps(leading=True)
+        if not predicates and not steps:
+            return primary
+        return ("filter", primary, predicates, steps)
+
+    def primary_expr(self) -> tuple:
+        kind, value = self.take()
+        if kind == "number":
+            return ("number", float(value))
+        if kind == "literal":
+            return ("literal", value[1:-1])
+        node = self.or_expr()
+        self.take(")")
+        return node
+
+    def function_call(self) -> tuple:
+        name = self.take()[1]
+        self.take("(")
+        args = []
+        if not self.accept(")"):
+            args.append(self.or_expr())
+            while self.accept(","):
+                args.append(self.or_expr())
+            self.take(")")
+        if name not in _FUNCTIONS:
+            raise XPathError(f"Unsupported XPath function: {name}()")
+        return ("call", name, args)
+
+    def predicates(self) -> List[tuple]:
+        predicates = []
+        while self.accept("["):
+            predicates.append(self.or_expr())
+            self.take("]")
+        return predicates
+
+    def location_path(self) -> tuple:
+        if self.accept("//"):
+            return ("path", "/", [("descendant-or-self", "node()", [])] + self.relative_steps())
+        if self.accept("/"):
+            kind, value = self.peek()
+            if kind == "eof" or (kind == "op" and value not in (".", "..", "@", "*")):
+                return ("path", "/", [])
+            return ("path", "/", self.relative_steps())
+        return ("path", None, self.relative_steps())
+
+    def relative_steps(self, leading: bool = False) -> List[tuple]:
+        steps = []
+        if not leading:
+            steps.append(self.step())
+        while self.peek()[0] == "op" and self.peek()[1] in ("/", "//"):
+            if self.take()[1] == "//":
+                steps.append(("descendant-or-self", "node()", []))
+            steps.append(self.step())
+        return steps
+
+    def step(self) -> tuple:
+        if self.accept("."):
+            return ("self", "node()", [])
+        if self.accept(".."):
+            return ("parent", "node()", [])
+        axis = "child"
+        if self.accept("@"):
+            axis = "attribute"
+        elif self.peek()[0] == "name" and self.peek(1) == ("op", "::"):
+            axis = self.take()[1]
+            self.take("::")
+            if axis not in _AXES:
+                raise XPathError(f"Unsupported XPath axis: {axis}")
+        kind, value = self.take()
+        if kind == "op" and value == "*":
+            test = "*"
+        elif kind == "name":
+            test = value
+            if value in _NODE_TESTS and self.accept("("):
+                self.take(")")
+                test = value + "()"
+        else:
+            raise XPathError(f"Invalid XPath step in expression: {self.text!r}")
+        return (axis, test, self.predicates())
+
+
+@functools.lru_cache(maxsize=512)
+def parse(text: str) -> tuple:
+    """Parse an XPath expression into an AST."""
+    return _Parser(text).parse()
+
+
+def _string(value) -> str:
+    """Convert a value to an XPath string."""
+    if isinstance(value, list):
+        return value[0].string_value if value else ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, float):
+        if math.isnan(value):
+            return "NaN"
+        return str(int(value)) if value == int(value) else str(value)
+    return value
+
+
+def _number(value) -> float:
+    """Convert a value to an XPath number."""
+    if isinstance(value, (bool, float)):
+        return float(value)
+    try:
+        return float(_string(value).strip())
+    except ValueError:
+        return math.nan
+
+
+def _boolean(value) -> bool:
+    """Convert a value to an XPath boolean."""
+    if isinstance(value, list):
+        return bool(value)
+    if isinstance(value, float):
+        return value != 0 and not math.isnan(value)
+    return bool(value)
+
+
+class _Context:
+    """Evaluation context: node, position and size."""
+
+    __slots__ = ("node", "position", "size")
+
+    def __init__(self, node: Node, position: int = 1, size: int = 1) -> None:
+        self.node = node
+        self.position = position
+        self.size = size
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.split())
+
+
+_FUNCTIONS: Dict[str, Callable] = {
+    "normalize-space": lambda ctx, *a: _normalize(_string(a[0]) if a else ctx.node.string_value),
+    "string": lambda ctx, *a: _string(a[0]) if a else ctx.node.string_value,
+    "contains": lambda ctx, a, b: _string(b) in _string(a),
+    "starts-with": lambda ctx, a, b: _string(a).startswith(_string(b)),
+    "concat": lambda ctx, *a: "".join(_string(v) for v in a),
+    "not": lambda ctx, a: not _boolean(a),
+    "true": lambda ctx: True,
+    "false": lambda ctx: False,
+    "count": lambda ctx, a: float(len(a)),
+    "position": lambda ctx: float(ctx.position),
+    "last": lambda ctx: float(ctx.size),
+    "string-length": lambda ctx, *a: float(len(_string(a[0]) if a else ctx.node.string_value)),
+}
+
+
+def _axis(node: Node, axis: str) -> List[Node]:
+    """Return the nodes on an axis in axis order."""
+    if axis == "child":
+        return list(node.children) if isinstance(node, Element) else []
+    if axis == "self":
+        return [node]
+    if axis == "attribute":
+        return [Attr(name, value, node) for name, value in node.attrs.items()] if isinstance(node, Element) else []
+    if axis == "parent":
+        return [node.parent] if node.parent is not None else []
+    if axis in ("descendant", "descendant-or-self"):
+        result = [node] if axis == "descendant-or-self" else []
+        if isinstance(node, Element):
+            stack = list(reversed(node.children))
+            while stack:
+                current = stack.pop()
+                result.append(current)
+                if isinstance(current, Element):
+                    stack.extend(reversed(current.children))
+        return result
+    if axis in ("ancestor", "ancestor-or-self"):
+        result = [node] if axis == "ancestor-or-self" else []
+        current = node.parent
+        while current is not None:
+            result.append(current)
+            current = current.parent
+        return result
+    if node.parent is None or isinstance(node, Attr):
+        return []
+    siblings = node.parent.children
+    position = next(i for i, sibling in enumerate(siblings) if sibling is node)
+    if axis == "following-sibling":
+        return siblings[position + 1 :]
+    return list(reversed(siblings[:position]))
+
+
+def _test(node: Node, axis: str, test: str) -> bool:
+    """Apply a node test."""
+    if test == "node()":
+        return True
+    if test == "text()":
+        return isinstance(node, Text)
+    if axis == "attribute":
+        return isinstance(node, Attr) and (test == "*" or node.name == test)
+    if not isinstance(node, Element) or isinstance(node, Document) or node.tag[0] == "#":
+        return False
+    return test == "*" or node.tag == test
+
+
+def _apply_predicates(nodes: List[Node], predicates: List[tuple]) -> List[Node]:
+    """Filter nodes by predicates; positions follow the order of ``nodes``."""
+    for predicate in predicates:
+        size = len(nodes)
+        kept = []
+        for position, node in enumerate(nodes, 1):
+            value = _eval(predicate, _Context(node, position, size))
+            if isinstance(value, float) and not isinstance(value, bool):
+                if value == position:
+                    kept.append(node)
+            elif _boolean(value):
+                kept.append(node)
+        nodes = kept
+    return nodes
+
+
+def _document_order(nodes: List[Node]) -> List[Node]:
+    """Remove duplicates and sort nodes in document order."""
+    unique = {id(node): node for node in nodes}
+    return sorted(unique.values(), key=lambda node: node.index)
+
+
+def _steps(nodes: List[Node], steps: List[tuple]) -> List[Node]:
+    """Apply location steps to a node-set."""
+    for axis, test, predicates in steps:
+        selected = []
+        for node in nodes:
+            candidates = [candidate for candidate in _axis(node, axis) if _test(candidate, axis, test)]
+            selected.extend(_apply_predicates(candidates, predicates))
+        nodes = _document_order(selected)
+    return nodes
+
+
+def _compare(op: str, left, right) -> bool:
+    """Compare two values with XPath 1.0 semantics."""
+    if isinstance(left, list) or isinstance(right, list):
+        lefts = [node.string_value for node in left] if isinstance(left, list) else [left]
+        rights = [node.string_value for node in right] if isinstance(right, list) else [right]
+        return any(_compare(op, a, b) for a in lefts for b in rights)
+    if op in ("=", "!="):
+        if isinstance(left, bool) or isinstance(right, bool):
+            equal = _boolean(left) == _boolean(right)
+        elif isinstance(left, float) or isinstance(right, float):
+            equal = _number(left) == _number(right)
+        else:
+            equal = _string(left) == _string(right)
+        return equal if op == "=" else not equal
+    a, b = _number(left), _number(right)
+    return {"<": a < b, ">": a > b, "<=": a <= b, ">=": a >= b}[op]
+
+
+def _eval(node: tuple, ctx: _Context):
+    """Evaluate an AST node."""
+    kind = node[0]
+    if kind == "path":
+        _, absolute, steps = node
+        start = ctx.node
+        if absolute:
+            while start.parent is not None:
+                start = start.parent
+        return _steps([start], steps)
+    if kind == "literal":
+        return node[1]
+    if kind == "number":
+        return node[1]
+    if kind == "call":
+        return _FUNCTIONS[node[1]](ctx, *(_eval(arg, ctx) for arg in node[2]))
+    if kind == "and":
+        return _boolean(_eval(node[1], ctx)) and _boolean(_eval(node[2], ctx))
+    if kind == "or":
+        return _boolean(_eval(node[1], ctx)) or _boolean(_eval(node[2], ctx))
+    if kind == "compare":
+        return _compare(node[1], _eval(node[2], ctx), _eval(node[3], ctx))
+    if kind == "negate":
+        return -_number(_eval(node[1], ctx))
+    if kind == "union":
+        left, right = _eval(node[1], ctx), _eval(node[2], ctx)
+        if not isinstance(left, list) or not isinstance(right, list):
+            raise XPathError("Union operands must be node-sets")
+        return _document_order(left + right)
+    if kind == "filter":
+        value = _eval(node[1], ctx)
+        if not isinstance(value, list):
+            raise XPathError("Predicates and steps require a node-set")
+        return _steps(_apply_predicates(value, node[2]), node[3])
+    raise XPathError(f"Unknown XPath node: {kind}")
+
+
+def evaluate(expression: str, context: Node):
+    """Evaluate an XPath expression.
+
+    Args:
+        expression: XPath expression.
+        context: Context node; absolute paths start at its document.
+
+    Returns:
+        list | str | float | bool: Node-set in document order or a scalar value.
+    """
+    return _eval(parse(expression), _Context(context))
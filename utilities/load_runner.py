@@ -0,0 +1,374 @@
+"""Synthetic concurrent-user load on the coffee-cart app, driven by the page objects.
+
+Every virtual user is a headless browser session in its own process. A session
+repeatedly picks a scenario from a weighted mix of the flows the tests cover
+(browse the menu, add cups, open the cart preview, purchase through the payment
+modal) and times each action of it. The results of all sessions are merged into
+throughput, latency percentiles per action and error rates::
+
+    python -m utilities.load_runner --users 8 --duration 120 --base-url http://localhost:8080/
+"""
+
+import argparse
+import functools
+import json
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.remote.webdriver import WebDriver
+from webdriver_manager.chrome import ChromeDriverManager
+
+from config.resources import BASE_URL, DRIVER_VERSION, IMPLICIT_WAIT
+from pages.components.pay_component.pay_preview_component import PayPreviewComponent
+from pages.menu_page import MenuPage
+from test_data.users import valid_user
+
+__all__ = [
+    "DEFAULT_MIX",
+    "SCENARIOS",
+    "ActionStats",
+    "LoadReport",
+    "LoadSession",
+    "LoadSettings",
+    "headless_chrome",
+    "run_load",
+    "run_session",
+]
+
+DriverFactory = Callable[[], WebDriver]
+
+
+class LoadSession:
+    """One virtual user: a browser session, its random source and its measurements."""
+
+    def __init__(self, driver: WebDriver, base_url: str, rng: random.Random) -> None:
+        """Initialize the session.
+
+        Args:
+            driver: WebDriver of the session's browser.
+            base_url: URL of the app under load.
+            rng: Random source for scenario and cup choices.
+        """
+        self.driver = driver
+        self.base_url = base_url
+        self.rng = rng
+        self.latencies: Dict[str, List[float]] = {}
+        self.errors: Dict[str, int] = {}
+        self.scenarios: Dict[str, int] = {}
+        self.failed_scenarios: Dict[str, int] = {}
+
+    @contextmanager
+    def action(self, name: str) -> Iterator[None]:
+        """Time an action; an action that raises is counted as an error instead."""
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.errors[name] = self.errors.get(name, 0) + 1
+            raise
+        self.latencies.setdefault(name, []).append(round((time.perf_counter() - start) * 1000, 3))
+
+    def open_menu(self) -> MenuPage:
+        """Load the app and return its menu page, timed as the ``open_menu`` action."""
+        with self.action("open_menu"):
+            self.driver.get(self.base_url)
+            return MenuPage.opened(self.driver)
+
+    def add_random_cup(self, menu: MenuPage) -> None:
+        """Add a random cup of the menu to the cart, timed as the ``add_cup`` action."""
+        with self.action("add_cup"):
+            cup = self.rng.choice(menu.cup_handles())
+            menu.track_idle()
+            cup.click()
+            menu.wait_for_idle()
+
+    def result(self) -> dict:
+        """Return the measurements as plain data, for handing them to the parent process."""
+        return {
+            "latencies": self.latencies,
+            "errors": self.errors,
+            "scenarios": self.scenarios,
+            "failed_scenarios": self.failed_scenarios,
+        }
+
+
+def browse_menu(session: LoadSession) -> None:
+    """Open the menu and read the name, price and ingredients of all cups."""
+    menu = session.open_menu()
+    with session.action("read_menu"):
+        menu.cups()
+
+
+def add_cups(session: LoadSession) -> None:
+    """Open the menu and add one to three random cups."""
+    menu = session.open_menu()
+    for _ in range(session.rng.randint(1, 3)):
+        session.add_random_cup(menu)
+
+
+def cart_preview(session: LoadSession) -> None:
+    """Add a cup and open the cart preview by hovering over the total."""
+    menu = session.open_menu()
+    session.add_random_cup(menu)
+    with session.action("open_cart_preview"):
+        menu.pay().hover_on()
+        if not PayPreviewComponent(session.driver).is_visible():
+            raise AssertionError("Cart preview not shown")
+
+
+def purchase(session: LoadSession) -> None:
+    """Add cups and buy them through the payment details modal."""
+    menu = session.open_menu()
+    session.add_random_cup(menu)
+    with session.action("open_payment"):
+        modal = menu.click_pay_button()
+    with session.action("submit_payment"):
+        menu = modal.fill_credentials(valid_user).click_submit_successfully()
+        if menu.get_snackbar_success_we() is None:
+            raise AssertionError("Purchase not confirmed")
+
+
+SCENARIOS: Dict[str, Callable[[LoadSession], None]] = {
+    "browse_menu": browse_menu,
+    "add_cups": add_cups,
+    "cart_preview": cart_preview,
+    "purchase": purchase,
+}
+
+DEFAULT_MIX: Dict[str, int] = {"browse_menu": 4, "add_cups": 3, "cart_preview": 2, "purchase": 1}
+
+
+def headless_chrome(driver_path: Optional[str] = None) -> WebDriver:
+    """Start a headless Chrome session.
+
+    Args:
+        driver_path: ChromeDriver executable; downloaded by webdriver-manager if not given.
+
+    Returns:
+        WebDriver: The session.
+    """
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless=new")
+    options.add_argument("--window-size=1920,1080")
+    service = Service(driver_path or ChromeDriverManager(driver_version=DRIVER_VERSION).install())
+    driver = webdriver.Chrome(service=service, options=options)
+    driver.implicitly_wait(IMPLICIT_WAIT)
+    return driver
+
+
+class LoadSettings(NamedTuple):
+    """What one virtual user runs; picklable, so it can be handed to a worker process."""
+
+    base_url: str
+    mix: Dict[str, int]
+    duration: float = 60.0
+    iterations: Optional[int] = None
+    ramp_up: float = 0.0
+    seed: Optional[int] = None
+    driver_factory: DriverFactory = headless_chrome
+
+
+def run_session(settings: LoadSettings, user: int = 0) -> dict:
+    """Run the scenario mix in one browser session until the duration or iteration count is reached.
+
+    Args:
+        settings: Load settings.
+        user: Number of the virtual user, used to stagger the start and seed the choices.
+
+    Returns:
+        dict: Measurements, see :meth:`LoadSession.result`.
+    """
+    seed = None if settings.seed is None else settings.seed + user
+    names, weights = zip(*settings.mix.items())
+    driver = settings.driver_factory()
+    session = LoadSession(driver, settings.base_url, random.Random(seed))
+    try:
+        deadline = time.monotonic() + settings.duration
+        iteration = 0
+        while time.monotonic() < deadline and (settings.iterations is None or iteration < settings.iterations):
+            name = session.rng.choices(names, weights)[0]
+            session.scenarios[name] = session.scenarios.get(name, 0) + 1
+            try:
+                SCENARIOS[name](session)
+            except Exception:
+                session.failed_scenarios[name] = session.failed_scenarios.get(name, 0) + 1
+            iteration += 1
+    finally:
+        driver.quit()
+    return session.result()
+
+
+def _staggered_session(settings: LoadSettings, users: int, user: int) -> dict:
+    time.sleep(settings.ramp_up * user / users)
+    return run_session(settings, user)
+
+
+def _percentile(samples: List[float], fraction: float) -> float:
+    """Return the nearest-rank percentile of sorted samples."""
+    return samples[max(math.ceil(fraction * len(samples)) - 1, 0)]
+
+
+class ActionStats(NamedTuple):
+    """Latency percentiles in milliseconds and error count of one action."""
+
+    count: int
+    errors: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+
+    @property
+    def error_rate(self) -> float:
+        """Return the share of attempts that failed."""
+        attempts = self.count + self.errors
+        return self.errors / attempts if attempts else 0.0
+
+
+class LoadReport:
+    """Merged measurements of all sessions of a load run."""
+
+    def __init__(self, results: Sequence[dict], elapsed: float) -> None:
+        """Merge session results.
+
+        Args:
+            results: Results returned by :func:`run_session`.
+            elapsed: Wall time of the run in seconds.
+        """
+        self.elapsed = elapsed
+        self.users = len(results)
+        latencies: Dict[str, List[float]] = {}
+        errors: Dict[str, int] = {}
+        self.scenarios: Dict[str, int] = {}
+        self.failed_scenarios: Dict[str, int] = {}
+        for result in results:
+            for name, values in result["latencies"].items():
+                latencies.setdefault(name, []).extend(values)
+            for counts, into in (
+                (result["errors"], errors),
+                (result["scenarios"], self.scenarios),
+                (result["failed_scenarios"], self.failed_scenarios),
+            ):
+                for name, count in counts.items():
+                    into[name] = into.get(name, 0) + count
+        self.actions: Dict[str, ActionStats] = {}
+        for name in sorted(set(latencies) | set(errors)):
+            values = sorted(latencies.get(name, []))
+            percentiles = [_percentile(values, fraction) if values else 0.0 for fraction in (0.5, 0.95, 0.99, 1.0)]
+            self.actions[name] = ActionStats(len(values), errors.get(name, 0), *percentiles)
+
+    @property
+    def throughput(self) -> float:
+        """Return the completed scenarios per second."""
+        completed = sum(self.scenarios.values()) - sum(self.failed_scenarios.values())
+        return completed / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def error_rate(self) -> float:
+        """Return the share of scenarios that failed."""
+        total = sum(self.scenarios.values())
+        return sum(self.failed_scenarios.values()) / total if total else 0.0
+
+    def as_dict(self) -> dict:
+        """Return the report as JSON-serializable data."""
+        return {
+            "users": self.users,
+            "elapsed_s": round(self.elapsed, 3),
+            "throughput_per_s": round(self.throughput, 3),
+            "error_rate": round(self.error_rate, 4),
+            "scenarios": self.scenarios,
+            "failed_scenarios": self.failed_scenarios,
+            "actions": {
+                name: {**stats._asdict(), "error_rate": round(stats.error_rate, 4)}
+                for name, stats in self.actions.items()
+            },
+        }
+
+    def lines(self) -> List[str]:
+        """Return the report as text lines."""
+        lines = [
+            f"{self.users} users, {self.elapsed:.1f} s, {sum(self.scenarios.values())} scenarios, "
+            f"{self.throughput:.2f} scenarios/s, {self.error_rate:.1%} failed",
+            f"{'action':<20}{'count':>8}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}",
+        ]
+        for name, stats in self.actions.items():
+            lines.append(
+                f"{name:<20}{stats.count:>8}{stats.errors:>8}{stats.p50_ms:>10.1f}{stats.p95_ms:>10.1f}"
+                f"{stats.p99_ms:>10.1f}{stats.max_ms:>10.1f}"
+            )
+        return lines
+
+
+def run_load(settings: LoadSettings, users: int) -> LoadReport:
+    """Run concurrent sessions, one process per virtual user.
+
+    Args:
+        settings: Load settings shared by all users.
+        users: Number of concurrent sessions.
+
+    Returns:
+        LoadReport: Merged measurements.
+
+    Raises:
+        ValueError: If the mix names an unknown scenario.
+    """
+    unknown = set(settings.mix) - set(SCENARIOS)
+    if unknown:
+        raise ValueError(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+    if settings.driver_factory is headless_chrome:
+        # Resolve the driver once, instead of every process racing to download it.
+        driver_path = ChromeDriverManager(driver_version=DRIVER_VERSION).install()
+        settings = settings._replace(driver_factory=functools.partial(headless_chrome, driver_path))
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=users) as pool:
+        results = list(pool.map(_staggered_session, [settings] * users, [users] * users, range(users)))
+    return LoadReport(results, time.perf_counter() - start)
+
+
+def _parse_mix(text: str) -> Dict[str, int]:
+    """Parse a mix such as ``browse_menu=4,purchase=1``."""
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        mix[name.strip()] = int(weight or 1)
+    return mix
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run the load from the command line and print the report."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--users", type=int, default=4, help="concurrent browser sessions (default: 4)")
+    parser.add_argument("--duration", type=float, default=60.0, help="run time in seconds (default: 60)")
+    parser.add_argument("--iterations", type=int, default=None, help="stop each session after this many scenarios")
+    parser.add_argument("--ramp-up", type=float, default=0.0, help="seconds over which the sessions start")
+    parser.add_argument("--base-url", default=BASE_URL, help="app under load (default: BASE_URL)")
+    parser.add_argument(
+        "--mix",
+        type=_parse_mix,
+        default=DEFAULT_MIX,
+        help="weighted scenarios, e.g. browse_menu=4,add_cups=3,cart_preview=2,purchase=1",
+    )
+    parser.add_argument("--seed", type=int, default=None, help="seed for reproducible scenario choices")
+    parser.add_argument(
+        "--max-error-rate", type=float, default=0.05, help="exit with 1 above this share of failed scenarios"
+    )
+    parser.add_argument("--json", metavar="PATH", help="also write the report to this JSON file")
+    args = parser.parse_args(argv)
+
+    settings = LoadSettings(args.base_url, args.mix, args.duration, args.iterations, args.ramp_up, args.seed)
+    report = run_load(settings, args.users)
+    print("\n".join(report.lines()))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(report.as_dict(), file, indent=2)
+    return 1 if report.error_rate > args.max_error_rate else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -2,9 +2,65 @@
 
 This module provides a comprehensive logging solution for test automation,
 supporting all Python logging levels with auto-detection capabilities.
+
+Loggers are created once per name and cached. Records below the configured level
+are dropped before their message is formatted, so use lazy ``%`` arguments
+(``logger.debug("Found %s", value)``) instead of f-strings in hot paths. Accepted
+records are handed to a ``QueueHandler`` and written by a background
+``QueueListener``: to the console and, when ``LOG_JSON_FILE`` is set, as JSON lines
+carrying the test id and timing fields.
 """
 
+import atexit
+import json
 import logging
+import os
+import queue
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional
+
+from config.resources import LOG_JSON_FILE, LOG_LEVEL
+
+__all__ = ["Logger", "ClassLogger", "JsonLinesFormatter"]
+
+
+class _TestContextFilter(logging.Filter):
+    """Stamp records with the running pytest test id and the time elapsed in that test."""
+
+    def __init__(self) -> None:
+        """Initialize the filter."""
+        super().__init__()
+        self._test_id = ""
+        self._test_start = time.perf_counter()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Add ``test_id`` and ``test_elapsed_ms`` attributes to the record."""
+        test_id = os.environ.get("PYTEST_CURRENT_TEST", "").rsplit(" (", 1)[0]
+        if test_id != self._test_id:
+            self._test_id = test_id
+            self._test_start = time.perf_counter()
+        record.test_id = test_id
+        record.test_elapsed_ms = round((time.perf_counter() - self._test_start) * 1000, 3)
+        return True
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Format records as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Return the record serialized as a JSON line."""
+        payload = {
+            "ts": record.created,
+            "elapsed_ms": round(record.relativeCreated, 3),
+            "test_id": getattr(record, "test_id", ""),
+            "test_elapsed_ms": getattr(record, "test_elapsed_ms", None),
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        return json.dumps(payload, ensure_ascii=False)
 
 
 class Logger:
@@ -13,58 +69,116 @@ class Logger:
     Supports all Python logging levels: DEBUG, INFO, WARNING, ERROR, CRITICAL.
     """
 
+    _loggers: Dict[Optional[str], logging.Logger] = {}
+    _queue_handler: Optional[QueueHandler] = None
+    _listener: Optional[QueueListener] = None
+
+    def __init__(self, name: Optional[str] = None) -> None:
+        """Initialize the logger wrapper.
+
+        Args:
+            name (str, optional): Logger name. If None, uses the root logger.
+        """
+        self._logger = self.get_logger(name)
+
     @classmethod
-    def get_logger(cls, name=None, console_level=logging.INFO):
+    def get_logger(cls, name=None, console_level=None):
         """Get configured logger instance with all logging levels available.
 
+        The logger is configured on first request and cached by name afterwards. A
+        ``console_level`` passed later still applies to the cached logger.
+
         Args:
             name (str, optional): Logger name. If None, uses calling module name.
-            console_level (int): Minimum level for console output (default: INFO)
+            console_level (int | str, optional): Minimum level of records emitted by the logger; if None,
+                the current level is kept, LOG_LEVEL for a new logger
 
         Returns:
             logging.Logger: Configured logger supporting all levels
         """
-        # Create logger with the provided name
+        logger = cls._loggers.get(name)
+        if logger is not None:
+            if console_level is not None:
+                logger.setLevel(console_level)
+            return logger
+
         logger = logging.getLogger(name)
-        logger.setLevel(logging.DEBUG)  # Set to lowest level to capture all messages
+        # Records below this level are rejected before any formatting happens
+        logger.setLevel(LOG_LEVEL if console_level is None else console_level)
 
         # Avoid duplicate handlers for performance and clean logs
-        if logger.handlers:
-            return logger
+        if not logger.handlers:
+            logger.addHandler(cls._get_queue_handler())
 
-        # Create and configure console handler
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(console_level)
+        cls._loggers[name] = logger
+        return logger
+
+    @classmethod
+    def _get_queue_handler(cls) -> QueueHandler:
+        """Return the shared queue handler, starting the background writer on first use."""
+        if cls._queue_handler is not None:
+            return cls._queue_handler
 
         # Create detailed formatter for better readability
-        console_formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            datefmt="%m/%d/%Y %I:%M:%S %p",
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(
+            logging.Formatter(
+                "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+                datefmt="%m/%d/%Y %I:%M:%S %p",
+            )
         )
-        console_handler.setFormatter(console_formatter)
+        handlers = [console_handler]
 
-        # Add console handler to logger
-        logger.addHandler(console_handler)
+        if LOG_JSON_FILE:
+            json_handler = logging.FileHandler(LOG_JSON_FILE, encoding="utf-8")
+            json_handler.setFormatter(JsonLinesFormatter())
+            handlers.append(json_handler)
 
-        return logger
+        log_queue = queue.SimpleQueue()
+        cls._queue_handler = QueueHandler(log_queue)
+        cls._queue_handler.addFilter(_TestContextFilter())
+        cls._listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        cls._listener.start()
+        atexit.register(cls._listener.stop)
+        return cls._queue_handler
 
     # Convenience methods for each log level - following best practices
-    def debug(self, message):
+    def debug(self, message, *args):
         """Log debug message for detailed troubleshooting information."""
-        self.get_logger().debug(message)
+        self._logger.debug(message, *args)
 
-    def info(self, message):
+    def info(self, message, *args):
         """Log info message for general operational information."""
-        self.get_logger().info(message)
+        self._logger.info(message, *args)
 
-    def warning(self, message):
+    def warning(self, message, *args):
         """Log warning message for potential issues that don't stop execution."""
-        self.get_logger().warning(message)
+        self._logger.warning(message, *args)
 
-    def error(self, message):
+    def error(self, message, *args):
         """Log error message for serious problems that affected execution."""
-        self.get_logger().error(message)
+        self._logger.error(message, *args)
 
-    def critical(self, message):
+    def critical(self, message, *args):
         """Log critical message for very serious errors that may abort execution."""
-        self.get_logger().critical(message)
+        self._logger.critical(message, *args)
+
+
+class ClassLogger:
+    """Descriptor returning a logger named after the class it is accessed on.
+
+    The logger is resolved once per class and kept by the descriptor, so instances
+    share it without any per-instance setup and every subclass gets its own name.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the per-class logger cache."""
+        self._loggers: Dict[type, logging.Logger] = {}
+
+    def __get__(self, instance, owner) -> logging.Logger:
+        """Return the cached logger for ``owner``."""
+        try:
+            return self._loggers[owner]
+        except KeyError:
+            logger = self._loggers[owner] = Logger.get_logger(owner.__name__)
+            return logger
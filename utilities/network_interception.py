@@ -0,0 +1,289 @@
+"""Request interception for the browser sessions of the tests, via the CDP ``Fetch`` domain.
+
+Every request of the page is paused in the browser and answered by an interceptor
+running in a background thread: subresources matching a block rule (fonts,
+analytics, the advertising assets) fail right away, unless an allow rule matches
+them too; GETs of static assets (scripts, stylesheets, images, fonts) are answered
+from a response cache once they have been fetched; everything else continues
+untouched. Document requests are never blocked, so navigation works whatever the
+rules are.
+
+Rules default to ``NETWORK_BLOCK`` and can be changed per test with the ``network``
+marker, see ``plugins.network``. Interception needs a Chromium browser with a CDP
+endpoint; where there is none it is skipped with a warning.
+"""
+
+import base64
+import fnmatch
+import threading
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import trio
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from config.resources import NETWORK_BLOCK
+from utilities.logger import Logger
+
+__all__ = [
+    "STATIC_RESOURCE_TYPES",
+    "CachedResponse",
+    "NetworkInterceptor",
+    "NetworkRules",
+    "ResponseCache",
+    "default_rules",
+]
+
+STATIC_RESOURCE_TYPES = frozenset({"Script", "Stylesheet", "Image", "Font"})
+
+# Describe the encoded transfer; the body from Fetch.getResponseBody is already decoded.
+_TRANSFER_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+BLOCK = "block"
+FULFILL = "fulfill"
+STORE = "store"
+CONTINUE = "continue"
+
+
+class NetworkRules(NamedTuple):
+    """Which requests the interceptor blocks and whether static assets are cached.
+
+    Patterns are shell-style wildcards matched against the full URL, e.g.
+    ``*://fonts.googleapis.com/*`` or ``*?ad=1*``.
+    """
+
+    block: Tuple[str, ...] = ()
+    allow: Tuple[str, ...] = ()
+    cache: bool = True
+
+    def blocks(self, url: str, resource_type: str) -> bool:
+        """Return whether a request is blocked; allow rules win over block rules, documents are never blocked."""
+        if resource_type == "Document":
+            return False
+        if any(fnmatch.fnmatchcase(url, pattern) for pattern in self.allow):
+            return False
+        return any(fnmatch.fnmatchcase(url, pattern) for pattern in self.block)
+
+    def request_patterns(self) -> List[Tuple[str, Optional[str]]]:
+        """Return the URL patterns and resource types of the requests worth pausing.
+
+        Only requests a rule can act on pause in the browser: URLs matching a block
+        rule, of any type, and static assets when caching is on. Everything else, the
+        app's own XHR and fetch calls included, is never sent through the interceptor.
+
+        Returns:
+            list: ``(url_pattern, resource_type)`` pairs in ``Fetch.enable`` terms; a None type matches all.
+        """
+        patterns: List[Tuple[str, Optional[str]]] = [(pattern, None) for pattern in self.block]
+        if self.cache:
+            patterns.extend(("*", resource_type) for resource_type in sorted(STATIC_RESOURCE_TYPES))
+        return patterns
+
+    def plan(self, url: str, resource_type: str, method: str, cached: bool, at_response: bool) -> str:
+        """Return how to answer a paused request.
+
+        Args:
+            url: Request URL.
+            resource_type: CDP resource type, e.g. ``Script`` or ``Document``.
+            method: HTTP method.
+            cached: Whether the response cache holds the URL.
+            at_response: Whether the request is paused with the response received.
+
+        Returns:
+            str: ``block``, ``fulfill`` from the cache, ``store`` the response in the cache, or ``continue``.
+        """
+        if at_response:
+            return STORE
+        if self.blocks(url, resource_type):
+            return BLOCK
+        if self.cache and method == "GET" and resource_type in STATIC_RESOURCE_TYPES:
+            return FULFILL if cached else STORE
+        return CONTINUE
+
+
+def default_rules() -> NetworkRules:
+    """Return the rules configured by ``NETWORK_BLOCK``."""
+    return NetworkRules(block=tuple(pattern.strip() for pattern in NETWORK_BLOCK.split(",") if pattern.strip()))
+
+
+class CachedResponse(NamedTuple):
+    """Status, headers and base64 encoded body of a cached response."""
+
+    status: int
+    headers: List[Tuple[str, str]]
+    body: str
+
+
+class ResponseCache:
+    """Successful responses of static assets, keyed by URL."""
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self._responses: Dict[str, CachedResponse] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.stored = 0
+
+    def __contains__(self, url: str) -> bool:
+        """Return whether the cache holds a response for the URL."""
+        return url in self._responses
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """Return the cached response of a URL, or None."""
+        with self._lock:
+            response = self._responses.get(url)
+            if response is not None:
+                self.hits += 1
+            return response
+
+    def put(self, url: str, response: CachedResponse) -> None:
+        """Store a successful response."""
+        if 200 <= response.status < 300:
+            with self._lock:
+                self._responses[url] = response
+                self.stored += 1
+
+
+class NetworkInterceptor:
+    """Answers the paused requests of one browser session in a background thread."""
+
+    start_timeout = 10
+
+    def __init__(self, driver: WebDriver, cache: Optional[ResponseCache] = None) -> None:
+        """Initialize the interceptor.
+
+        Args:
+            driver: WebDriver of a Chromium browser.
+            cache: Response cache for static assets; a new one if not given.
+        """
+        self.driver = driver
+        self.cache = cache if cache is not None else ResponseCache()
+        self.blocked = 0
+        self.logger = Logger.get_logger(self.__class__.__name__)
+        self._rules = default_rules()
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+        self._error: Optional[BaseException] = None
+        self._token: Optional[trio.lowlevel.TrioToken] = None
+        self._cancel_scope: Optional[trio.CancelScope] = None
+        self._session = None
+        self._devtools = None
+
+    @property
+    def rules(self) -> NetworkRules:
+        """Return the rules applied to paused requests."""
+        return self._rules
+
+    @rules.setter
+    def rules(self, rules: NetworkRules) -> None:
+        """Apply new rules, changing which requests pause in the browser if needed."""
+        changed = rules.request_patterns() != self._rules.request_patterns()
+        self._rules = rules
+        if changed and self.running and self._session is not None:
+            trio.from_thread.run(self._enable, trio_token=self._token)
+
+    @property
+    def running(self) -> bool:
+        """Return whether requests are being intercepted."""
+        return self._thread is not None and self._thread.is_alive() and self._error is None
+
+    def start(self) -> bool:
+        """Enable interception and start answering paused requests.
+
+        Returns:
+            bool: Whether interception is active; failures are logged, not raised.
+        """
+        if self.running:
+            return True
+        if self._error is not None:
+            return False
+        self._thread = threading.Thread(target=trio.run, args=(self._serve,), name="network-interceptor", daemon=True)
+        self._thread.start()
+        if not self._ready.wait(self.start_timeout) or self._error is not None:
+            self.logger.warning("Network interception not available: %s", self._error or "timed out")
+            return False
+        return True
+
+    def stop(self) -> None:
+        """Stop intercepting requests."""
+        if self._token is not None and self._cancel_scope is not None and self.running:
+            try:
+                trio.from_thread.run_sync(self._cancel_scope.cancel, trio_token=self._token)
+            except trio.RunFinishedError:
+                pass
+            self._thread.join(self.start_timeout)
+
+    async def _serve(self) -> None:
+        self._token = trio.lowlevel.current_trio_token()
+        try:
+            with trio.CancelScope() as self._cancel_scope:
+                async with self.driver.bidi_connection() as connection:
+                    session, devtools = connection.session, connection.devtools
+                    self._session, self._devtools = session, devtools
+                    await self._enable()
+                    self._ready.set()
+                    async for event in session.listen(devtools.fetch.RequestPaused):
+                        try:
+                            await self._answer(session, devtools, event)
+                        except Exception as error:
+                            # The page may have navigated away and dropped the request already.
+                            self.logger.debug("Paused request %s not answered: %s", event.request.url, error)
+        except Exception as error:
+            self._error = error
+            self._ready.set()
+
+    async def _enable(self) -> None:
+        """Pause the requests the current rules can act on, see ``NetworkRules.request_patterns``."""
+        fetch = self._devtools.fetch
+        patterns = self._rules.request_patterns()
+        if not patterns:
+            # An empty pattern list would pause every request.
+            await self._session.execute(fetch.disable())
+            return
+        # Requests pause before they are sent; static assets also ask for their response, see _answer.
+        await self._session.execute(
+            fetch.enable(
+                patterns=[
+                    fetch.RequestPattern(
+                        url_pattern=url_pattern,
+                        resource_type=self._devtools.network.ResourceType(resource_type) if resource_type else None,
+                        request_stage=fetch.RequestStage.REQUEST,
+                    )
+                    for url_pattern, resource_type in patterns
+                ]
+            )
+        )
+
+    async def _answer(self, session, devtools, event) -> None:
+        fetch = devtools.fetch
+        url = event.request.url
+        at_response = event.response_status_code is not None or event.response_error_reason is not None
+        action = self.rules.plan(url, event.resource_type.value, event.request.method, url in self.cache, at_response)
+        # An entry may still turn out stale or damaged on reading; the asset is then fetched again.
+        cached = self.cache.get(url) if action == FULFILL else None
+        if action == BLOCK:
+            self.blocked += 1
+            await session.execute(fetch.fail_request(event.request_id, devtools.network.ErrorReason.BLOCKED_BY_CLIENT))
+        elif action == FULFILL and cached is not None:
+            headers = [fetch.HeaderEntry(name, value) for name, value in cached.headers]
+            await session.execute(fetch.fulfill_request(event.request_id, cached.status, headers, body=cached.body))
+        elif action in (FULFILL, STORE) and not at_response:
+            await session.execute(fetch.continue_request(event.request_id, intercept_response=True))
+        elif action == STORE:
+            if event.response_status_code is not None:
+                body, encoded = await session.execute(fetch.get_response_body(event.request_id))
+                headers = [
+                    (header.name, header.value)
+                    for header in event.response_headers or []
+                    if header.name.lower() not in _TRANSFER_HEADERS
+                ]
+                self.cache.put(
+                    url, CachedResponse(event.response_status_code, headers, body if encoded else _b64(body))
+                )
+            await session.execute(fetch.continue_request(event.request_id))
+        else:
+            await session.execute(fetch.continue_request(event.request_id))
+
+
+def _b64(text: str) -> str:
+    """Return a text body base64 encoded, as ``Fetch.fulfillRequest`` expects it."""
+    return base64.b64encode(text.encode("utf-8")).decode("ascii")
@@ -0,0 +1,124 @@
+"""Parsers for the price, quantity and style texts shown by the coffee-cart app.
+
+Patterns are compiled once at import time and results are memoized per input text, as
+page objects parse the same few strings ("$10.00", "$19.00 x 2", "height: 30%") over
+and over. Money is returned as ``Decimal`` so sums of prices compare exactly; page
+objects that expose floats convert at the boundary with :func:`to_float`. The ``*_all``
+variants parse a list of texts in one pass.
+"""
+
+import re
+from decimal import Decimal
+from functools import lru_cache
+from typing import Iterable, List, NamedTuple
+
+__all__ = [
+    "UnitPrice",
+    "parse_cart_count",
+    "parse_height_percent",
+    "parse_height_percent_all",
+    "parse_money",
+    "parse_money_all",
+    "parse_quantity",
+    "parse_unit_price",
+    "parse_unit_price_all",
+    "to_float",
+]
+
+_MONEY_RE = re.compile(r"-?\d[\d,]*(?:\.\d+)?")
+_UNIT_PRICE_RE = re.compile(r"(-?\d[\d,]*(?:\.\d+)?)\s*x\s*(\d+)")
+_QUANTITY_RE = re.compile(r"x\s*(\d+)")
+_CART_COUNT_RE = re.compile(r"\((\d+)\)")
+_HEIGHT_RE = re.compile(r"height\s*:\s*(\d+(?:\.\d+)?)%")
+
+_CACHE_SIZE = 1024
+
+
+class UnitPrice(NamedTuple):
+    """Unit price and quantity of a cart row, e.g. "$19.00 x 2"."""
+
+    price: Decimal
+    quantity: int
+
+
+def _decimal(number: str) -> Decimal:
+    return Decimal(number.replace(",", ""))
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def parse_money(text: str) -> Decimal:
+    """Return the first amount in a text such as "$10.50", "Total: $1,234.00" or "€7".
+
+    Args:
+        text: Text containing an amount; currency signs and labels are ignored.
+
+    Returns:
+        Decimal: The amount.
+
+    Raises:
+        ValueError: If the text contains no amount.
+    """
+    match = _MONEY_RE.search(text)
+    if match is None:
+        raise ValueError(f"No amount in {text!r}")
+    return _decimal(match.group())
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def parse_unit_price(text: str) -> UnitPrice:
+    """Return the unit price and quantity of a text such as "$19.00 x 2".
+
+    Raises:
+        ValueError: If the text is not in the ``<price> x <quantity>`` form.
+    """
+    match = _UNIT_PRICE_RE.search(text)
+    if match is None:
+        raise ValueError(f"No unit price in {text!r}")
+    return UnitPrice(_decimal(match.group(1)), int(match.group(2)))
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def parse_quantity(text: str) -> int:
+    """Return the quantity of a text such as "$19.00 x 2" or "x 3".
+
+    Raises:
+        ValueError: If the text has no ``x <quantity>`` part.
+    """
+    match = _QUANTITY_RE.search(text)
+    if match is None:
+        raise ValueError(f"No quantity in {text!r}")
+    return int(match.group(1))
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def parse_cart_count(text: str) -> int:
+    """Return the count of a header text such as "cart (3)", or 0 if it shows none."""
+    match = _CART_COUNT_RE.search(text)
+    return int(match.group(1)) if match else 0
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def parse_height_percent(style: str) -> float:
+    """Return the percentage of a ``height: 30%`` declaration in a style text, or 0.0 if there is none."""
+    match = _HEIGHT_RE.search(style)
+    return float(match.group(1)) if match else 0.0
+
+
+def parse_money_all(texts: Iterable[str]) -> List[Decimal]:
+    """Return the amount of every text, see :func:`parse_money`."""
+    return list(map(parse_money, texts))
+
+
+def parse_unit_price_all(texts: Iterable[str]) -> List[UnitPrice]:
+    """Return the unit price and quantity of every text, see :func:`parse_unit_price`."""
+    return list(map(parse_unit_price, texts))
+
+
+def parse_height_percent_all(styles: Iterable[str]) -> List[float]:
+    """Return the height percentage of every style text, see :func:`parse_height_percent`."""
+    return list(map(parse_height_percent, styles))
+
+
+def to_float(amount: Decimal) -> float:
+    """Return an amount as float, for page-object methods that expose floats."""
+    return float(amount)
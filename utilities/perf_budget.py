@@ -0,0 +1,158 @@
+"""Performance budgets for page-object methods and tests.
+
+A budget limits the number of WebDriver commands and the wall time of one call of a
+page-object method (``@perf_budget``) or of one test (``@pytest.mark.perf_budget``).
+Budgets are kept in a checked-in baseline file; entries there take precedence over
+the values given in code and are rewritten from observed values when the run is
+started with ``--update-perf-budgets``. Page objects declare no values, so the
+baseline file is the single source of their budgets.
+
+Only calls that issue a fixed sequence of commands are budgeted: explicit waits poll
+until their condition holds, so the command count of a method that waits depends on
+timing. Command counts are enforced in ``PERF_BUDGET_MODE``; wall time depends on the
+machine and its load, so time budgets are enforced in ``PERF_BUDGET_TIME_MODE``, which
+warns by default.
+"""
+
+import functools
+import json
+import math
+import time
+import warnings
+from typing import Callable, Dict, Mapping, NamedTuple, Optional
+
+from config.resources import PERF_BUDGET_MODE, PERF_BUDGET_TIME_MODE, PERF_BUDGETS_FILE, ROOT_DIR
+from utilities.webdriver_metrics import get_command_counter
+
+__all__ = ["Budget", "PerfBudgetExceeded", "PerfBudgetWarning", "PerfBudgets", "perf_budget", "perf_budgets"]
+
+BUDGET_MODES = ("fail", "warn")
+
+
+class PerfBudgetExceeded(AssertionError):
+    """Raised when a call exceeds its performance budget in ``fail`` mode."""
+
+
+class PerfBudgetWarning(UserWarning):
+    """Issued when a call exceeds its performance budget in ``warn`` mode."""
+
+
+class Budget(NamedTuple):
+    """Limits for one budgeted call; None means the limit is not enforced."""
+
+    max_commands: Optional[int] = None
+    max_ms: Optional[float] = None
+
+
+class PerfBudgets:
+    """Baseline of budgets keyed by page-object method or test node id."""
+
+    time_headroom = 1.5
+
+    def __init__(
+        self, path: str = PERF_BUDGETS_FILE, mode: str = PERF_BUDGET_MODE, time_mode: str = PERF_BUDGET_TIME_MODE
+    ) -> None:
+        """Initialize the baseline.
+
+        Args:
+            path: JSON file with the checked-in budgets, relative to the project root.
+            mode: ``fail`` to raise on command count violations, ``warn`` to issue a warning.
+            time_mode: ``fail`` or ``warn``, the same for wall time violations.
+        """
+        self.path = ROOT_DIR / path
+        self.mode = mode
+        self.time_mode = time_mode
+        self.update = False
+        self.observed: Dict[str, Budget] = {}
+        self._baseline: Optional[Dict[str, Budget]] = None
+
+    @property
+    def baseline(self) -> Dict[str, Budget]:
+        """Return budgets loaded from the baseline file."""
+        if self._baseline is None:
+            data = json.loads(self.path.read_text(encoding="utf-8")) if self.path.exists() else {}
+            self._baseline = {key: Budget(**value) for key, value in data.items()}
+        return self._baseline
+
+    def check(self, key: str, commands: int, elapsed_ms: float, default: Budget = Budget()) -> None:
+        """Record one call and enforce its budget.
+
+        Args:
+            key: Budget key, the method qualified name or test node id.
+            commands: Number of WebDriver commands issued by the call.
+            elapsed_ms: Wall time of the call in milliseconds.
+            default: Budget declared in code, used when the baseline has no entry.
+        """
+        self.merge({key: Budget(commands, elapsed_ms)})
+        if self.update:
+            return
+
+        budget = self.baseline.get(key, default)
+        violations = {"fail": [], "warn": []}
+        if budget.max_commands is not None and commands > budget.max_commands:
+            violations[self.mode].append(f"{commands} WebDriver commands > {budget.max_commands}")
+        if budget.max_ms is not None and elapsed_ms > budget.max_ms:
+            violations[self.time_mode].append(f"{elapsed_ms:.0f} ms > {budget.max_ms:.0f} ms")
+
+        if violations["fail"]:
+            messages = violations["fail"] + violations["warn"]
+            raise PerfBudgetExceeded(f"Performance budget exceeded for {key}: {', '.join(messages)}")
+        if violations["warn"]:
+            message = f"Performance budget exceeded for {key}: {', '.join(violations['warn'])}"
+            warnings.warn(message, PerfBudgetWarning, stacklevel=3)
+
+    def merge(self, observed: Mapping[str, Budget]) -> None:
+        """Merge observed values, e.g. those of an xdist worker, keeping the maximum per key.
+
+        Args:
+            observed: Observed command counts and wall times by budget key.
+        """
+        for key, value in observed.items():
+            seen = self.observed.get(key, Budget(0, 0.0))
+            self.observed[key] = Budget(max(seen.max_commands, value[0]), max(seen.max_ms, value[1]))
+
+    def save(self) -> None:
+        """Merge observed values into the baseline file."""
+        budgets = dict(self.baseline)
+        for key, observed in self.observed.items():
+            budgets[key] = Budget(observed.max_commands, float(math.ceil(observed.max_ms * self.time_headroom)))
+        data = {key: budgets[key]._asdict() for key in sorted(budgets)}
+        self.path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+        self._baseline = budgets
+
+
+perf_budgets = PerfBudgets()
+
+
+def perf_budget(max_commands: Optional[int] = None, max_ms: Optional[float] = None, key: str = None) -> Callable:
+    """Enforce a performance budget on a page-object method.
+
+    The decorated method must belong to an object with a ``driver`` attribute and must
+    not wait explicitly. Page objects leave the limits to the baseline file.
+
+    Args:
+        max_commands: Maximum number of WebDriver commands per call, if the baseline has no entry.
+        max_ms: Maximum wall time per call in milliseconds, if the baseline has no entry.
+        key: Budget key, defaults to ``<module>.<qualified name>`` of the method.
+
+    Returns:
+        Callable: Decorator for the method.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        budget_key = key or f"{func.__module__}.{func.__qualname__}"
+        default = Budget(max_commands, max_ms)
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            counter = get_command_counter(self.driver)
+            commands_before = counter.total
+            start = time.perf_counter()
+            result = func(self, *args, **kwargs)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            perf_budgets.check(budget_key, counter.total - commands_before, elapsed_ms, default)
+            return result
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,119 @@
+"""Buffered Allure step recording for hot page-object helpers.
+
+Low-level helpers such as element lookups run hundreds of times per test. Wrapping
+them in ``allure.step`` creates, formats and serializes a step for every call. The
+:func:`step` decorator below keeps that behaviour in ``full`` mode, and in ``sampled``
+mode buffers the calls in memory, collapses repeated steps into counted aggregates
+and writes them once per test phase as a single attachment. ``off`` disables
+recording of these steps entirely.
+"""
+
+import functools
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List
+
+import allure
+from allure_commons.types import AttachmentType
+from allure_commons.utils import func_parameters, represent
+
+from config.resources import ALLURE_STEP_MODE, ALLURE_STEP_SAMPLE_RATE
+
+__all__ = ["STEP_MODES", "StepRecorder", "step", "step_recorder"]
+
+STEP_MODES = ("full", "sampled", "off")
+
+
+class _StepAggregate:
+    """Counted aggregate of all calls sharing one step title template."""
+
+    max_samples = 5
+
+    def __init__(self) -> None:
+        """Initialize an empty aggregate."""
+        self.count = 0
+        self.total_time = 0.0
+        self.samples: List[str] = []
+
+
+class StepRecorder:
+    """Collect low-level steps of the running test and write them as one attachment."""
+
+    def __init__(self, mode: str = ALLURE_STEP_MODE, sample_rate: int = ALLURE_STEP_SAMPLE_RATE) -> None:
+        """Initialize the recorder.
+
+        Args:
+            mode: One of ``full``, ``sampled`` or ``off``.
+            sample_rate: In ``sampled`` mode, keep the formatted title of every N-th call.
+        """
+        if mode not in STEP_MODES:
+            raise ValueError(f"Unknown Allure step mode '{mode}', expected one of {STEP_MODES}")
+        self.mode = mode
+        self.sample_rate = max(1, sample_rate)
+        self._aggregates: Dict[str, _StepAggregate] = OrderedDict()
+
+    def record(self, title: str, func: Callable, args: tuple, kwargs: dict, elapsed: float) -> None:
+        """Add one call of a buffered step to its aggregate.
+
+        The title is only formatted for sampled calls, so most calls cost a dict lookup.
+        """
+        aggregate = self._aggregates.get(title)
+        if aggregate is None:
+            aggregate = self._aggregates[title] = _StepAggregate()
+        if aggregate.count % self.sample_rate == 0 and len(aggregate.samples) < aggregate.max_samples:
+            params = func_parameters(func, *args, **kwargs)
+            aggregate.samples.append(title.format(*map(represent, args), **params))
+        aggregate.count += 1
+        aggregate.total_time += elapsed
+
+    def render(self) -> str:
+        """Return the buffered aggregates as a plain-text report."""
+        lines = []
+        for title, aggregate in self._aggregates.items():
+            lines.append(f"{aggregate.count} x {title} ({aggregate.total_time * 1000:.1f} ms)")
+            lines.extend(f"    e.g. {sample}" for sample in aggregate.samples)
+        return "\n".join(lines)
+
+    def reset(self) -> None:
+        """Drop all buffered steps."""
+        self._aggregates.clear()
+
+    def flush(self, name: str = "Low-level steps") -> None:
+        """Write buffered steps to the current Allure test as one attachment and reset the buffer."""
+        if not self._aggregates:
+            return
+        allure.attach(self.render(), name=name, attachment_type=AttachmentType.TEXT)
+        self.reset()
+
+
+step_recorder = StepRecorder()
+
+
+def step(title: str) -> Callable:
+    """Decorate a hot helper with an Allure step that honours the configured step mode.
+
+    Args:
+        title: Step title template, formatted like ``allure.step`` titles.
+
+    Returns:
+        Callable: Decorator for the helper.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        allure_step = allure.step(title)(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if step_recorder.mode == "full":
+                return allure_step(*args, **kwargs)
+            if step_recorder.mode == "off":
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                step_recorder.record(title, func, args, kwargs, time.perf_counter() - start)
+
+        return wrapper
+
+    return decorator
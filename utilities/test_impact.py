@@ -0,0 +1,125 @@
+"""Test impact analysis: which tests exercise which page-object code.
+
+While a test runs (setup, call and teardown), :class:`ImpactTracer` installs a
+``sys.setprofile`` hook that records every function called from the traced
+packages as ``<module path>::<qualified name>``. The resulting map from test node id
+to page-object methods is kept between runs in the pytest cache, and
+:func:`impacted_tests` uses it to pick the tests affected by a set of changed files.
+"""
+
+import subprocess
+import sys
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from config.resources import ROOT_DIR
+
+__all__ = ["ImpactTracer", "changed_files", "impacted_tests"]
+
+TRACED_PACKAGES = ("pages",)
+# Changed files matching these patterns cannot affect a test run
+HARMLESS_CHANGES = ("*.md", "*.rst", "docs/*", "LICENSE*", ".gitignore")
+
+
+class ImpactTracer:
+    """Collect the page-object functions called while tracing is active."""
+
+    def __init__(self, root: Path = ROOT_DIR, packages: Iterable[str] = TRACED_PACKAGES) -> None:
+        """Initialize the tracer.
+
+        Args:
+            root: Project root; recorded module paths are relative to it.
+            packages: Top-level packages whose functions are recorded.
+        """
+        self.root = root
+        self._prefixes = tuple(str(root / package) + "/" for package in packages)
+        self._calls: Set[tuple] = set()
+        self._previous = None
+
+    def start(self) -> bool:
+        """Install the profile hook.
+
+        Returns:
+            bool: False if another profiler is active and tracing was skipped.
+        """
+        self._calls = set()
+        self._previous = sys.getprofile()
+        if self._previous is not None:
+            return False
+        sys.setprofile(self._profile)
+        return True
+
+    def stop(self) -> List[str]:
+        """Remove the profile hook and return the recorded functions, sorted."""
+        if self._previous is None:
+            sys.setprofile(None)
+        root = str(self.root) + "/"
+        return sorted(f"{filename[len(root):]}::{qualname}" for filename, qualname in self._calls)
+
+    def _profile(self, frame, event, arg) -> None:
+        if event == "call":
+            code = frame.f_code
+            if code.co_filename.startswith(self._prefixes):
+                self._calls.add((code.co_filename, getattr(code, "co_qualname", code.co_name)))
+
+
+def changed_files(base: str = "HEAD", root: Path = ROOT_DIR) -> List[str]:
+    """Return files changed against a git revision, including uncommitted and untracked files.
+
+    Args:
+        base: Revision to compare the working tree with.
+        root: Repository root.
+
+    Returns:
+        list: Paths relative to the repository root.
+    """
+    commands = [["git", "diff", "--name-only", base], ["git", "ls-files", "--others", "--exclude-standard"]]
+    files: Set[str] = set()
+    for command in commands:
+        result = subprocess.run(command, cwd=root, capture_output=True, text=True, check=True)
+        files.update(line.strip() for line in result.stdout.splitlines() if line.strip())
+    return sorted(files)
+
+
+def impacted_tests(
+    node_ids: Iterable[str], impact_map: Dict[str, List[str]], changed: Iterable[str]
+) -> Optional[Set[str]]:
+    """Return the tests affected by changed files.
+
+    A test is affected when it called code of a changed page-object module, when its
+    own file changed, or when it has no entry in the map yet. Changes to any other
+    file (fixtures, utilities, configuration, test data such as the CSV files read by
+    tests) may affect any test; only documentation (``HARMLESS_CHANGES``) is ignored.
+
+    Args:
+        node_ids: Node ids of the collected tests.
+        impact_map: Page-object functions called by each test, as stored by earlier runs.
+        changed: Changed file paths relative to the project root.
+
+    Returns:
+        set: Affected node ids, or None if every test has to run.
+    """
+    changed_modules = set()
+    changed_tests = set()
+    for path in changed:
+        path = Path(path).as_posix()
+        if any(fnmatch(path, pattern) for pattern in HARMLESS_CHANGES):
+            continue
+        if not path.endswith(".py"):
+            return None
+        if path.startswith(tuple(package + "/" for package in TRACED_PACKAGES)):
+            changed_modules.add(path)
+        elif path.startswith("tests/") and Path(path).name.startswith("test_"):
+            changed_tests.add(path)
+        else:
+            return None
+
+    selected = set()
+    for node_id in node_ids:
+        calls = impact_map.get(node_id)
+        if calls is None or node_id.split("::", 1)[0] in changed_tests:
+            selected.add(node_id)
+        elif any(call.split("::", 1)[0] in changed_modules for call in calls):
+            selected.add(node_id)
+    return selected
@@ -0,0 +1,83 @@
+"""Longest-processing-time-first assignment of tests to parallel workers.
+
+Tests are placed one by one, longest first, on the least loaded worker. A test is
+placed on a worker that already runs tests with the same fixture set instead, as
+long as that worker is at most half the test's duration above the least loaded one,
+so tests sharing page fixtures such as ``driver_menu_page`` stay together.
+"""
+
+import re
+import statistics
+from typing import Dict, Hashable, List, NamedTuple
+
+__all__ = ["ScheduledTest", "assign_lpt", "base_node_id", "estimate_durations"]
+
+AFFINITY_SLACK = 0.5
+DEFAULT_DURATION = 1.0
+
+
+def base_node_id(node_id: str) -> str:
+    """Return a node id without the ``@group`` suffix pytest-xdist adds under ``--dist loadgroup``."""
+    return re.sub(r"@[^\[\]]*$", "", node_id)
+
+
+class ScheduledTest(NamedTuple):
+    """A test to schedule: node id, expected duration in seconds and fixture affinity key."""
+
+    node_id: str
+    duration: float
+    affinity: Hashable = ()
+
+
+def estimate_durations(node_ids: List[str], recorded: Dict[str, float]) -> Dict[str, float]:
+    """Return the expected duration of each test.
+
+    Tests without a recorded duration are expected to take the median of the
+    recorded ones.
+
+    Args:
+        node_ids: Tests to estimate.
+        recorded: Durations in seconds measured by earlier runs.
+
+    Returns:
+        dict: Expected duration in seconds by node id.
+    """
+    known = [recorded[node_id] for node_id in node_ids if node_id in recorded]
+    default = statistics.median(known) if known else DEFAULT_DURATION
+    return {node_id: recorded.get(node_id, default) for node_id in node_ids}
+
+
+def assign_lpt(tests: List[ScheduledTest], workers: int) -> List[List[str]]:
+    """Distribute tests over workers, longest first.
+
+    Args:
+        tests: Tests with their expected durations and affinity keys.
+        workers: Number of workers.
+
+    Returns:
+        list: Node ids per worker, grouped by affinity key and longest first within a group.
+    """
+    loads = [0.0] * workers
+    assigned: List[List[ScheduledTest]] = [[] for _ in range(workers)]
+    affinities: List[set] = [set() for _ in range(workers)]
+
+    for test in sorted(tests, key=lambda t: (-t.duration, t.node_id)):
+        lightest = min(range(workers), key=lambda w: (loads[w], w))
+        target = lightest
+        if test.affinity:
+            limit = loads[lightest] + AFFINITY_SLACK * test.duration
+            candidates = [w for w in range(workers) if test.affinity in affinities[w] and loads[w] <= limit]
+            if candidates:
+                target = min(candidates, key=lambda w: (loads[w], w))
+        loads[target] += test.duration
+        assigned[target].append(test)
+        affinities[target].add(test.affinity)
+
+    schedule = []
+    for worker_tests in assigned:
+        first_seen = {}
+        for position, test in enumerate(worker_tests):
+            first_seen.setdefault(test.affinity, position)
+        worker_tests.sort(key=lambda t: first_seen[t.affinity])
+        schedule.append([test.node_id for test in worker_tests])
+    return schedule
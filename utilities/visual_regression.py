@@ -0,0 +1,232 @@
+"""Visual regression checks of rendered elements against stored baseline images.
+
+Images are NumPy arrays (height x width x RGB) and every comparison is vectorized
+over all pixels: a pixel differs when one of its channels is off by more than
+``channel_tolerance`` *and* its perceptual (YIQ) color distance exceeds
+``perceptual_threshold``, so anti-aliasing noise passes while a wrong ingredient
+color does not. An image matches when at most ``max_mismatch_ratio`` of its pixels
+differ. On a mismatch a heatmap of the differences is attached to the Allure report.
+
+Baselines are PNG files in ``VISUAL_BASELINES_DIR``, committed with the tests.
+``--update-visual-baselines`` writes them from the captures of the run; without it
+a missing baseline is reported, never silently created, so a check cannot pass
+without comparing anything.
+"""
+
+import io
+import re
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+import allure
+import numpy as np
+from allure_commons.types import AttachmentType
+from PIL import Image
+
+from config.resources import ROOT_DIR, VISUAL_BASELINES_DIR
+from utilities.logger import Logger
+
+__all__ = [
+    "ImageDiff",
+    "MissingBaseline",
+    "VisualBaselines",
+    "VisualMismatch",
+    "compare_images",
+    "crop",
+    "heatmap",
+    "load_png",
+    "to_png",
+]
+
+# Weights of the squared YIQ channel differences, and the largest possible distance.
+_YIQ = np.array(
+    [
+        [0.29889531, 0.58662247, 0.11448223],
+        [0.59597799, -0.27417610, -0.32180189],
+        [0.21147017, -0.52261711, 0.31114694],
+    ]
+)
+_YIQ_WEIGHTS = np.array([0.5053, 0.299, 0.1957])
+_MAX_DISTANCE = 35215.0
+
+
+class VisualMismatch(AssertionError):
+    """Raised when a capture differs from its baseline beyond the tolerances."""
+
+
+class MissingBaseline(Exception):
+    """Raised when a capture has no baseline to be compared with."""
+
+
+class ImageDiff(NamedTuple):
+    """Result of comparing a capture with its baseline."""
+
+    mismatch_ratio: float
+    max_distance: float
+    distance: np.ndarray
+
+    @property
+    def mismatched_pixels(self) -> int:
+        """Return the number of differing pixels."""
+        return int(np.count_nonzero(self.distance))
+
+
+def load_png(data: bytes) -> np.ndarray:
+    """Return PNG data as an RGB array."""
+    return np.asarray(Image.open(io.BytesIO(data)).convert("RGB"))
+
+
+def to_png(image: np.ndarray) -> bytes:
+    """Return an RGB array as PNG data."""
+    buffer = io.BytesIO()
+    Image.fromarray(image).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def crop(image: np.ndarray, rects: List[dict], scale: float = 1.0) -> List[np.ndarray]:
+    """Cut regions out of an image.
+
+    Args:
+        image: Capture the rects are relative to.
+        rects: Regions in CSS pixels, with ``x``, ``y``, ``width`` and ``height``.
+        scale: Device pixel ratio of the capture.
+
+    Returns:
+        list: One array per rect, clipped to the image.
+    """
+    regions = []
+    for rect in rects:
+        top, left = round(rect["y"] * scale), round(rect["x"] * scale)
+        bottom, right = top + round(rect["height"] * scale), left + round(rect["width"] * scale)
+        regions.append(image[max(top, 0) : bottom, max(left, 0) : right])
+    return regions
+
+
+def compare_images(
+    actual: np.ndarray, expected: np.ndarray, channel_tolerance: int = 16, perceptual_threshold: float = 0.05
+) -> ImageDiff:
+    """Compare two images pixel by pixel.
+
+    Args:
+        actual: Captured image.
+        expected: Baseline image.
+        channel_tolerance: Largest per-channel difference (0-255) a pixel may have and still match.
+        perceptual_threshold: Largest YIQ color distance, relative to black against white, a pixel may have.
+
+    Returns:
+        ImageDiff: Share of differing pixels and the distance of every pixel, 0 where it matches.
+    """
+    if actual.shape != expected.shape:
+        shape = (max(actual.shape[0], expected.shape[0]), max(actual.shape[1], expected.shape[1]))
+        return ImageDiff(1.0, 1.0, np.ones(shape, dtype=np.float32))
+    delta = actual.astype(np.int16) - expected.astype(np.int16)
+    over_tolerance = np.abs(delta).max(axis=2) > channel_tolerance
+    distance = (((delta.astype(np.float32) @ _YIQ.T) ** 2) @ _YIQ_WEIGHTS / _MAX_DISTANCE).astype(np.float32)
+    distance[~(over_tolerance & (distance > perceptual_threshold))] = 0
+    return ImageDiff(float(np.count_nonzero(distance)) / distance.size, float(distance.max(initial=0)), distance)
+
+
+def heatmap(actual: np.ndarray, diff: ImageDiff) -> np.ndarray:
+    """Return the capture faded to gray with the differing pixels in red, brighter the larger the difference."""
+    if actual.shape[:2] != diff.distance.shape:
+        return np.full((*diff.distance.shape, 3), (255, 0, 0), dtype=np.uint8)
+    gray = np.repeat((actual.mean(axis=2) * 0.3 + 178)[..., None], 3, axis=2)
+    intensity = np.clip(diff.distance / max(diff.max_distance, 1e-6), 0, 1)[..., None]
+    red = np.array([255.0, 0.0, 0.0])
+    blended = red * (0.5 + 0.5 * intensity) + gray * (0.5 - 0.5 * intensity)
+    return np.where(intensity > 0, blended, gray).astype(np.uint8)
+
+
+class VisualBaselines:
+    """Baseline images in a directory, checked against captures by name."""
+
+    channel_tolerance = 16
+    perceptual_threshold = 0.05
+    max_mismatch_ratio = 0.001
+
+    def __init__(
+        self,
+        directory: str = VISUAL_BASELINES_DIR,
+        update: bool = False,
+        on_missing: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        """Initialize the baselines.
+
+        Args:
+            directory: Directory of the baseline PNG files, relative to the project root.
+            update: Write baselines from the captures instead of checking them.
+            on_missing: Called with a message when captures have no baseline, e.g. ``pytest.skip``;
+                by default :class:`MissingBaseline` is raised.
+        """
+        self.directory = ROOT_DIR / directory
+        self.update = update
+        self.on_missing = on_missing
+        self.written: List[str] = []
+        self.logger = Logger.get_logger(self.__class__.__name__)
+
+    def path(self, name: str) -> Path:
+        """Return the baseline file of a capture name."""
+        return self.directory / f"{re.sub(r'[^A-Za-z0-9_.-]+', '_', name)}.png"
+
+    def check(self, name: str, image: np.ndarray) -> ImageDiff:
+        """Compare a capture with its baseline.
+
+        Args:
+            name: Baseline name, e.g. ``menu/Espresso``.
+            image: Captured image.
+
+        Returns:
+            ImageDiff: The comparison; an empty one when the baseline was written.
+
+        Raises:
+            VisualMismatch: If the capture differs beyond the tolerances.
+            MissingBaseline: If there is no baseline and baselines are not being updated.
+        """
+        path = self.path(name)
+        if not self.update and not path.exists():
+            raise MissingBaseline(name)
+        if self.update:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(to_png(image))
+            self.written.append(name)
+            self.logger.info("Visual baseline written: %s", path.name)
+            return ImageDiff(0.0, 0.0, np.zeros(image.shape[:2], dtype=np.float32))
+
+        diff = compare_images(image, load_png(path.read_bytes()), self.channel_tolerance, self.perceptual_threshold)
+        if diff.mismatch_ratio > self.max_mismatch_ratio:
+            allure.attach(to_png(heatmap(image, diff)), name=f"{name} diff", attachment_type=AttachmentType.PNG)
+            allure.attach(to_png(image), name=f"{name} actual", attachment_type=AttachmentType.PNG)
+            raise VisualMismatch(
+                f"{name}: {diff.mismatch_ratio:.2%} of pixels differ from the baseline "
+                f"({diff.mismatched_pixels} pixels, max distance {diff.max_distance:.2f})"
+            )
+        return diff
+
+    def check_all(self, images: Dict[str, np.ndarray]) -> Dict[str, ImageDiff]:
+        """Compare several captures and report all mismatches at once.
+
+        Missing baselines are reported after the mismatches, through ``on_missing`` if given.
+
+        Raises:
+            VisualMismatch: Listing every capture that differs beyond the tolerances.
+            MissingBaseline: Listing the captures without a baseline.
+        """
+        results, failures, missing = {}, [], []
+        for name, image in images.items():
+            try:
+                results[name] = self.check(name, image)
+            except VisualMismatch as error:
+                failures.append(str(error))
+            except MissingBaseline:
+                missing.append(name)
+        if failures:
+            raise VisualMismatch("\n".join(failures))
+        if missing:
+            message = (
+                f"No visual baseline for {', '.join(missing)} in {self.directory}; "
+                "run with --update-visual-baselines to write them"
+            )
+            if self.on_missing is not None:
+                self.on_missing(message)
+            raise MissingBaseline(message)
+        return results
@@ -0,0 +1,181 @@
+"""Wait telemetry and adaptive timeouts for named explicit waits.
+
+Every explicit wait of the page objects has a name and a fixed timeout, which it
+always runs with. The time each wait takes to succeed is recorded, and in
+``adaptive`` mode a wait with enough samples has an expected time derived from them:
+the 95th percentile times a headroom factor, never more than the timeout. A wait
+that succeeds only after its expected time is counted as *late*, and one that times
+out as *timed out*, which points to a flaky or slowing page. Waits passed
+``may_miss=True`` belong to lookups that turn a timeout into a result (``None`` or
+``False``); their timeouts are expected and not counted. The page objects' negative
+checks use ``BasePage.is_absent``.
+
+A driver with a ``wait_clock`` attribute (``monotonic`` and ``sleep``) has its waits
+timed by that clock instead of the ``time`` module, which is how record and replay
+mode control polling without affecting any other driver, see
+``utilities.driver_recording``.
+"""
+
+import math
+import time
+from typing import Any, Callable, Dict, List
+
+from selenium.common import TimeoutException
+from selenium.webdriver.support.wait import POLL_FREQUENCY, WebDriverWait
+
+from config.resources import WAIT_TIMEOUT_MODE
+from utilities.logger import Logger
+
+__all__ = ["WAIT_TIMEOUT_MODES", "WaitTelemetry", "wait_telemetry"]
+
+WAIT_TIMEOUT_MODES = ("fixed", "adaptive")
+
+
+class _ClockedWait(WebDriverWait):
+    """``WebDriverWait`` reading the time from a clock object instead of the ``time`` module."""
+
+    def __init__(self, driver, timeout: float, clock, poll_frequency: float = POLL_FREQUENCY) -> None:
+        super().__init__(driver, timeout, poll_frequency=poll_frequency)
+        self._clock = clock
+
+    def until(self, method: Callable, message: str = "") -> Any:
+        """Wait like ``WebDriverWait.until``, timed by the clock."""
+        screen = stacktrace = None
+        end_time = self._clock.monotonic() + self._timeout
+        while True:
+            try:
+                value = method(self._driver)
+                if value:
+                    return value
+            except self._ignored_exceptions as exc:
+                screen = getattr(exc, "screen", None)
+                stacktrace = getattr(exc, "stacktrace", None)
+            if self._clock.monotonic() > end_time:
+                break
+            self._clock.sleep(self._poll)
+        raise TimeoutException(message, screen, stacktrace)
+
+
+def _wait_for(target, timeout: float, poll_frequency: float = POLL_FREQUENCY) -> WebDriverWait:
+    """Return a wait on a driver or element, timed by the driver's ``wait_clock`` if it has one."""
+    driver = getattr(target, "parent", target)
+    clock = getattr(driver, "wait_clock", None)
+    if clock is None:
+        return WebDriverWait(target, timeout, poll_frequency=poll_frequency)
+    return _ClockedWait(target, timeout, clock, poll_frequency=poll_frequency)
+
+
+def _percentile(samples: List[float], fraction: float) -> float:
+    """Return the nearest-rank percentile of the samples."""
+    ordered = sorted(samples)
+    return ordered[max(math.ceil(fraction * len(ordered)) - 1, 0)]
+
+
+class WaitTelemetry:
+    """Success times of named waits and the expected times derived from them."""
+
+    percentile = 0.95
+    headroom = 2.0
+    min_samples = 5
+    max_samples = 50
+    min_expected = 0.1
+
+    def __init__(self, mode: str = WAIT_TIMEOUT_MODE) -> None:
+        """Initialize the telemetry.
+
+        Args:
+            mode: ``adaptive`` to report waits slower than their recorded samples, ``fixed`` to report only timeouts.
+        """
+        self.mode = mode
+        self.recording = True
+        self.samples: Dict[str, List[float]] = {}
+        self.observed: Dict[str, List[float]] = {}
+        self.late: Dict[str, int] = {}
+        self.timed_out: Dict[str, int] = {}
+        self.logger = Logger.get_logger(self.__class__.__name__)
+
+    def load(self, samples: Dict[str, List[float]]) -> None:
+        """Use success times stored by earlier runs."""
+        self.samples = {name: list(values)[-self.max_samples :] for name, values in samples.items()}
+
+    def merge(self, data: Dict[str, Dict[str, Any]]) -> None:
+        """Merge telemetry collected by another process, as returned by :meth:`export`."""
+        for name, values in data.get("observed", {}).items():
+            self.observed.setdefault(name, []).extend(values)
+        for counts, into in ((data.get("late", {}), self.late), (data.get("timed_out", {}), self.timed_out)):
+            for name, count in counts.items():
+                into[name] = into.get(name, 0) + count
+
+    def export(self) -> Dict[str, Dict[str, Any]]:
+        """Return the telemetry collected by this process."""
+        return {"observed": self.observed, "late": self.late, "timed_out": self.timed_out}
+
+    def stored(self) -> Dict[str, List[float]]:
+        """Return the stored samples with this run's success times appended, newest last."""
+        samples = dict(self.samples)
+        for name, values in self.observed.items():
+            samples[name] = (samples.get(name, []) + values)[-self.max_samples :]
+        return samples
+
+    def late_after(self, name: str, default: float) -> float:
+        """Return the time after which a successful wait counts as late.
+
+        Args:
+            name: Wait name.
+            default: Fixed timeout of the wait in seconds.
+
+        Returns:
+            float: Expected time of the wait, or the timeout without enough samples or in ``fixed`` mode.
+        """
+        samples = self.samples.get(name, [])
+        if self.mode != "adaptive" or len(samples) < self.min_samples:
+            return default
+        return min(default, max(self.min_expected, _percentile(samples, self.percentile) * self.headroom))
+
+    def wait(self, target, name: str, condition: Callable, timeout: float, may_miss: bool = False) -> Any:
+        """Wait for a condition up to its fixed timeout and record how long it took.
+
+        Args:
+            target: Driver or element passed to the condition.
+            name: Wait name the telemetry is kept under.
+            condition: Expected condition, as for ``WebDriverWait.until``.
+            timeout: Fixed timeout of the wait in seconds.
+            may_miss: The caller turns a timeout into a result, so it is not counted as timed out.
+
+        Returns:
+            Any: The truthy value returned by the condition.
+
+        Raises:
+            TimeoutException: If the condition is not met in time.
+        """
+        start = time.monotonic()
+        try:
+            result = _wait_for(target, timeout).until(condition)
+        except TimeoutException:
+            if not may_miss:
+                self._count(self.timed_out, name)
+            raise
+        elapsed = time.monotonic() - start
+        expected = self.late_after(name, timeout)
+        if elapsed > expected:
+            self._count(self.late, name)
+            self.logger.warning("Wait '%s' took %.2f s, over its expected %.2f s", name, elapsed, expected)
+        if self.recording:
+            self.observed.setdefault(name, []).append(round(elapsed, 3))
+        return result
+
+    def summary(self) -> List[str]:
+        """Return report lines for the waits that ran late or timed out in this run."""
+        lines = []
+        for name in sorted(set(self.late) | set(self.timed_out)):
+            samples = self.samples.get(name) or self.observed.get(name) or []
+            p95 = f"{_percentile(samples, self.percentile):.2f} s" if samples else "n/a"
+            lines.append(f"{name}: {self.late.get(name, 0)} late, {self.timed_out.get(name, 0)} timed out, p95 {p95}")
+        return lines
+
+    def _count(self, counts: Dict[str, int], name: str) -> None:
+        if self.recording:
+            counts[name] = counts.get(name, 0) + 1
+
+
+wait_telemetry = WaitTelemetry()
@@ -0,0 +1,118 @@
+"""Browser-side Web Vitals and Navigation Timing of the coffee-cart app, per test.
+
+After each navigation (a page object is ``opened``) and after key interactions, the
+performance metrics of the page are read with one script call and appended as a
+JSON line to ``WEB_VITALS_FILE``, together with the test id and the event that
+triggered the reading. The file is a time series across runs, so frontend
+regressions of the app show up as trends of a test's FCP, LCP, CLS, INP or long
+tasks. Navigation Timing is written only with the first reading of a document.
+Collection is off while ``WEB_VITALS_FILE`` is empty and costs no WebDriver command.
+"""
+
+import functools
+import json
+import os
+import time
+import weakref
+from typing import Any, Callable, Dict, Optional
+
+from selenium.common import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from config.resources import ROOT_DIR, WEB_VITALS_FILE
+from pages.scripts import COLLECT_WEB_VITALS
+from utilities.logger import Logger
+
+__all__ = ["WebVitalsCollector", "collect_web_vitals", "web_vitals"]
+
+
+class WebVitalsCollector:
+    """Reads the performance metrics of the page and appends them to a JSON-lines file."""
+
+    def __init__(self, path: str = WEB_VITALS_FILE) -> None:
+        """Initialize the collector.
+
+        Args:
+            path: JSON-lines file relative to the project root; empty to disable collection.
+        """
+        self.path = path
+        self.records = 0
+        self._time_origins: "weakref.WeakKeyDictionary[WebDriver, float]" = weakref.WeakKeyDictionary()
+        self.logger = Logger.get_logger(self.__class__.__name__)
+
+    @property
+    def enabled(self) -> bool:
+        """Return whether metrics are collected."""
+        return bool(self.path)
+
+    def record(self, driver: WebDriver, event: str) -> Optional[Dict[str, Any]]:
+        """Read the metrics of the current page and append them to the file.
+
+        Errors are logged and swallowed, a missing metric never fails a test.
+
+        Args:
+            driver: Selenium WebDriver instance.
+            event: What happened before the reading, e.g. ``MenuPage opened``.
+
+        Returns:
+            dict: The written record, or None if collection is disabled or failed.
+        """
+        if not self.enabled:
+            return None
+        try:
+            metrics = driver.execute_script(COLLECT_WEB_VITALS)
+        except WebDriverException as error:
+            self.logger.debug("Web vitals not collected after '%s': %s", event, error.msg)
+            return None
+        if not isinstance(metrics, dict):
+            self.logger.debug("Web vitals not collected after '%s': the page returned %r", event, metrics)
+            return None
+        time_origin = metrics.pop("timeOrigin", None)
+        if self._time_origins.get(driver) == time_origin:
+            metrics.pop("navigation", None)
+        self._time_origins[driver] = time_origin
+        record = {
+            "ts": round(time.time(), 3),
+            "test_id": os.environ.get("PYTEST_CURRENT_TEST", "").rsplit(" (", 1)[0],
+            "event": event,
+            **metrics,
+        }
+        self._append(record)
+        return record
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        path = ROOT_DIR / self.path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # One write per line in append mode, so lines of parallel workers do not interleave.
+        with path.open("a", encoding="utf-8") as file:
+            file.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self.records += 1
+
+
+web_vitals = WebVitalsCollector()
+
+
+def collect_web_vitals(event: Optional[str] = None) -> Callable:
+    """Record the Web Vitals of the page after a page-object method returns.
+
+    The decorated method must belong to an object with a ``driver`` attribute.
+
+    Args:
+        event: Event name, defaults to ``<class>.<method>`` of the method.
+
+    Returns:
+        Callable: Decorator for the method.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        name = event or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            result = func(self, *args, **kwargs)
+            web_vitals.record(self.driver, name)
+            return result
+
+        return wrapper
+
+    return decorator
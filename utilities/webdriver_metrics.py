@@ -0,0 +1,47 @@
+"""WebDriver command accounting.
+
+Every WebDriver command, including the ones issued through ``WebElement`` methods and
+``WebDriverWait`` polling, goes through ``WebDriver.execute``. Wrapping that method on
+the driver instance gives an exact count of browser round trips.
+"""
+
+from collections import Counter
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+__all__ = ["CommandCounter", "get_command_counter"]
+
+
+class CommandCounter:
+    """Count WebDriver commands issued through a driver instance."""
+
+    def __init__(self, driver: WebDriver) -> None:
+        """Install the counter on the driver.
+
+        Args:
+            driver: WebDriver instance to count commands for.
+        """
+        self.total = 0
+        self.by_command: Counter = Counter()
+        execute = driver.execute
+
+        def counting_execute(driver_command, params=None):
+            self.total += 1
+            self.by_command[driver_command] += 1
+            return execute(driver_command, params)
+
+        driver.execute = counting_execute
+        driver.command_counter = self
+
+    def reset(self) -> None:
+        """Reset all counts to zero."""
+        self.total = 0
+        self.by_command.clear()
+
+
+def get_command_counter(driver: WebDriver) -> CommandCounter:
+    """Return the command counter of a driver, installing one on first use."""
+    counter = getattr(driver, "command_counter", None)
+    if counter is None:
+        counter = CommandCounter(driver)
+    return counter